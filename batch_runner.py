@@ -0,0 +1,249 @@
+# batch_runner.py - Headless batch simulation runner
+"""
+Runs seeded games without the UI and streams one summary line per finished run.
+
+Usage:
+    python -m batch_runner --runs 10000 --days 1095 --out results.jsonl
+"""
+import argparse
+import functools
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import config
+from game_core import Corporation
+from event_system import EmailSystem
+from rng import derive_seed
+
+
+# --- DECISION POLICIES ---
+# A policy receives the email system and a decision (an inbox email, or a popup/earnings
+# question converted to the same shape) and returns the index of the option to pick.
+# Policies must be module-level functions so they can be sent to worker processes.
+
+def safe_policy(email_system, decision):
+    """Pick the conservative option (same rule employees use to auto-clear email)."""
+    return email_system.get_safe_option_index(decision)
+
+
+def first_option_policy(email_system, decision):
+    """Always pick the first option."""
+    return 0 if decision.get('options') else None
+
+
+def random_policy(email_system, decision):
+    """Pick any option at random (from the game's own "policy" substream, so runs stay reproducible)."""
+    options = decision.get('options', [])
+    return email_system.corp.rng.stream("policy").randrange(len(options)) if options else None
+
+
+def _standing(corp) -> float:
+    """How far the company is from a board or health game over, with a little weight on morale."""
+    return min(corp.ceo_health, corp.board_confidence) + 0.25 * corp.employee_morale
+
+
+def careful_policy(email_system, decision):
+    """
+    Try every option on a fork of the game and pick the one that leaves the CEO
+    and board furthest from a game over. Every fork is reseeded alike, so options
+    are compared on the same luck without peeking at the game's own draws.
+    Earnings call questions fall back to the safe option.
+    """
+    options = decision.get('options', [])
+    if len(options) < 2:
+        return safe_policy(email_system, decision)
+    if 'event_id' in decision:
+        event_id = decision['event_id']
+        apply = lambda forked, i: forked.resolve_popup_choice(event_id, i)
+    else:
+        email_index = next((i for i, email in enumerate(email_system.inbox) if email is decision), None)
+        if email_index is None:
+            return safe_policy(email_system, decision)
+        apply = lambda forked, i: forked.apply_action(email_index, i)
+
+    corp = email_system.corp
+    seed = derive_seed(corp.rng.seed, f"careful:{corp.day}")
+    standings = []
+    for i in range(len(options)):
+        fork = corp.fork(seed)
+        apply(fork.email_system, i)
+        standings.append(_standing(fork))
+    return max(range(len(options)), key=standings.__getitem__)
+
+
+POLICIES = {
+    "safe": safe_policy,
+    "first": first_option_policy,
+    "random": random_policy,
+    "careful": careful_policy,
+}
+
+
+# --- HEADLESS GAME DRIVER ---
+def new_game(corp_name="Headless Corp", ceo_name="Autopilot", seed=None):
+    """Build a Corporation / EmailSystem pair the same way the UI does."""
+    corp = Corporation(seed=seed)
+    corp.email_system = EmailSystem(corp)
+    corp.set_identity(corp_name, ceo_name, corp.email_system)
+    return corp
+
+
+def _choose(policy, email_system, decision):
+    """Run the policy and clamp its answer to a valid option index."""
+    options = decision.get('options', [])
+    if not options:
+        return None
+    idx = policy(email_system, decision)
+    if idx is None or not 0 <= idx < len(options):
+        return 0
+    return idx
+
+
+def resolve_inbox(corp, policy):
+    """Answer every email currently in the inbox."""
+    email_system = corp.email_system
+    while email_system.inbox:
+        idx = _choose(policy, email_system, email_system.inbox[0])
+        if idx is None:
+            email_system.inbox.pop(0)  # Informational email, nothing to decide
+        else:
+            email_system.apply_action(0, idx)
+
+
+def resolve_popup(corp, event_id, policy):
+    """Resolve a mandatory/random popup event the way the crisis dialog does."""
+    email_system = corp.email_system
+    event_data = email_system.POPUP_EVENTS.get(event_id)
+    if not event_data:
+        return
+    decision = {
+        'title': event_data.get('title', ''),
+        'event_id': event_id,
+        'options': [{'text': text, 'risk': risk} for text, _action, risk in event_data.get('choices', [])],
+    }
+    # A popup without choices is just dismissed (idx None), same as the UI
+    email_system.resolve_popup_choice(event_id, _choose(policy, email_system, decision))
+
+
+def run_earnings_call(corp, policy):
+    """Answer three analyst questions and let Wall Street react."""
+    score = 0
+    for question in corp.rng.events.sample(config.EARNINGS_QUESTIONS, 3):
+        decision = {
+            'title': question['q'],
+            'options': [{'text': text, 'impact_type': impact} for text, impact in question['options']],
+        }
+        idx = _choose(policy, corp.email_system, decision)
+        score += corp.score_earnings_answer(question['options'][idx][1])
+    corp.process_earnings_call(score)
+
+
+def play_day(corp, policy=safe_policy):
+    """
+    Advance one day and answer whatever it brings with policy. Returns the
+    game's outcome ("GameOver_..."/"Victory_...") if it ended, else None.
+    """
+    trigger = corp.update_day()
+    corp.check_unionization_threat()
+
+    if trigger == "EmergencyBorrowing":
+        success, _amount = corp.emergency_borrow()
+        if not success:
+            return "GameOver_Debt"
+    elif trigger.startswith("GameOver") or trigger.startswith("Victory"):
+        return trigger
+    elif trigger == "Earnings_Call":
+        run_earnings_call(corp, policy)
+    elif trigger != "OK":
+        resolve_popup(corp, trigger, policy)
+
+    resolve_inbox(corp, policy)
+    return None
+
+
+def run_game(seed, max_days=1095, policy=safe_policy):
+    """
+    Play one seeded game to completion (victory, game over or max_days) and
+    return a summary dict.
+    """
+    started = time.perf_counter()
+    corp = new_game(seed=seed)
+    outcome = "MaxDays"
+
+    while corp.day <= max_days:
+        ended = play_day(corp, policy)
+        if ended is not None:
+            outcome = ended
+            break
+
+    return {
+        'seed': seed,
+        'final_day': corp.day,
+        'outcome': outcome,
+        'cash': round(corp.cash, 2),
+        'debt': round(corp.debt, 2),
+        'stock_price': round(corp.stock_price, 4),
+        'leaderboard_rank': corp.get_leaderboard_position(),
+        'elapsed_sec': round(time.perf_counter() - started, 4),
+    }
+
+
+def _run_game_safe(seed, max_days, policy):
+    """Worker entry point: a crashing run becomes an error line instead of killing the batch."""
+    try:
+        return run_game(seed, max_days=max_days, policy=policy)
+    except Exception as e:
+        return {'seed': seed, 'outcome': "Error", 'error': f"{type(e).__name__}: {e}"}
+
+
+# --- PROCESS POOL FAN-OUT ---
+def run_batch(seeds, out_path, max_days=1095, policy=safe_policy, processes=None,
+              chunksize=8, progress_every=0):
+    """
+    Run one game per seed across a process pool and append each summary to
+    out_path (JSON lines) as soon as it finishes. Results are never held in
+    memory, so peak memory does not grow with the number of runs.
+    Returns the number of runs written.
+    """
+    worker = functools.partial(_run_game_safe, max_days=max_days, policy=policy)
+    written = 0
+    started = time.perf_counter()
+
+    with open(out_path, 'a', encoding='utf-8') as out, \
+            multiprocessing.Pool(processes=processes, maxtasksperchild=1000) as pool:
+        for summary in pool.imap_unordered(worker, seeds, chunksize=chunksize):
+            out.write(json.dumps(summary) + '\n')
+            out.flush()
+            written += 1
+            if progress_every and written % progress_every == 0:
+                rate = written / max(time.perf_counter() - started, 1e-9)
+                print(f"{written} runs complete ({rate:.1f} runs/sec)", file=sys.stderr)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m batch_runner",
+                                     description="Run seeded Apex Executive games headlessly.")
+    parser.add_argument("--runs", type=int, default=100, help="number of games to play")
+    parser.add_argument("--seed-start", type=int, default=0, help="seed of the first run")
+    parser.add_argument("--days", type=int, default=1095, help="maximum days per game")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="safe",
+                        help="how emails, popups and earnings calls are answered")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--chunksize", type=int, default=8, help="runs handed to a worker at once")
+    parser.add_argument("--out", default="batch_results.jsonl", help="JSON lines output file")
+    args = parser.parse_args(argv)
+
+    seeds = range(args.seed_start, args.seed_start + args.runs)
+    written = run_batch(seeds, args.out, max_days=args.days, policy=POLICIES[args.policy],
+                        processes=args.processes, chunksize=args.chunksize,
+                        progress_every=max(1, args.runs // 20))
+    print(f"Wrote {written} run summaries to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
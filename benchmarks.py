@@ -0,0 +1,255 @@
+# benchmarks.py - Core simulation benchmark suite
+"""
+Measures Corporation.update_day throughput across company sizes, plus
+save/load and email generation, and compares runs against a stored baseline.
+
+Usage:
+    python -m benchmarks run --out bench.json
+    python -m benchmarks run --only products_1000 employees_1000 --days 100
+    python -m benchmarks compare baseline.json bench.json --threshold 0.10
+
+Every result is a rate (operations per second, higher is better), so
+`compare` flags any benchmark whose rate dropped by more than the threshold.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import config
+from game_core import Corporation, Product
+from event_system import EmailSystem
+from companies import Company
+
+# Positions that have automated work (see Employee.auto_actions)
+EMPLOYEE_POSITIONS = ["Marketing Analyst", "Finance Manager", "R&D Specialist", "Operations Manager",
+                      "HR Coordinator", "Project Manager", "Executive Assistant"]
+
+
+# --- SCENARIO BUILDERS ---
+def build_company(seed=0):
+    """A fresh company, wired the same way the UI and batch runner build one."""
+    corp = Corporation(seed=seed)
+    corp.email_system = EmailSystem(corp)
+    corp.set_identity("Benchmark Corp", "Bench CEO", corp.email_system)
+    # Deep pockets so large portfolios don't end the game during a run
+    corp.cash = 10_000_000_000
+    return corp
+
+
+def add_products(corp, count):
+    """Fill the portfolio with a mix of in-development and on-market products."""
+    rng = corp.rng.stream("benchmark")
+    stages = ["Launch", "Growth", "Maturity", "Decline"]
+    for i in range(count):
+        dev_days = rng.randint(15, 50)
+        product = Product(f"Bench Product {i}", rng.randint(5, 25) * 1_000_000, 500000,
+                          dev_days, rng.choice([1, 2, 3]), rng.uniform(0.05, 0.5))
+        if i % 2:
+            product.days_in_stage = rng.randrange(dev_days)
+        else:
+            product.launch(corp.technology_level, rng)
+            product.lifecycle_stage = rng.choice(stages)
+            product.days_in_stage = rng.randrange(30)
+        corp.projects.append(product)
+    return corp
+
+
+def add_employees(corp, count):
+    rng = corp.rng.employees
+    for i in range(count):
+        emp = config.EMPLOYEE_FACTORY(EMPLOYEE_POSITIONS[i % len(EMPLOYEE_POSITIONS)], 0, 5000, 1.0, rng)
+        emp.hired_day = corp.day
+        corp.employees.append(emp)
+    return corp
+
+
+def fill_inbox(corp, count):
+    """Deliver `count` rounds of mail; the inbox coalesces and caps what it keeps."""
+    email_system = corp.email_system
+    for _ in range(count):
+        email_system._generate_email()
+    return corp
+
+
+def add_acquisitions(corp, count):
+    for i in range(count):
+        company = Company(f"Bench Holding {i}", "Holding", 40 + i % 20, "medium")
+        company.acquired = True
+        company.acquired_day = corp.day
+        corp.acquired_companies.append(company)
+    return corp
+
+
+SCENARIOS = {
+    "empty": lambda: build_company(),
+    "products_100": lambda: add_products(build_company(), 100),
+    "products_1000": lambda: add_products(build_company(), 1000),
+    "products_10000": lambda: add_products(build_company(), 10000),
+    "employees_1000": lambda: add_employees(build_company(), 1000),
+    "inbox_5000": lambda: fill_inbox(build_company(), 5000),
+    "acquired_500": lambda: add_acquisitions(build_company(), 500),
+}
+
+
+# --- MEASUREMENTS ---
+def bench_update_day(build, days, repeat, profile=False):
+    """Best-of-`repeat` days/second for update_day on a freshly built company."""
+    best = None
+    profile_data = None
+    for _ in range(repeat):
+        corp = build()
+        profiler = None
+        if profile:
+            from instrumentation import TickProfiler
+            profiler = TickProfiler.attach(corp, trace_limit=0)
+        start = time.perf_counter()
+        for _ in range(days):
+            corp.update_day()
+        elapsed = time.perf_counter() - start
+        rate = days / max(elapsed, 1e-9)
+        if best is None or rate > best:
+            best = rate
+            if profiler is not None:
+                profile_data = profiler.to_dict()
+    result = {"metric": "days_per_sec", "value": round(best, 3), "days": days}
+    if profile_data:
+        result["profile"] = profile_data
+    return result
+
+
+def bench_save_load(repeat):
+    """save_game()/load_game() round trips per second on a mid-sized company."""
+    corp = add_employees(build_company(), 50)
+    for _ in range(30):
+        corp.update_day()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.save")
+        for name, call in (("save_game", lambda: corp.save_game(path)),
+                           ("load_game", lambda: build_company().load_game(path))):
+            best = None
+            ok = True
+            for _ in range(repeat):
+                start = time.perf_counter()
+                ok = call() and ok
+                elapsed = time.perf_counter() - start
+                rate = 1 / max(elapsed, 1e-9)
+                best = rate if best is None else max(best, rate)
+            results[name] = {"metric": "calls_per_sec", "value": round(best, 3), "ok": bool(ok)}
+    return results
+
+
+def bench_generate_email(calls, repeat):
+    best = None
+    for _ in range(repeat):
+        email_system = build_company().email_system
+        start = time.perf_counter()
+        for _ in range(calls):
+            email_system._generate_email()
+            if len(email_system.inbox) > 1000:
+                email_system.inbox.clear()
+        rate = calls / max(time.perf_counter() - start, 1e-9)
+        best = rate if best is None else max(best, rate)
+    return {"metric": "calls_per_sec", "value": round(best, 3), "calls": calls}
+
+
+def run_suite(days=200, repeat=3, only=None, profile=False):
+    results = {}
+    for name, build in SCENARIOS.items():
+        if only and name not in only:
+            continue
+        print(f"update_day[{name}] ...", file=sys.stderr)
+        results[f"update_day[{name}]"] = bench_update_day(build, days, repeat, profile)
+    if not only or "save_load" in only:
+        print("save_game/load_game ...", file=sys.stderr)
+        results.update(bench_save_load(repeat))
+    if not only or "generate_email" in only:
+        print("_generate_email ...", file=sys.stderr)
+        results["_generate_email"] = bench_generate_email(days * 10, repeat)
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "days": days,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> tuple:
+    """
+    Compare two result files. Returns (regressed, report_lines); a benchmark
+    regresses when its rate fell by more than `threshold` (0.10 = 10%).
+    """
+    regressed = False
+    lines = [f"{'benchmark':<32}{'baseline':>14}{'current':>14}{'change':>9}  status"]
+    base_results = baseline.get("results", {})
+    for name, result in current.get("results", {}).items():
+        base = base_results.get(name)
+        if base is None:
+            lines.append(f"{name:<32}{'-':>14}{result['value']:>14,.1f}{'':>9}  new")
+            continue
+        change = (result["value"] - base["value"]) / base["value"] if base["value"] else 0.0
+        if change < -threshold:
+            status = "SLOWER"
+            regressed = True
+        elif change > threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        lines.append(f"{name:<32}{base['value']:>14,.1f}{result['value']:>14,.1f}{change:>+9.1%}  {status}")
+    for name in base_results:
+        if name not in current.get("results", {}):
+            lines.append(f"{name:<32}{base_results[name]['value']:>14,.1f}{'-':>14}{'':>9}  missing")
+    return regressed, lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Apex Executive simulation benchmarks.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="run the suite and write a JSON results file")
+    run_parser.add_argument("--days", type=int, default=200, help="days simulated per update_day benchmark")
+    run_parser.add_argument("--repeat", type=int, default=3, help="repetitions (best is kept)")
+    run_parser.add_argument("--only", nargs="*", help="scenario names, save_load or generate_email")
+    run_parser.add_argument("--profile", action="store_true", help="include per-phase timings")
+    run_parser.add_argument("--verbose", action="store_true", help="show the game's own console output")
+    run_parser.add_argument("--out", default="bench_results.json")
+
+    cmp_parser = sub.add_parser("compare", help="flag slowdowns against a baseline results file")
+    cmp_parser.add_argument("baseline")
+    cmp_parser.add_argument("current")
+    cmp_parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown (0.10 = 10%%)")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        # The game prints recoverable errors to stdout; keep them out of the report unless asked
+        with open(os.devnull, "w") as devnull, \
+                contextlib.redirect_stdout(sys.stdout if args.verbose else devnull):
+            data = run_suite(days=args.days, repeat=args.repeat, only=args.only, profile=args.profile)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        for name, result in data["results"].items():
+            note = "" if result.get("ok", True) else "  (call reported failure)"
+            print(f"{name:<32}{result['value']:>14,.1f} {result['metric']}{note}")
+        print(f"Wrote {args.out}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+    regressed, lines = compare(baseline, current, args.threshold)
+    print("\n".join(lines))
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -41,21 +41,21 @@ class Company:
             }
         ]
     
-    def attempt_acquisition(self, offer_index: int) -> bool:
+    def attempt_acquisition(self, offer_index: int, rng=random) -> bool:
         """Try to acquire this company. Returns True if successful."""
         offers = self.generate_offers()
         offer = offers[offer_index]
         acceptance_chance = offer['acceptance_chance']
         
         # Add some randomness
-        return random.random() < acceptance_chance
+        return rng.random() < acceptance_chance
     
-    def earn_daily_profit(self) -> float:
+    def earn_daily_profit(self, rng=random) -> float:
         """Calculate daily profit (2% of company's annual profit distributed daily to player)."""
         if not self.acquired:
             return 0
         # Add variance (±10%)
-        variance = random.uniform(0.9, 1.1)
+        variance = rng.uniform(0.9, 1.1)
         return self.daily_profit * 0.02 * variance
 
 
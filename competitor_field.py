@@ -0,0 +1,305 @@
+# competitor_field.py - Rival companies on the Wall Street leaderboard
+"""
+The competitor field keeps every rival's stock price, strategy and market
+share in NumPy arrays. All prices advance together with one vectorized draw
+per day, and each rival's recent prices live in a 2-D ring buffer
+(day slot x rival), so a market can hold thousands of rivals.
+
+Competitor objects are thin views onto one column of the field. Code that
+reads comp.name / comp.stock_price / comp.strategy / comp.stock_history (the
+leaderboards, victory checks) works unchanged.
+"""
+import random
+
+import numpy as np
+
+import config
+
+# Strategy codes and their daily price move range (uniform low, high)
+STRATEGIES = ("aggressive", "balanced", "conservative")
+STRATEGY_CODE = {name: code for code, name in enumerate(STRATEGIES)}
+STRATEGY_LOW = np.array([-1.5, -0.5, -0.3])
+STRATEGY_HIGH = np.array([2.5, 1.0, 0.8])
+# Extra drop while the player is running marketing (uniform low, high)
+PRESSURE_LOW, PRESSURE_HIGH = 0.2, 0.8
+PRICE_FLOOR = 10.0
+
+
+class CompetitorField:
+    """Struct-of-arrays store for all rivals in a market."""
+
+    def __init__(self, capacity: int = 16, history_days: int = None):
+        history_days = history_days or config.PRICE_HISTORY_DAYS
+        self.competitors = []  # Competitor views, one per column
+        self.n = 0
+        self.price = np.zeros(capacity)
+        self.strategy = np.zeros(capacity, dtype=np.int8)
+        self.market_share = np.zeros(capacity)
+        # Ring buffer: row `head - 1` holds the latest price; hist_len counts valid rows per rival
+        self.history = np.zeros((history_days, capacity))
+        self.hist_len = np.zeros(capacity, dtype=np.int64)
+        self.head = 0
+        # Running sum and sum of squares of each rival's window, for O(1)-per-day mean/std
+        self.hist_sum = np.zeros(capacity)
+        self.hist_sumsq = np.zeros(capacity)
+        # Bumped on every price change so the leaderboard index knows when to re-sort
+        self.version = 0
+        self.leaderboard = LeaderboardIndex(self)
+
+    def __len__(self):
+        return self.n
+
+    @classmethod
+    def random_market(cls, count: int, rng=random, low=20.0, high=500.0) -> "CompetitorField":
+        """A custom market of `count` rivals with random prices and strategies."""
+        field = cls(capacity=max(16, count))
+        for i in range(count):
+            Competitor(f"Rival {i + 1:04d}", round(rng.uniform(low, high), 2), rng.choice(STRATEGIES), rng, field=field)
+        return field
+
+    # --- MEMBERSHIP ---
+    def _grow(self, needed):
+        capacity = len(self.price)
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2)
+        for name in ("price", "strategy", "market_share", "hist_len", "hist_sum", "hist_sumsq"):
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:self.n] = old[:self.n]
+            setattr(self, name, grown)
+        history = np.zeros((self.history.shape[0], capacity))
+        history[:, :self.n] = self.history[:, :self.n]
+        self.history = history
+
+    def add(self, competitor, stock_price, strategy, market_share) -> int:
+        """Give `competitor` a new column; returns its index."""
+        self._grow(self.n + 1)
+        i = self.n
+        self.price[i] = stock_price
+        self.strategy[i] = STRATEGY_CODE[strategy]
+        self.market_share[i] = market_share
+        self.history[self.head - 1, i] = stock_price
+        self.hist_len[i] = 1
+        self.hist_sum[i] = stock_price
+        self.hist_sumsq[i] = stock_price * stock_price
+        self.competitors.append(competitor)
+        self.n += 1
+        self.version += 1
+        return i
+
+    # --- SAVE / LOAD ---
+    _ARRAYS = ("price", "strategy", "market_share", "hist_len", "hist_sum", "hist_sumsq")
+
+    def copy(self) -> "CompetitorField":
+        """Independent copy of the market: arrays are copied and the rivals re-viewed onto them."""
+        twin = CompetitorField.__new__(CompetitorField)
+        for name in self._ARRAYS:
+            setattr(twin, name, getattr(self, name).copy())
+        twin.history = self.history.copy()
+        twin.n = self.n
+        twin.head = self.head
+        twin.version = self.version
+        twin.competitors = []
+        for comp in self.competitors:
+            view = Competitor.__new__(Competitor)
+            view.name, view.field, view.index = comp.name, twin, comp.index
+            twin.competitors.append(view)
+        twin.leaderboard = LeaderboardIndex(twin)
+        return twin
+
+    def getstate(self) -> dict:
+        """Plain-data snapshot: rival names plus raw array bytes (used by save files)."""
+        n = self.n
+        state = {'names': [comp.name for comp in self.competitors], 'head': self.head,
+                 'history_days': self.history.shape[0],
+                 'history': np.ascontiguousarray(self.history[:, :n]).tobytes()}
+        for name in self._ARRAYS:
+            state[name] = getattr(self, name)[:n].tobytes()
+        return state
+
+    def setstate(self, state: dict):
+        """Replace this field's rivals with a getstate() snapshot."""
+        names = state['names']
+        n = len(names)
+        capacity = max(16, n)
+        for name in self._ARRAYS:
+            column = np.zeros(capacity, dtype=getattr(self, name).dtype)
+            column[:n] = np.frombuffer(state[name], dtype=column.dtype)
+            setattr(self, name, column)
+        self.history = np.zeros((state['history_days'], capacity))
+        self.history[:, :n] = np.frombuffer(state['history']).reshape(state['history_days'], n)
+        self.head = state['head']
+        self.n = n
+        self.competitors = []
+        for i, name in enumerate(names):
+            comp = Competitor.__new__(Competitor)
+            comp.name, comp.field, comp.index = name, self, i
+            self.competitors.append(comp)
+        self.version += 1
+
+    # --- DAILY MOVE ---
+    def step(self, marketing_pressure: bool, rng=random):
+        """Advance every rival's price one day (see the strategy ranges above)."""
+        n = self.n
+        if not n:
+            return
+        # One draw from the caller's stream seeds the whole day's vector draw
+        gen = np.random.default_rng(rng.getrandbits(64))
+        codes = self.strategy[:n]
+        low = STRATEGY_LOW[codes]
+        change = low + (STRATEGY_HIGH[codes] - low) * gen.random(n)
+        if marketing_pressure:
+            change -= gen.uniform(PRESSURE_LOW, PRESSURE_HIGH, n)
+        price = self.price[:n]
+        np.maximum(PRICE_FLOOR, price + change, out=price)
+        self.version += 1
+        self._push_history()
+
+    def _push_history(self):
+        n = self.n
+        days = self.history.shape[0]
+        price = self.price[:n]
+        # Rivals with a full window drop the price about to be overwritten
+        dropped = self.history[self.head, :n] * (self.hist_len[:n] == days)
+        self.hist_sum[:n] += price - dropped
+        self.hist_sumsq[:n] += price * price - dropped * dropped
+        self.history[self.head, :n] = price
+        self.head = (self.head + 1) % days
+        np.minimum(self.hist_len[:n] + 1, days, out=self.hist_len[:n])
+        if self.head == 0:
+            # Re-sum once per window so add/subtract rounding never accumulates
+            window = np.where(self._valid_rows(), self.history[:, :n], 0.0)
+            self.hist_sum[:n] = window.sum(axis=0)
+            self.hist_sumsq[:n] = (window * window).sum(axis=0)
+
+    def _valid_rows(self):
+        """(history_days x n) mask of the ring slots that hold each rival's window."""
+        days = self.history.shape[0]
+        age = (self.head - 1 - np.arange(days)) % days  # 0 = latest row
+        return age[:, None] < self.hist_len[None, :self.n]
+
+    # --- QUERIES ---
+    def stock_history(self, i) -> list:
+        """Recent prices of rival i, oldest first (at most history_days of them)."""
+        k = int(self.hist_len[i])
+        rows = (self.head - k + np.arange(k)) % self.history.shape[0]
+        return self.history[rows, i].tolist()
+
+    def rolling_mean(self) -> np.ndarray:
+        """Mean price of each rival over its history window."""
+        return self.hist_sum[:self.n] / np.maximum(1, self.hist_len[:self.n])
+
+    def rolling_std(self) -> np.ndarray:
+        """Population standard deviation of each rival's price over its window."""
+        mean = self.rolling_mean()
+        variance = self.hist_sumsq[:self.n] / np.maximum(1, self.hist_len[:self.n]) - mean * mean
+        return np.sqrt(np.maximum(0.0, variance))
+
+    def rolling_min(self) -> np.ndarray:
+        """Lowest price of each rival over its window (one masked pass over the ring)."""
+        return np.where(self._valid_rows(), self.history[:, :self.n], np.inf).min(axis=0)
+
+    def rolling_max(self) -> np.ndarray:
+        return np.where(self._valid_rows(), self.history[:, :self.n], -np.inf).max(axis=0)
+
+
+class LeaderboardIndex:
+    """
+    Rivals ordered by stock price. The sort is redone only after prices have
+    changed (once per game day); rank, leader and top-K queries then cost
+    O(log n) or O(k) instead of sorting the whole market per call.
+    """
+
+    def __init__(self, field):
+        self.field = field
+        self._version = -1
+        self._order = np.zeros(0, dtype=np.int64)  # Column indices, lowest price first
+        self._sorted = np.zeros(0)                  # Prices in that order
+
+    def _refresh(self):
+        field = self.field
+        if self._version != field.version:
+            price = field.price[:field.n]
+            self._order = np.argsort(price, kind="stable")
+            self._sorted = price[self._order]
+            self._version = field.version
+
+    def rank_of(self, stock_price) -> int:
+        """Leaderboard position (1 = best) of a company at stock_price; ties rank below rivals."""
+        self._refresh()
+        return 1 + len(self._sorted) - int(np.searchsorted(self._sorted, stock_price, side="left"))
+
+    def leader(self):
+        """The highest-priced rival (None for an empty market)."""
+        self._refresh()
+        return self.field.competitors[self._order[-1]] if len(self._order) else None
+
+    def leader_price(self) -> float:
+        self._refresh()
+        return float(self._sorted[-1]) if len(self._sorted) else 0.0
+
+    def top(self, k: int) -> list:
+        """The k highest-priced rivals, best first."""
+        self._refresh()
+        competitors = self.field.competitors
+        return [competitors[i] for i in self._order[::-1][:k].tolist()]
+
+    def standings(self, player_name, player_price, k: int) -> list:
+        """
+        Rows for a leaderboard screen: the top k places with the player merged in,
+        plus the player's own row if they are outside the top k. Each row is
+        {'rank', 'name', 'stock_price', 'strategy', 'is_player'}.
+        """
+        player_rank = self.rank_of(player_price)
+        player_row = {'rank': player_rank, 'name': player_name, 'stock_price': player_price,
+                      'strategy': 'Player', 'is_player': True}
+        rows = [{'rank': rank, 'name': comp.name, 'stock_price': comp.stock_price,
+                 'strategy': comp.strategy, 'is_player': False}
+                for rank, comp in enumerate(self.top(k), 1)]
+        if player_rank <= k:
+            rows.insert(player_rank - 1, player_row)
+            for row in rows[player_rank:]:
+                row['rank'] += 1
+            del rows[k:]
+        else:
+            rows.append(player_row)
+        return rows
+
+
+class Competitor:
+    """Represents a competing company in the market (a view onto one column of a CompetitorField)."""
+
+    def __init__(self, name, initial_stock_price, strategy, rng=random, field=None):
+        self.name = name
+        self.field = field if field is not None else CompetitorField()
+        self.index = self.field.add(self, initial_stock_price, strategy, rng.uniform(15, 25))
+
+    @property
+    def stock_price(self):
+        return float(self.field.price[self.index])
+
+    @stock_price.setter
+    def stock_price(self, value):
+        self.field.price[self.index] = value
+        self.field.version += 1
+
+    @property
+    def strategy(self):
+        return STRATEGIES[self.field.strategy[self.index]]
+
+    @strategy.setter
+    def strategy(self, value):
+        self.field.strategy[self.index] = STRATEGY_CODE[value]
+
+    @property
+    def market_share(self):
+        return float(self.field.market_share[self.index])
+
+    @market_share.setter
+    def market_share(self, value):
+        self.field.market_share[self.index] = value
+
+    @property
+    def stock_history(self):
+        return self.field.stock_history(self.index)
@@ -83,6 +83,10 @@ FONT_MONO = ('Courier New', 11)
 
 # --- GAME CONFIGURATION ---
 PROJECT_LIMIT = 3
+EMPLOYEE_BATCH_THRESHOLD = 200  # Workforces this large run their daily auto-actions in per-action groups
+LEADERBOARD_ROWS = 50  # Places listed on the leaderboard screens (the player's row is always shown)
+PRICE_HISTORY_DAYS = 90  # Window kept for player and competitor stock price histories
+PRODUCT_BOOK_THRESHOLD = 256  # Portfolios this large are ticked as NumPy columns (see product_book.py)
 DAILY_SALARY_PER_DEPT = 50000 
 INITIAL_DEPT_BUDGET = 20000000
 
@@ -178,8 +182,51 @@ EARNINGS_QUESTIONS = [
     }
 ]
 
+# INBOX
+INBOX_CAPACITY = 200      # Oldest least-important mail is evicted past this
+INBOX_EXPIRY_DAYS = 30    # Mail at INBOX_EXPIRE_PRIORITY or lower expires after this many days untouched
+INBOX_EXPIRE_PRIORITY = 3
+# Email type -> priority (0 = most important). Unlisted types use EMAIL_DEFAULT_PRIORITY.
+EMAIL_PRIORITIES = {
+    "coaching": 0,
+    "welcome": 1,
+    "cybersecurity_breach": 1,
+    "product_recall": 1,
+    "lawsuit_threat": 1,
+    "reputation_crisis": 1,
+    "ceo_health_warning": 1,
+    "shareholder_activist": 1,
+    "marketing_request": 2,
+    "employee_complaint": 2,
+    "competitor_threat": 2,
+    "tech_upgrade": 2,
+    "regulatory_issue": 2,
+    "investor_meeting": 3,
+    "media_interview": 3,
+    "talent_acquisition": 3,
+    "partnership_offer": 3,
+    "expansion_opportunity": 3,
+}
+EMAIL_DEFAULT_PRIORITY = 2
+
+# POPUP EVENTS
+POPUP_MAX_PENDING = 32    # Registering more evicts the oldest pending popup
+POPUP_EXPIRY_DAYS = 1     # Popups not shown within this many days are dropped
+
+# --- REPLAY ---
+REPLAY_DIR = "replays"    # Where the UI writes each game's action log (see replay.py)
+
+# --- DECISION PREVIEW ---
+PREVIEW_ROLLOUTS = 48            # Simulated futures per option (the same futures for every option)
+PREVIEW_HORIZONS = (30, 90)      # Days ahead at which outcomes are reported
+PREVIEW_METRICS = ("cash", "stock_price", "debt", "board_confidence")
+PREVIEW_BATCH = 8                # Rollouts per worker task; results arrive a batch at a time
+
 # EMPLOYEE FACTORY
-def EMPLOYEE_FACTORY(position, signing_bonus, daily_salary, skill):
-    """Factory function to create Employee instances with random names."""
+def EMPLOYEE_FACTORY(position, signing_bonus, daily_salary, skill, rng=None):
+    """Factory function to create Employee instances with random names.
+    Pass the hiring Corporation's rng.employees stream to keep the game reproducible."""
     from game_core import Employee
-    return Employee(position, signing_bonus, daily_salary, skill)
\ No newline at end of file
+    if rng is None:
+        return Employee(position, signing_bonus, daily_salary, skill)
+    return Employee(position, signing_bonus, daily_salary, skill, rng)
\ No newline at end of file
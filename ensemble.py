@@ -0,0 +1,407 @@
+# ensemble.py - Vectorized Monte Carlo engine for Corporation
+"""
+Runs N corporations in lockstep with every metric held in a NumPy array of length N.
+
+The engine mirrors the core economy of Corporation.update_day:
+    _update_scenario, _generate_revenue (+ _apply_competitor_pressure),
+    _generate_costs, _update_stock_market (+ competitor prices),
+    _update_metrics, _update_credit_rating, _check_game_over, _check_quarter_end.
+Player decisions (emails, employees, projects, R&D, earnings calls) are not modelled:
+every game plays "hands off", with emergency borrowing applied automatically.
+
+Games keep ticking after they finish; `outcome` / `finish_day` record the first
+terminal state each game reached.
+
+Usage:
+    python -m ensemble --games 10000 --days 1095
+    python -m ensemble --check --games 2000 --days 365
+"""
+import argparse
+import sys
+
+import numpy as np
+
+import config
+from game_core import Corporation
+from rng import GameRNG
+from competitor_field import STRATEGIES, STRATEGY_LOW, STRATEGY_HIGH
+
+
+# --- ENCODINGS ---
+SCENARIO_NAMES = list(config.SCENARIOS.keys())
+SCENARIO_REV_MOD = np.array([config.SCENARIOS[s].get('rev_mod', 1.0) for s in SCENARIO_NAMES])
+SCENARIO_COST_MOD = np.array([config.SCENARIOS[s].get('cost_mod', 1.0) for s in SCENARIO_NAMES])
+SCENARIO_STOCK_MOD = np.array([config.SCENARIOS[s].get('stock_mod', 1.0) for s in SCENARIO_NAMES])
+STABLE_GROWTH = SCENARIO_NAMES.index("Stable Growth")
+
+CREDIT_RATINGS = ["AAA", "AA", "A", "BBB", "BB", "B", "CCC"]
+CREDIT_RATES = np.array([0.03, 0.04, 0.05, 0.06, 0.08, 0.14, 0.20])
+
+MOOD_NEUTRAL, MOOD_BULLISH, MOOD_BEARISH = 0, 1, 2
+MOOD_NAMES = ["Neutral", "Bullish", "Bearish"]
+MOOD_REVENUE_MOD = np.array([1.0, 1.2, 0.8])
+
+STRATEGY_NAMES = list(STRATEGIES)
+
+OUTCOMES = ["Running", "Victory_Leaderboard", "Victory_IPO", "Victory_Dominance",
+            "Victory_Acquired", "GameOver_Debt", "GameOver_Board", "GameOver_Health"]
+RUNNING = 0
+
+# Metrics compared by the equivalence check
+CHECK_METRICS = ["cash", "debt", "stock_price", "customer_base", "technology_level",
+                 "ceo_health", "board_confidence", "quarterly_revenue"]
+
+
+class CorporationEnsemble:
+    """Struct-of-arrays copy of N corporations advanced one day per call to update_day()."""
+
+    def __init__(self, n: int, seed=None, template: Corporation = None):
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        if template is None:
+            template = Corporation()
+
+        def full(value, dtype=float):
+            return np.full(n, value, dtype=dtype)
+
+        self.day = 1
+        self.cash = full(template.cash)
+        self.debt = full(template.debt)
+        self.max_debt_limit = full(template.max_debt_limit)
+        self.stock_price = full(template.stock_price)
+        self.shares_outstanding = full(template.shares_outstanding)
+        self.market_cap = self.stock_price * self.shares_outstanding
+        self.reputation = full(template.reputation)
+        self.employee_morale = full(template.employee_morale)
+        self.ceo_health = full(template.ceo_health)
+        self.board_confidence = full(template.board_confidence)
+        self.customer_base = full(template.customer_base)
+        self.technology_level = full(template.technology_level)
+        self.market_mood = full(MOOD_NAMES.index(template.market_mood), dtype=np.int8)
+        self.scenario = full(SCENARIO_NAMES.index(template.current_scenario), dtype=np.int8)
+        self.scenario_duration = full(template.scenario_duration, dtype=np.int32)
+        self.analyst_rating = full(config.ANALYST_RATINGS.index(template.analyst_rating), dtype=np.int8)
+        self.credit_rating = full(CREDIT_RATINGS.index(template.credit_rating), dtype=np.int8)
+        self.quarterly_revenue = full(template.quarterly_revenue)
+        self.quarterly_costs = full(template.quarterly_costs)
+        self.previous_quarter_revenue = full(template.previous_quarter_revenue)
+        self.days_without_marketing = full(template.days_without_marketing, dtype=np.int32)
+
+        # Inputs that no phase in this engine changes
+        self.daily_department_cost = sum(template.departments.values()) / 365
+        self.hr_department_budget = template.departments['HR']
+        self.daily_rnd_cost = template.daily_rnd_cost
+        self.project_count = len(template.projects)
+        self.upgrade_bonuses = dict(template.upgrade_bonuses)
+        self.diff_mods = template._get_difficulty_modifiers()
+
+        # Competitor field: one row per game, one column per rival
+        self.competitor_names = [c.name for c in template.competitors]
+        self.competitor_prices = np.tile([c.stock_price for c in template.competitors], (n, 1)).astype(float)
+        strategies = np.array([STRATEGY_NAMES.index(c.strategy) for c in template.competitors])
+        self.competitor_low = STRATEGY_LOW[strategies]
+        self.competitor_high = STRATEGY_HIGH[strategies]
+
+        self.outcome = full(RUNNING, dtype=np.int8)
+        self.finish_day = full(0, dtype=np.int32)
+
+    # --- DAILY PHASES (mirror Corporation) ---
+    def _update_scenario(self):
+        expired = self.scenario_duration <= 0
+        self.scenario_duration = np.where(expired, self.scenario_duration, self.scenario_duration - 1)
+        roll = self.rng.random(self.n)
+        new_mask = expired & (roll < 0.25)
+        picked = self.rng.integers(0, len(SCENARIO_NAMES), self.n)
+        durations = self.rng.integers(30, 91, self.n)
+        self.scenario = np.where(new_mask, picked, np.where(expired, STABLE_GROWTH, self.scenario)).astype(np.int8)
+        self.scenario_duration = np.where(new_mask, durations, self.scenario_duration).astype(np.int32)
+
+    def _generate_revenue(self):
+        base_revenue = self.market_cap * 0.004
+        tech_mod = 0.5 + (self.technology_level / 100) * 0.5
+        cust_mod = 0.5 + (self.customer_base / 100) * 0.5
+        market_mod = MOOD_REVENUE_MOD[self.market_mood]
+        scenario_mod = SCENARIO_REV_MOD[self.scenario]
+        revenue_multiplier = 1.0 + (self.upgrade_bonuses['revenue_boost'] / 100)
+
+        total_revenue = (base_revenue * tech_mod * cust_mod * market_mod * scenario_mod
+                         * self.diff_mods['revenue'] * revenue_multiplier
+                         * self.rng.uniform(0.95, 1.05, self.n))
+
+        customer_growth_bonus = self.upgrade_bonuses['customer_growth']
+        if customer_growth_bonus > 0:
+            grows = self.rng.random(self.n) < 0.3
+            self.customer_base = np.where(grows, np.minimum(100, self.customer_base + customer_growth_bonus / 10),
+                                          self.customer_base)
+
+        self.cash += total_revenue
+        self.quarterly_revenue += total_revenue
+        self._apply_competitor_pressure()
+
+    def _apply_competitor_pressure(self):
+        self.days_without_marketing += 1
+        overdue = self.days_without_marketing - 5
+        loss = np.where(overdue > 20, 0.3 * 2.5, np.where(overdue > 10, 0.3 * 1.5, 0.3))
+        self.customer_base = np.where(overdue >= 0, np.maximum(10, self.customer_base - loss), self.customer_base)
+
+    def _generate_costs(self):
+        interest_rate = CREDIT_RATES[self.credit_rating] * self.diff_mods['interest_rate']
+        debt_interest = self.debt * (interest_rate / 365)
+        min_debt_payment = self.debt * 0.001
+
+        total_costs = self.daily_department_cost + debt_interest + min_debt_payment
+        total_costs = total_costs * SCENARIO_COST_MOD[self.scenario]
+        total_costs = total_costs * self.diff_mods['costs']
+        total_costs = total_costs * (1.0 - (self.upgrade_bonuses['cost_reduction'] / 100))
+
+        self.cash -= total_costs
+        self.quarterly_costs += total_costs
+        self.debt -= np.minimum(min_debt_payment, self.debt)
+
+        # Profit cushion: 25% rebate on losses
+        cushion = np.maximum(self.quarterly_costs - self.quarterly_revenue, 0) * 0.25
+        self.cash += cushion
+        self.quarterly_costs = np.where(cushion > 0, np.maximum(0, self.quarterly_costs - cushion),
+                                        self.quarterly_costs)
+
+    def _update_stock_market(self):
+        rating_factor = (self.analyst_rating - 2) * 0.025
+
+        prev = self.previous_quarter_revenue
+        safe_prev = np.where(prev != 0, prev, 1.0)
+        performance_factor = np.where(prev != 0, (self.quarterly_revenue - prev) / safe_prev, 0.0)
+        performance_factor = np.clip(performance_factor * 0.08, -0.01, 0.04)
+
+        action_bonus = (0.004 * (self.cash > 0)
+                        + 0.010 * (self.quarterly_revenue > self.quarterly_costs)
+                        + 0.006 * (self.customer_base > 30)
+                        + (0.007 if self.project_count > 0 else 0.0)
+                        + 0.005 * (self.technology_level > 30))
+        confidence_factor = (self.board_confidence - 40) / 1500
+
+        daily_change = (rating_factor + performance_factor + action_bonus + confidence_factor) * self.stock_price
+        daily_change = daily_change * (1.0 + (self.upgrade_bonuses['stock_boost'] / 100))
+        daily_change = daily_change * SCENARIO_STOCK_MOD[self.scenario]
+
+        new_price = self.stock_price + daily_change + self.rng.uniform(-0.02, 0.02, self.n)
+        self.stock_price = np.maximum(1.0, new_price)
+        self.market_cap = self.stock_price * self.shares_outstanding
+
+        # Competitors: one vectorized draw for every rival in every game
+        shape = self.competitor_prices.shape
+        change = self.competitor_low + (self.competitor_high - self.competitor_low) * self.rng.random(shape)
+        pressured = self.days_without_marketing < 2
+        if pressured.any():
+            change -= pressured[:, None] * self.rng.uniform(0.2, 0.8, shape)
+        self.competitor_prices = np.maximum(10.0, self.competitor_prices + change)
+
+    def _update_metrics(self):
+        decay = (1.0 + 0.5 * (self.debt > self.cash) + 0.5 * (self.employee_morale < 40)
+                 - self.upgrade_bonuses['health_regen'])
+        self.ceo_health = np.maximum(0, self.ceo_health - decay)
+
+        confidence_change = 1 * (self.cash > 1500000000) - 1 * (self.stock_price < 40)
+        self.board_confidence = np.clip(self.board_confidence + confidence_change, 0, 100)
+
+        morale_change = 1 if self.hr_department_budget > 30000000 else 0
+        self.employee_morale = np.clip(self.employee_morale + morale_change, 0, 100)
+
+        if self.daily_rnd_cost < 100000:
+            self.technology_level = np.maximum(10, self.technology_level - 0.1)
+
+        bullish = (self.technology_level > 80) & (self.customer_base > 80)
+        bearish = (self.technology_level < 30) | (self.customer_base < 30)
+        self.market_mood = np.select([bullish, bearish], [MOOD_BULLISH, MOOD_BEARISH], MOOD_NEUTRAL).astype(np.int8)
+
+    def _update_credit_rating(self):
+        equity = np.where(self.market_cap <= 0, 1, self.market_cap)
+        debt_to_equity = self.debt / equity
+        profitable = self.quarterly_revenue > self.quarterly_costs
+        new_rating = np.select(
+            [
+                (debt_to_equity < 0.05) & (self.cash > self.market_cap * 0.15) & profitable,
+                (debt_to_equity < 0.15) & (self.cash > self.market_cap * 0.10),
+                (debt_to_equity < 0.30) & (self.cash > 0),
+                debt_to_equity < 0.55,
+                debt_to_equity < 0.90,
+                debt_to_equity < 1.5,
+            ],
+            [0, 1, 2, 3, 4, 5], 6).astype(np.int8)
+
+        steps = new_rating.astype(int) - self.credit_rating
+        factor = np.where(steps > 0, 1 - steps * 0.05, 1 - steps * 0.02)  # Downgrade penalty / upgrade bonus
+        self.stock_price = self.stock_price * factor
+        self.credit_rating = new_rating
+
+    def _check_game_over(self):
+        """Return an array of trigger codes: outcome index, -1 for emergency borrowing, 0 for OK."""
+        highest_competitor = self.competitor_prices.max(axis=1)
+        trigger = np.select(
+            [
+                self.stock_price > highest_competitor,
+                (self.market_cap >= 500_000_000) & (self.stock_price > 50),
+                (self.customer_base >= 80) & (self.quarterly_revenue >= 250_000_000),
+                (self.market_cap >= 750_000_000) & (self.reputation >= 80) & (self.technology_level >= 75),
+                self.cash < 0,
+                self.debt > self.max_debt_limit * 10,
+                self.board_confidence < 10,
+                self.ceo_health <= 0,
+            ],
+            [1, 2, 3, 4, -1, 5, 6, 7], RUNNING)
+
+        # Emergency borrowing: borrow deficit + $1M, or go under when credit is exhausted
+        emergency = trigger == -1
+        if emergency.any():
+            amount_needed = np.abs(self.cash) + 1000000
+            can_borrow = emergency & ((self.max_debt_limit - self.debt) >= amount_needed)
+            self.cash = np.where(can_borrow, self.cash + amount_needed, self.cash)
+            self.debt = np.where(can_borrow, self.debt + amount_needed, self.debt)
+            trigger = np.where(emergency & ~can_borrow, OUTCOMES.index("GameOver_Debt"), trigger)
+
+        newly_finished = (self.outcome == RUNNING) & (trigger > 0)
+        self.outcome = np.where(newly_finished, trigger, self.outcome).astype(np.int8)
+        self.finish_day = np.where(newly_finished, self.day, self.finish_day)
+        return trigger
+
+    def _check_quarter_end(self, trigger):
+        if self.day % 90 != 0:
+            return
+        # update_day returns before the quarter-end check on any non-OK day
+        ok = trigger == RUNNING
+        self.previous_quarter_revenue = np.where(ok, self.quarterly_revenue, self.previous_quarter_revenue)
+        self.quarterly_revenue = np.where(ok, 0, self.quarterly_revenue)
+        self.quarterly_costs = np.where(ok, 0, self.quarterly_costs)
+
+    def update_day(self):
+        """Advance every game by one day."""
+        self._update_scenario()
+        self._generate_revenue()
+        self._generate_costs()
+        self._update_stock_market()
+        self._update_metrics()
+        self._update_credit_rating()
+        self.day += 1
+        trigger = self._check_game_over()
+        self._check_quarter_end(trigger)
+
+    def run(self, days: int):
+        for _ in range(days):
+            self.update_day()
+        return self
+
+    # --- RESULTS ---
+    def probability(self, outcome: str, by_day: int = None) -> float:
+        """Share of games whose first terminal state was `outcome` (optionally on or before by_day)."""
+        mask = self.outcome == OUTCOMES.index(outcome)
+        if by_day is not None:
+            mask &= self.finish_day <= by_day
+        return float(mask.mean())
+
+    def outcome_counts(self) -> dict:
+        counts = np.bincount(self.outcome, minlength=len(OUTCOMES))
+        return {name: int(count) for name, count in zip(OUTCOMES, counts) if count}
+
+    def metric(self, name: str) -> np.ndarray:
+        return getattr(self, name)
+
+
+# --- EQUIVALENCE MODE ---
+def _scalar_update_day(corp: Corporation):
+    """Advance a real Corporation through exactly the phases the ensemble mirrors."""
+    corp._update_scenario()
+    corp._generate_revenue()
+    corp._generate_costs()
+    corp._update_stock_market()
+    corp._update_metrics()
+    corp._update_credit_rating()
+    corp.day += 1
+    trigger = corp._check_game_over()
+    if trigger == "EmergencyBorrowing":
+        # update_day returns on this trigger before the quarter-end check, so the quarter stays open
+        success, _amount = corp.emergency_borrow()
+        return "OK" if success else "GameOver_Debt"
+    if trigger == "OK":
+        corp._check_quarter_end()
+    return trigger
+
+
+def run_scalar_reference(n: int, days: int, seed=None):
+    """Play n scalar Corporations through the mirrored phases. Returns (metrics, outcomes)."""
+    master = GameRNG(seed)
+    metrics = {name: np.empty(n) for name in CHECK_METRICS}
+    outcomes = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        corp = Corporation(seed=master.spawn(i).seed)
+        for _ in range(days):
+            trigger = _scalar_update_day(corp)
+            if outcomes[i] == RUNNING and trigger in OUTCOMES:
+                outcomes[i] = OUTCOMES.index(trigger)
+        for name in CHECK_METRICS:
+            metrics[name][i] = getattr(corp, name)
+    return metrics, outcomes
+
+
+def check_equivalence(n: int = 2000, days: int = 365, seed=0, z: float = 4.0) -> tuple:
+    """
+    Compare aggregate statistics of the ensemble against scalar Corporations.
+    A metric passes when its two means agree within z standard errors.
+    Returns (passed: bool, report: str).
+    """
+    ensemble = CorporationEnsemble(n, seed=seed).run(days)
+    scalar_metrics, scalar_outcomes = run_scalar_reference(n, days, seed=seed)
+
+    lines = [f"Equivalence check: {n} games x {days} days (z={z})",
+             f"{'metric':<20}{'ensemble mean':>18}{'scalar mean':>18}{'z-score':>10}  result"]
+    passed = True
+    for name in CHECK_METRICS:
+        a, b = ensemble.metric(name), scalar_metrics[name]
+        stderr = np.sqrt(a.var() / n + b.var() / n)
+        diff = abs(a.mean() - b.mean())
+        score = diff / stderr if stderr > 0 else (0.0 if diff < 1e-9 * max(1.0, abs(b.mean())) else np.inf)
+        ok = score <= z
+        passed &= bool(ok)
+        lines.append(f"{name:<20}{a.mean():>18,.3f}{b.mean():>18,.3f}{score:>10.2f}  {'ok' if ok else 'MISMATCH'}")
+
+    lines.append(f"{'outcome':<20}{'ensemble rate':>18}{'scalar rate':>18}{'z-score':>10}  result")
+    for code, name in enumerate(OUTCOMES):
+        p_a = float((ensemble.outcome == code).mean())
+        p_b = float((scalar_outcomes == code).mean())
+        if p_a == 0 and p_b == 0:
+            continue
+        pooled = (p_a + p_b) / 2
+        stderr = np.sqrt(2 * pooled * (1 - pooled) / n)
+        score = abs(p_a - p_b) / stderr if stderr > 0 else 0.0
+        ok = score <= z
+        passed &= bool(ok)
+        lines.append(f"{name:<20}{p_a:>18.4f}{p_b:>18.4f}{score:>10.2f}  {'ok' if ok else 'MISMATCH'}")
+
+    return passed, "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ensemble",
+                                     description="Vectorized Monte Carlo runs of the core economy.")
+    parser.add_argument("--games", type=int, default=10000, help="games advanced in lockstep")
+    parser.add_argument("--days", type=int, default=1095, help="days to simulate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--check", action="store_true", help="compare against scalar Corporations")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        passed, report = check_equivalence(args.games, args.days, seed=args.seed)
+        print(report)
+        return 0 if passed else 1
+
+    ensemble = CorporationEnsemble(args.games, seed=args.seed).run(args.days)
+    print(f"{args.games} games x {args.days} days")
+    for name, count in ensemble.outcome_counts().items():
+        print(f"  {name:<22}{count:>8}  ({count / args.games:.2%})")
+    for name in CHECK_METRICS:
+        values = ensemble.metric(name)
+        print(f"  {name:<22}mean {values.mean():>18,.2f}   p10 {np.percentile(values, 10):>18,.2f}"
+              f"   p90 {np.percentile(values, 90):>18,.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
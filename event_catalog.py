@@ -0,0 +1,172 @@
+# event_catalog.py - Declarative inbox emails and random events
+"""
+The emails EmailSystem can send and the random popup events it can raise are
+data (event_catalog.json), not code. Each entry names the EmailSystem method
+that carries out each option, an optional eligibility condition and a weight.
+
+Loading compiles every condition to a predicate once. Picking an email
+filters the catalog down to the entries eligible for the company's current
+state and draws one with an alias table (one uniform draw, O(1)); the table
+for each combination of eligible entries is built once and reused.
+"""
+import json
+import operator
+import os
+import sys
+
+
+def _find_catalog_file(name="event_catalog.json"):
+    """
+    The catalog next to this module, else where a frozen build put its data
+    files: PyInstaller unpacks them to sys._MEIPASS, py2app copies them to
+    Resources/ (RESOURCEPATH) while the modules are imported from a zip.
+    """
+    directories = (os.path.dirname(os.path.abspath(__file__)),
+                   getattr(sys, "_MEIPASS", None), os.environ.get("RESOURCEPATH"))
+    for directory in directories:
+        if directory and os.path.isfile(os.path.join(directory, name)):
+            return os.path.join(directory, name)
+    return os.path.join(directories[0], name)  # Not found: let the open() error name the usual place
+
+
+CATALOG_FILE = _find_catalog_file()
+
+_OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+def compile_condition(spec):
+    """[attribute, operator, value] -> predicate(corp). None means always eligible."""
+    if spec is None:
+        return None
+    attr, op, value = spec
+    if op not in _OPERATORS:
+        raise ValueError(f"Unknown operator in catalog condition: {spec!r}")
+    compare = _OPERATORS[op]
+    read = operator.attrgetter(attr)
+    return lambda corp: compare(read(corp), value)
+
+
+class AliasTable:
+    """Walker/Vose alias table: weighted choice among n entries from one uniform draw."""
+
+    def __init__(self, weights):
+        n = len(weights)
+        if not n:
+            raise ValueError("AliasTable needs at least one weight")
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            self.prob[low] = scaled[low]
+            self.alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Whatever is left is 1.0 up to rounding and keeps prob 1.0
+
+    def __len__(self):
+        return len(self.prob)
+
+    def sample(self, u: float) -> int:
+        """Index for a uniform u in [0, 1): the integer part picks a column, the fraction a side."""
+        column = u * len(self.prob)
+        i = int(column)
+        return i if column - i < self.prob[i] else self.alias[i]
+
+    def draw(self, rng) -> int:
+        return self.sample(rng.random())
+
+
+class EmailTemplate:
+    """One catalog email. Every email of this kind shares these strings and its option list."""
+
+    __slots__ = ("id", "type", "weight", "condition", "sender", "subject", "body", "options")
+
+    def __init__(self, spec):
+        self.id = spec["id"]
+        self.type = spec.get("type", spec["id"])
+        self.weight = spec.get("weight", 1)
+        self.condition = compile_condition(spec.get("when"))
+        self.sender = spec["from"]
+        self.subject = spec["subject"]
+        self.body = spec["body"]
+        self.options = tuple((opt["text"], opt["action"]) for opt in spec["options"])
+
+    def bind(self, handler) -> list:
+        """The email's option list with each action resolved to a method of handler."""
+        return [{'text': text, 'impact': getattr(handler, action)} for text, action in self.options]
+
+
+class EventTemplate:
+    """One catalog random event (a decision popup)."""
+
+    __slots__ = ("id", "category", "weight", "title", "dialogue", "choices")
+
+    def __init__(self, spec):
+        self.id = spec["id"]
+        self.category = spec["category"]
+        self.weight = spec.get("weight", 1)
+        self.title = spec.get("title", f"{self.category.upper()} RANDOM EVENT")
+        self.dialogue = spec["dialogue"]
+        self.choices = tuple((c["text"], c["action"], c["risk"]) for c in spec["choices"])
+
+    def bind(self, handler) -> list:
+        """Popup choices as (text, action, risk) tuples with actions resolved on handler."""
+        return [(text, getattr(handler, action), risk) for text, action, risk in self.choices]
+
+
+class EventCatalog:
+    """Compiled catalog: email and event templates plus their sampling tables."""
+
+    def __init__(self, data: dict):
+        self.emails = [EmailTemplate(spec) for spec in data.get("emails", [])]
+        self.events = [EventTemplate(spec) for spec in data.get("random_events", [])]
+        self._conditional = [i for i, t in enumerate(self.emails) if t.condition is not None]
+        # Eligibility pattern (tuple of bools, one per conditional email) -> (template list, AliasTable)
+        self._email_tables = {}
+        self._event_table = AliasTable([t.weight for t in self.events]) if self.events else None
+
+    @classmethod
+    def load(cls, path: str = None) -> "EventCatalog":
+        with open(path or CATALOG_FILE, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _eligible_table(self, corp):
+        emails = self.emails
+        pattern = tuple(emails[i].condition(corp) for i in self._conditional)
+        entry = self._email_tables.get(pattern)
+        if entry is None:
+            blocked = {i for i, ok in zip(self._conditional, pattern) if not ok}
+            eligible = [t for i, t in enumerate(emails) if i not in blocked]
+            entry = (eligible, AliasTable([t.weight for t in eligible]) if eligible else None)
+            self._email_tables[pattern] = entry
+        return entry
+
+    def pick_email(self, corp, rng):
+        """A weighted draw among the emails eligible for corp right now (None if none are)."""
+        eligible, table = self._eligible_table(corp)
+        return eligible[table.draw(rng)] if table else None
+
+    def pick_event(self, rng):
+        return self.events[self._event_table.draw(rng)] if self._event_table else None
+
+
+_default_catalog = None
+
+
+def default_catalog() -> EventCatalog:
+    """The shipped catalog, loaded and compiled on first use."""
+    global _default_catalog
+    if _default_catalog is None:
+        _default_catalog = EventCatalog.load()
+    return _default_catalog
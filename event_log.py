@@ -0,0 +1,173 @@
+# event_log.py - Structured, lazily formatted game log
+"""
+Corporation.log and Corporation.automation_log keep compact records
+(day, event code, numeric args) in a ring buffer instead of pre-formatted
+strings. Text is only built when something iterates the log (the UI log
+panels, a save file) or asks for it explicitly, so fast-forward and batch
+runs skip the per-tick currency formatting entirely. Records can also be
+filtered by event code.
+"""
+from collections import deque, namedtuple
+
+# Event code -> str.format() template. Positional fields are the record's args;
+# {day} is the game day the record was written on.
+EVENT_FORMATS = {
+    "TEXT": "{0}",
+    "EMPLOYEE_WORK": "Day {day}: {0} ({1}) - {2}",
+    "EMPLOYEE_GROUP_WORK": "Day {day}: {0} employees on {1} - {2}",
+
+    # Daily tick
+    "DAY_BEGINS": "--- Day {day} Begins (Q{0}, Y{1}) ---",
+    "ACTION_POINTS_RESET": "Daily action points reset to {0}.",
+    "REVENUE_DAILY": "Revenue: ${0:,.0f} (Scen Mod: {1}x)",
+    "COSTS_DAILY": "Costs: ${0:,.0f} (Debt payment: ${1:,.0f})",
+    "PROFIT_CUSHION": "💡 Profit cushion applied: ${0:,.0f} rebate to ease losses",
+    "PROJECTS_DAILY": "Projects: Rev ${0:,.0f}, Cost ${1:,.0f}, Net ${2:+,.0f}",
+    "ACQUISITION_PROFITS": "Acquisition profits: ${0:,.0f} from {1} companies",
+    "COMPETITOR_ALERT": "⚠️ COMPETITOR ALERT: No marketing for {0} days. Customer base: {1:.1f}% → {2:.1f}%",
+    "RND_COST_SKIPPED": "WARNING: R&D Cost of ${0:,.0f} skipped due to insufficient cash.",
+    "TECH_COMPLETE_EFFICIENCY": "**TECH COMPLETE:** {0} unlocked! Permanent +{1:.0f}% {2} Efficiency.",
+    "TECH_COMPLETE_LEVEL": "**TECH COMPLETE:** {0} unlocked! Technology Level permanently increased by +{1:.1f}.",
+    "SCENARIO": "*** MARKET SCENARIO: {0} - {1} ***",
+    "CREDIT_DOWNGRADE": "⚠️ Credit rating DOWNGRADED: {0} → {1} (Stock price -{2:.0%})",
+    "CREDIT_UPGRADE": "✓ Credit rating UPGRADED: {0} → {1} (Stock price +{2:.0%})",
+    "EMERGENCY_BORROWING": "EMERGENCY BORROWING: ${0:,.0f}",
+    "FAST_FORWARD": "Fast-forwarded {0} days to Day {day}.",
+
+    # Projects
+    "PROJECT_STARTED": "🎯 Started project '{0}': ${1:.1f}M cash + ${2:.1f}M debt. Dev time: {3} days",
+    "PROJECT_FAILED": "⚠️ Project **{0}** development FAILED. Lost ${1:,.0f}",
+    "PROJECT_RND_BOOST": "Project '{0}' boosted R&D Efficiency by +1%",
+    "PROJECT_LAUNCHED": "✅ Project **{0}** launched! Quality: {1:.0f}/100, Tech +{2:.1f}",
+    "PROJECT_RETIRED": "Retired project: {0}. Total revenue: ${1:.1f}M",
+
+    # Milestones
+    "STOCK_MILESTONE": "🎉 MILESTONE: Stock price hit ${0}! Earned 5 Executive Points.",
+    "CUSTOMER_MILESTONE": "🎉 MILESTONE: Customer base hit {0}%! Earned 3 Executive Points.",
+    "EXEC_POINTS_EARNED": "✨ Earned {0} Executive Points! Total: {1}",
+    "REVENUE_MILESTONE": "📈 REVENUE MILESTONE: Quarterly revenue hit ${0:.0f}M! Stock surges!",
+    "MARKET_MILESTONE": "👥 MARKET MILESTONE: Reached {0}% customer base! Stock gains!",
+    "TECH_MILESTONE": "🔬 TECH MILESTONE: Technology level hit {0}! Market excited!",
+    "EARNINGS_CALL": "*** EARNINGS CALL COMPLETE. Analyst Rating: {0}. Stock Price: {1:+.0%} ***",
+
+    # Union
+    "UNION_DEMAND_ACCEPTED": "✅ Accepted union demand: {0}",
+    "UNION_COUNTER_ACCEPTED": "🤝 Counter-offer accepted: {0} at reduced terms.",
+    "UNION_DEMAND_IGNORED": "⚠️ Ignored union demand. Strike in {0} days if unresolved.",
+    "STRIKE": "🪧 STRIKE! Employees have walked out for {0} days. Massive productivity loss and reputation damage.",
+
+    # Player finance actions
+    "CORP_CARD": "Corp Card Used: ${0:,.0f} for {1}.",
+    "BORROWED": "Borrowed: ${0:,.0f}. Debt increased. Limit: ${1:,.0f}",
+    "REPAID": "Repaid: ${0:,.0f}. Debt decreased.",
+    "SHARES_ISSUED": "Issued {0:,.0f} shares for ${1:,.0f}.",
+    "SHARES_REPURCHASED": "Repurchased {0:,.0f} shares for ${1:,.0f}.",
+    "MA_ACQUISITION": "**M&A:** Acquisition for ${0:,.0f}. Metrics boosted.",
+    "MA_DIVESTITURE": "**M&A:** Divestiture of ${0:,.0f}.",
+    "FOCUS_SHIFTED": "**Action:** Focus shifted to {0}.",
+    "BUDGETS_ADJUSTED": "Department budgets adjusted. Cash {0}: ${1:,.0f}.",
+    "ACQUIRED": "Acquired {0} for ${1:,.0f} ({2}). -1 action point.",
+    "ACQUISITION_REJECTED": "Acquisition attempt for {0} rejected ({1}). -1 action point.",
+
+    # Employee automation results (nested inside EMPLOYEE_WORK records)
+    "WORK_EMAIL": "Cleared {0} emails from inbox",
+    "WORK_MARKETING": "Ran ${0:.1f}M {1} campaign, gained {2:.1f}% market share",
+    "WORK_OUTREACH": "Customer outreach calls: +{0:.1f}% customer base, +{1:.1f} reputation",
+    "WORK_RND": "R&D work on {0}: ${1:.0f}K spent, +{2:.1f} tech points",
+    "WORK_INNOVATION": "Innovation session: developed new tech, +{0:.1f} tech level",
+    "WORK_WELLNESS": "Wellness session run: CEO health +{0:.1f}, morale +{1:.1f}",
+    "WORK_BUDGET": "Budget reallocation: +${0:.1f}M to {1} department",
+    "WORK_CASH_MANAGEMENT": "Optimized expenses: saved ${0:.0f}K through process improvements",
+    "WORK_EFFICIENCY": "Streamlined operations: reduced daily costs by ${0:.0f}K",
+    "WORK_COST_REDUCTION": "Cost audit: eliminated wasteful spending, saved ${0:.0f}K",
+    "WORK_MORALE": "Organized team building event: +{0:.1f} employee morale",
+    "WORK_HIRING_SUPPORT": "Screened job candidates, improved employer brand (+{0:.1f} reputation)",
+    "WORK_PORTFOLIO_FULL": "Portfolio full: {0} projects active. Consider retiring mature ones.",
+    "WORK_PROJECT_LAUNCHED": "Launched project '{0}': {1}-day dev cycle, ${2:.1f}M investment",
+    "WORK_PROJECT_BLOCKED": "Project launch blocked: {0}",
+    "WORK_GROUP_TASKS": "{0} tasks completed",
+}
+
+
+def format_event(code: str, args: tuple, day=None) -> str:
+    """Render one event as the text the UI shows."""
+    template = EVENT_FORMATS.get(code)
+    if template is None:
+        return " ".join(str(a) for a in args)
+    return template.format(*args, day=day)
+
+
+class Event(namedtuple("Event", "code args")):
+    """An unformatted event that renders itself when converted to text (used as a nested arg)."""
+    __slots__ = ()
+
+    def __str__(self):
+        return format_event(self.code, self.args)
+
+
+# One log entry: the game day, an EVENT_FORMATS code and that code's args
+Record = namedtuple("Record", "day code args")
+
+
+class EventLog:
+    """
+    Ring buffer of Records. Iterating yields formatted strings, so code that
+    treated the old deque of strings (reversed(log), list(log), len(log)) keeps
+    working; record() is the allocation-light path used by the game loop.
+    """
+
+    def __init__(self, maxlen: int, owner=None):
+        self.records = deque(maxlen=maxlen)
+        self.owner = owner  # Object with a .day attribute (the Corporation); stamps each record
+
+    @property
+    def maxlen(self):
+        return self.records.maxlen
+
+    def _day(self):
+        return self.owner.day if self.owner is not None else 0
+
+    def copy(self, owner=None) -> "EventLog":
+        """Same records (they are immutable, so shared) in a new buffer stamped by owner."""
+        twin = EventLog(self.records.maxlen, owner)
+        twin.records.extend(self.records)
+        return twin
+
+    def record(self, code: str, *args):
+        """Store an event without formatting it."""
+        self.records.append(Record(self._day(), code, args))
+
+    def append(self, text):
+        """Store pre-formatted text (or an Event) - for messages with no numeric payload."""
+        self.records.append(Record(self._day(), "TEXT", (text,)))
+
+    def extend(self, lines):
+        for text in lines:
+            self.append(text)
+
+    def clear(self):
+        self.records.clear()
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        for r in self.records:
+            yield format_event(r.code, r.args, r.day)
+
+    def __reversed__(self):
+        for r in reversed(self.records):
+            yield format_event(r.code, r.args, r.day)
+
+    def filter(self, *codes, since_day=None):
+        """Records whose code is in `codes` (all records if none given), optionally from since_day on."""
+        for r in self.records:
+            if codes and r.code not in codes:
+                continue
+            if since_day is not None and r.day < since_day:
+                continue
+            yield r
+
+    def lines(self, *codes, since_day=None):
+        """Formatted text for the records matched by filter()."""
+        return [format_event(r.code, r.args, r.day) for r in self.filter(*codes, since_day=since_day)]
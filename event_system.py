@@ -1,17 +1,93 @@
 # event_system.py
-import random
+from functools import partial
+
 import config # Requires config.py to be in the same directory
+from event_catalog import default_catalog
+from inbox import Inbox
+from popups import PopupRegistry
 
 # --- Email System Class ---
 class EmailSystem:
-    def __init__(self, corp):
+    def __init__(self, corp, catalog=None):
         self.corp = corp
-        self.inbox = []
-        self.POPUP_EVENTS = {}
+        self.inbox = Inbox(owner=corp)  # Bounded, priority-ordered; repeats of a type coalesce
+        self.POPUP_EVENTS = PopupRegistry(owner=corp)  # Pending popups; resolved/stale ones are removed
+        # Email/event definitions (event_catalog.json); option lists are bound to this system on first use
+        self.catalog = catalog or default_catalog()
+        self._email_options = {}
+        self._event_choices = {}
         # Coaching emails can be toggled from UI settings
         self.coaching_enabled = True
         self._initialize_starting_email()
 
+    # --- COPYING / PICKLING ---
+    def _rebind(self, action, twin):
+        """action (an email option or popup choice callable) re-targeted from this system to twin."""
+        if getattr(action, '__self__', None) is self:
+            return getattr(twin, action.__name__)
+        if isinstance(action, partial) and getattr(action.func, '__self__', None) is self:
+            return partial(getattr(twin, action.func.__name__), *action.args, **action.keywords)
+        if isinstance(action, tuple):  # Conditional choice: (Condition, Success_Action, Failure_Action)
+            return tuple(self._rebind(part, twin) for part in action)
+        return action
+
+    def fork(self, corp) -> "EmailSystem":
+        """Copy for a forked Corporation: same inbox and pending popups, every action bound to the copy."""
+        twin = EmailSystem.__new__(EmailSystem)
+        twin.__dict__.update(self.__dict__)
+        twin.corp = corp
+        twin._email_options = {}
+        twin._event_choices = {}
+
+        rebound = {}  # id(option list) -> rebound list; emails of one kind share theirs
+
+        def copy_email(email):
+            email = dict(email)
+            options = email.get('options')
+            if options is not None:
+                twin_options = rebound.get(id(options))
+                if twin_options is None:
+                    twin_options = rebound[id(options)] = [
+                        {**option, 'impact': self._rebind(option.get('impact'), twin)} for option in options]
+                email['options'] = twin_options
+            return email
+
+        def copy_popup(data):
+            data = dict(data)
+            if 'choices' in data:
+                data['choices'] = [(text, self._rebind(action, twin), risk) for text, action, risk in data['choices']]
+            return data
+
+        twin.inbox = self.inbox.copy(owner=corp, copy_email=copy_email)
+        twin.POPUP_EVENTS = self.POPUP_EVENTS.copy(owner=corp, copy_data=copy_popup)
+        return twin
+
+    def __getstate__(self):
+        # The shipped catalog (compiled conditions) and the option tables bound from it are restored on load
+        state = self.__dict__.copy()
+        del state['_email_options'], state['_event_choices']
+        if state['catalog'] is default_catalog():
+            state['catalog'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.catalog = self.catalog or default_catalog()
+        self._email_options = {}
+        self._event_choices = {}
+
+    def _bound_options(self, template) -> list:
+        options = self._email_options.get(template.id)
+        if options is None:
+            options = self._email_options[template.id] = template.bind(self)
+        return options
+
+    def _bound_choices(self, template) -> list:
+        choices = self._event_choices.get(template.id)
+        if choices is None:
+            choices = self._event_choices[template.id] = template.bind(self)
+        return choices
+
     def get_safe_option_index(self, email: dict):
         """Pick a conservative option for auto-processing emails.
         Prefers 'Acknowledge', 'Ignore', 'Low Risk', or 'Neutral'. Falls back to first option.
@@ -69,14 +145,14 @@ class EmailSystem:
 
     def action_approve_marketing(self, *args):
         """Action for an email to approve a marketing campaign."""
-        cost = random.randint(200_000, 1_000_000)
+        cost = self.corp.rng.events.randint(200_000, 1_000_000)
         if not self.corp.can_afford_action('Marketing', cost):
             remaining = self.corp.get_budget_remaining('Marketing')
             return f"Action failed: Insufficient Marketing budget. Need ${cost:,.0f}, but only ${remaining:,.0f} remaining this year."
         
         self.corp.spend_from_budget('Marketing', cost)
         self.corp.cash -= cost
-        self.corp.customer_base = min(100, self.corp.customer_base + random.randint(3, 8))
+        self.corp.customer_base = min(100, self.corp.customer_base + self.corp.rng.events.randint(3, 8))
         self.corp.employee_morale = min(100, self.corp.employee_morale + 5)
         self.corp.log.append(f"Approved a marketing campaign costing ${cost:,.0f}.")
         return "Campaign approved and launched. Customer Base increased."
@@ -107,7 +183,7 @@ class EmailSystem:
         return "Lawsuit settled. Reputations takes a minor hit."
 
     def action_fight_lawsuit(self, email_system):
-        if random.random() < 0.6: # 60% chance to lose
+        if self.corp.rng.events.random() < 0.6: # 60% chance to lose
             email_system.corp.reputation = max(10, email_system.corp.reputation - 20)
             email_system.corp.stock_price *= 0.85
             email_system.corp.log.append("CATASTROPHIC FAILURE: Lost the case and massive reputation hit.")
@@ -304,7 +380,7 @@ class EmailSystem:
 
     def action_negotiate_partnership(self, *args):
         """Action to negotiate partnership terms."""
-        if random.random() < 0.6:  # 60% chance of success
+        if self.corp.rng.events.random() < 0.6:  # 60% chance of success
             self.corp.customer_base = min(100, self.corp.customer_base + 15)
             self.corp.log.append("Negotiated better partnership terms. Deal improved.")
             return "Negotiation successful. Better terms achieved."
@@ -347,7 +423,7 @@ class EmailSystem:
 
     def action_silent_monitor(self, *args):
         """Action to silently monitor security threat."""
-        if random.random() < 0.4:  # 40% chance breach becomes public
+        if self.corp.rng.events.random() < 0.4:  # 40% chance breach becomes public
             self.corp.reputation = max(10, self.corp.reputation - 25)
             self.corp.stock_price *= 0.8
             self.corp.log.append("CATASTROPHIC: Security breach exposed publicly. Massive reputation and stock damage.")
@@ -390,200 +466,83 @@ class EmailSystem:
         self.corp.log.append("Delayed Asian market expansion. Competitors may move first.")
         return "Expansion delayed. Competitive risk increases."
 
+    def action_ignore_health_alert(self, *args):
+        return "Ignored alert. Health risks persist."
+
+    # --- Random event choices (see 'random_events' in event_catalog.json) ---
+    def action_amplify_viral_buzz(self, *args):
+        cost = 400_000
+        if self.corp.cash < cost:
+            self.corp.log.append("Action failed: Insufficient cash for follow-up investment.")
+            return "Action failed: Insufficient cash. Missed opportunity."
+        
+        self.corp.cash -= cost
+        self.corp.technology_level = min(100, self.corp.technology_level + 5)
+        self.corp.reputation = min(100, self.corp.reputation + 5)
+        self.corp.log.append("**EVENT:** Viral R&D capitalized. Technology and Reputation boosted.")
+        return "SUCCESS: Invested to amplify the buzz. Massive Technology boost achieved."
+
+    def action_ride_viral_wave(self, *args):
+        self.corp.technology_level = min(100, self.corp.technology_level + 1)
+        self.corp.reputation = min(100, self.corp.reputation + 2)
+        self.corp.log.append("**EVENT:** Viral recognition noted, minimal action taken.")
+        return "NEUTRAL: The wave passes, but we gained a small tech advantage."
+
+    def action_hire_replacement_cmo(self, *args):
+        cost = 10_000_000
+        if self.corp.cash < cost:
+            self.corp.log.append("Action failed: Insufficient cash for top-tier replacement.")
+            return "Action failed: Insufficient cash. Marketing efficiency drops further."
+            
+        self.corp.cash -= cost
+        self.corp.dept_efficiency['Marketing'] = max(20, self.corp.dept_efficiency['Marketing'] - 5) 
+        self.corp.log.append(f"**EVENT:** Hired expensive replacement. Marketing efficiency stabilized at a small cost.")
+        return "RISK MITIGATED: Replacement hired. Marketing efficiency stabilized but at a huge cost."
+
+    def action_promote_from_within(self, *args):
+        self.corp.employee_morale = min(100, self.corp.employee_morale + 10) 
+        self.corp.dept_efficiency['Marketing'] = max(0, self.corp.dept_efficiency['Marketing'] - 15) 
+        self.corp.log.append("**EVENT:** Promoted internally. Morale up, but Marketing efficiency tanks.")
+        return "RISK HIGH: Internal promotion done. Major drop in Marketing Efficiency, but Morale is high."
+
+    def action_accept_license_fee(self, *args):
+        cost_increase = 2_000_000
+        if self.corp.cash < cost_increase:
+            self.corp.log.append("Action failed: Cannot afford the new fee.")
+            return "Action failed: Cannot afford. Operations Efficiency drops significantly."
+        
+        self.corp.cash -= cost_increase
+        self.corp.log.append(f"**EVENT:** Accepted the new licensing fee of ${cost_increase:,.0f}.")
+        return "NEUTRAL: Fee accepted. Operations are stable, but Cash is reduced."
+
+    def action_migrate_systems(self, *args):
+        # Temporary hit to efficiency for the migration process
+        self.corp.dept_efficiency['Operations'] = max(0, self.corp.dept_efficiency['Operations'] - 20)
+        self.corp.log.append("**EVENT:** Initiated system migration. Operations efficiency severely reduced for now.")
+        return "RISK: Initiated a system migration. Massive temporary Operations Efficiency hit, but no immediate cash cost."
+
     def _generate_email(self):
-        """Generates 2-3 new emails per day based on the current game state."""
+        """Generates 2-3 new emails per day, drawn from the catalog emails eligible in the current game state."""
         # Generate 2-3 emails per day (70% chance for 2, 30% chance for 3)
-        num_emails = 2 if random.random() < 0.7 else 3
+        num_emails = 2 if self.corp.rng.events.random() < 0.7 else 3
         
         for _ in range(num_emails):
             # 70% chance to generate an email each iteration
-            if random.random() > 0.7:
+            if self.corp.rng.events.random() > 0.7:
                 continue
 
-            email_type = random.choice([
-                'marketing_request', 'reputation_crisis', 'ceo_health_warning',
-                'investor_meeting', 'employee_complaint', 'competitor_threat',
-                'tech_upgrade', 'regulatory_issue', 'media_interview',
-                'talent_acquisition', 'product_recall', 'partnership_offer',
-                'shareholder_activist', 'cybersecurity_breach', 'expansion_opportunity'
-            ])
-
-            if email_type == 'marketing_request':
-                email = {
-                    'from': 'CMO',
-                    'subject': 'URGENT: Approve Q3 Marketing Campaign',
-                    'body': "Our competitor is gaining ground. We must launch this aggressive $1M-$5M marketing campaign immediately to maintain market share.",
-                    'options': [
-                        {'text': 'Approve Campaign (High Risk/High Cost)', 'impact': self.action_approve_marketing},
-                        {'text': 'Reject Campaign (Low Risk/Morale Hit)', 'impact': self.action_reject_marketing}
-                    ],
-                    'type': 'marketing_request'
-                }
-            elif email_type == 'ceo_health_warning' and self.corp.ceo_health < 50:
-                email = {
-                    'from': 'Self-reflection System',
-                    'subject': 'STATUS ALERT: CEO Health Warning',
-                    'body': "The system detects signs of burnout. A break may be necessary to maintain peak performance.",
-                    'options': [
-                        {'text': 'Take a mandatory 3-day break (Reputation/Health)', 'impact': self.action_take_a_break},
-                        {'text': 'Ignore Alert (Risk Health/Board Confidence)', 'impact': lambda *args: "Ignored alert. Health risks persist."}
-                    ],
-                    'type': 'ceo_health_warning'
-                }
-            elif email_type == 'reputation_crisis' and self.corp.reputation < 50:
-                email = {
-                    'from': 'Legal Department',
-                    'subject': 'LAWSUIT THREAT: Patent Infringement Claim',
-                    'body': "We have been hit with a major patent infringement claim. We must decide whether to settle or fight in court.",
-                    'options': [
-                        {'text': 'Settle Immediately (Cost $20M)', 'impact': self.action_settle_lawsuit},
-                        {'text': 'Fight in Court (High Risk)', 'impact': self.action_fight_lawsuit}
-                    ],
-                    'type': 'lawsuit_threat'
-                }
-            elif email_type == 'investor_meeting':
-                email = {
-                    'from': 'Investor Relations',
-                    'subject': 'Major Investor Requesting Private Meeting',
-                    'body': "BlackRock Investment Group wants a private meeting to discuss our long-term strategy. They control 8% of our shares.",
-                    'options': [
-                        {'text': 'Accept Meeting (Time Investment, Board Confidence)', 'impact': self.action_investor_meeting},
-                        {'text': 'Decline Politely (Risk: Investor Relations)', 'impact': self.action_decline_investor}
-                    ],
-                    'type': 'investor_meeting'
-                }
-            elif email_type == 'employee_complaint':
-                email = {
-                    'from': 'HR Director',
-                    'subject': 'Employee Satisfaction Survey Results - URGENT',
-                    'body': "The latest survey shows 60% of employees are dissatisfied with compensation and work-life balance. We're at risk of mass exodus.",
-                    'options': [
-                        {'text': 'Increase HR Budget by $10M', 'impact': self.action_increase_hr_budget},
-                        {'text': 'Implement Non-Financial Benefits', 'impact': self.action_implement_benefits},
-                        {'text': 'Ignore Survey (High Risk)', 'impact': self.action_ignore_survey}
-                    ],
-                    'type': 'employee_complaint'
-                }
-            elif email_type == 'competitor_threat':
-                email = {
-                    'from': 'Market Intelligence',
-                    'subject': 'ALERT: Competitor Launching Disruptive Product',
-                    'body': "Our main competitor is launching a product next month that could make our flagship offering obsolete. We need to respond.",
-                    'options': [
-                        {'text': 'Fast-Track Counter Product ($25M)', 'impact': self.action_counter_product},
-                        {'text': 'Launch Aggressive PR Campaign ($5M)', 'impact': self.action_defensive_pr},
-                        {'text': 'Wait and Observe (Low Cost, High Risk)', 'impact': self.action_wait_observe}
-                    ],
-                    'type': 'competitor_threat'
-                }
-            elif email_type == 'tech_upgrade':
-                email = {
-                    'from': 'CTO',
-                    'subject': 'Critical Infrastructure Upgrade Required',
-                    'body': "Our current tech stack is 3 years old. Upgrading now will cost $15M but improve efficiency by 10%. Delaying risks system failures.",
-                    'options': [
-                        {'text': 'Approve Full Upgrade ($15M)', 'impact': self.action_full_tech_upgrade},
-                        {'text': 'Partial Upgrade ($7M)', 'impact': self.action_partial_tech_upgrade},
-                        {'text': 'Delay Until Next Quarter', 'impact': self.action_delay_upgrade}
-                    ],
-                    'type': 'tech_upgrade'
-                }
-            elif email_type == 'regulatory_issue':
-                email = {
-                    'from': 'Legal & Compliance',
-                    'subject': 'New Government Regulation Impacts Our Operations',
-                    'body': "New data privacy laws require immediate compliance. We can hire consultants ($8M) or build in-house capability (slower, cheaper).",
-                    'options': [
-                        {'text': 'Hire External Consultants ($8M, Fast)', 'impact': self.action_hire_consultants},
-                        {'text': 'Build In-House Team ($3M, Slow)', 'impact': self.action_build_compliance_team},
-                        {'text': 'Risk Non-Compliance (High Legal Risk)', 'impact': self.action_risk_compliance}
-                    ],
-                    'type': 'regulatory_issue'
-                }
-            elif email_type == 'media_interview':
-                email = {
-                    'from': 'Communications Director',
-                    'subject': 'Forbes Interview Request - Cover Story',
-                    'body': "Forbes wants to feature you on their cover for a story about innovative CEOs. Great PR opportunity but requires 2 days of your time.",
-                    'options': [
-                        {'text': 'Accept Interview (Reputation Boost, Health Cost)', 'impact': self.action_accept_interview},
-                        {'text': 'Decline (Safe, Missed Opportunity)', 'impact': self.action_decline_interview}
-                    ],
-                    'type': 'media_interview'
-                }
-            elif email_type == 'talent_acquisition':
-                email = {
-                    'from': 'Head of Talent',
-                    'subject': 'Opportunity: Hire Former Google VP of Engineering',
-                    'body': "A former Google VP is available and interested in joining us. Compensation: $2M/year + equity. Could accelerate our R&D significantly.",
-                    'options': [
-                        {'text': 'Make Offer ($2M/year, R&D Boost)', 'impact': self.action_hire_vp},
-                        {'text': 'Pass on Candidate (No Cost)', 'impact': self.action_pass_vp}
-                    ],
-                    'type': 'talent_acquisition'
-                }
-            elif email_type == 'product_recall':
-                email = {
-                    'from': 'Quality Assurance',
-                    'subject': 'CRITICAL: Safety Issue Detected in Product Line',
-                    'body': "QA has found a safety flaw affecting 50,000 units. We can recall immediately ($30M) or investigate further (risk exposure).",
-                    'options': [
-                        {'text': 'Immediate Recall ($30M, Reputation Protected)', 'impact': self.action_immediate_recall},
-                        {'text': 'Further Investigation (Delay Risk)', 'impact': self.action_investigate_recall},
-                        {'text': 'Quietly Fix in Next Version (High Risk)', 'impact': self.action_quiet_fix}
-                    ],
-                    'type': 'product_recall'
-                }
-            elif email_type == 'partnership_offer':
-                email = {
-                    'from': 'Business Development',
-                    'subject': 'Strategic Partnership Offer from Fortune 500 Company',
-                    'body': "A Fortune 500 company wants to partner with us on a new venture. Requires $10M investment but could open massive markets.",
-                    'options': [
-                        {'text': 'Accept Partnership ($10M Investment)', 'impact': self.action_accept_partnership},
-                        {'text': 'Negotiate Better Terms (Risk Deal)', 'impact': self.action_negotiate_partnership},
-                        {'text': 'Decline Partnership', 'impact': self.action_decline_partnership}
-                    ],
-                    'type': 'partnership_offer'
-                }
-            elif email_type == 'shareholder_activist':
-                email = {
-                    'from': 'Investor Relations',
-                    'subject': 'URGENT: Activist Shareholder Demanding Board Seat',
-                    'body': "An activist investor with 5% stake is demanding a board seat and pushing for aggressive cost-cutting. We must respond.",
-                    'options': [
-                        {'text': 'Negotiate Compromise (Board Confidence Risk)', 'impact': self.action_negotiate_activist},
-                        {'text': 'Resist Demands (Legal Costs, PR Risk)', 'impact': self.action_resist_activist},
-                        {'text': 'Offer Board Seat (Control Risk)', 'impact': self.action_offer_board_seat}
-                    ],
-                    'type': 'shareholder_activist'
-                }
-            elif email_type == 'cybersecurity_breach':
-                email = {
-                    'from': 'Chief Information Security Officer',
-                    'subject': 'URGENT: Potential Security Breach Detected',
-                    'body': "Our systems detected unusual activity. We can shut down systems for investigation (operations halt) or monitor silently (risk exposure).",
-                    'options': [
-                        {'text': 'Emergency Shutdown ($5M Lost Revenue)', 'impact': self.action_emergency_shutdown},
-                        {'text': 'Silent Monitoring (High Risk)', 'impact': self.action_silent_monitor},
-                        {'text': 'Hire External Security Firm ($3M)', 'impact': self.action_hire_security}
-                    ],
-                    'type': 'cybersecurity_breach'
-                }
-            elif email_type == 'expansion_opportunity':
-                email = {
-                    'from': 'VP of Strategy',
-                    'subject': 'Market Expansion: Enter Asian Markets Now?',
-                    'body': "Asian markets are booming. Entering now requires $50M investment but could triple our customer base in 2 years.",
-                    'options': [
-                        {'text': 'Full Expansion ($50M Investment)', 'impact': self.action_full_expansion},
-                        {'text': 'Pilot Program ($10M Test)', 'impact': self.action_pilot_expansion},
-                        {'text': 'Delay Expansion (Safe)', 'impact': self.action_delay_expansion}
-                    ],
-                    'type': 'expansion_opportunity'
-                }
-            else:
-                continue # No relevant email generated for this iteration
+            template = self.catalog.pick_email(self.corp, self.corp.rng.events)
+            if template is None:
+                continue # Nothing eligible in the company's current state
+
+            # Emails of one kind share their strings and option list; the inbox adds id/day/count
+            email = {
+                'from': template.sender,
+                'subject': template.subject,
+                'body': template.body,
+                'options': self._bound_options(template),
+                'type': template.type
+            }
 
             self.inbox.append(email)
 
@@ -592,7 +551,7 @@ class EmailSystem:
         event_id = None
         
         # Board Confidence Drop
-        if self.corp.board_confidence < 30 and self.corp.day % 10 == 0:
+        if self.corp.board_confidence < 30 and 'board_review' in self.corp.due_events:
             dialogue = "The Board of Directors is losing patience. You must take an action that demonstrates leadership."
             self.POPUP_EVENTS['MANDATORY_BOARD'] = {
                 'category': 'MANDATORY_ACTION',
@@ -603,7 +562,7 @@ class EmailSystem:
             event_id = 'MANDATORY_BOARD'
             
         # Cash Low
-        elif self.corp.cash < 50_000_000 and self.corp.day % 5 == 0:
+        elif self.corp.cash < 50_000_000 and 'cash_review' in self.corp.due_events:
             dialogue = "Cash reserves are dangerously low. You must find a way to raise capital or cut costs immediately."
             self.POPUP_EVENTS['MANDATORY_CASH'] = {
                 'category': 'MANDATORY_ACTION',
@@ -614,155 +573,61 @@ class EmailSystem:
             event_id = 'MANDATORY_CASH'
         
         # Critical Reputation Crisis (This acts like a mandatory crisis decision)
-        elif self.corp.reputation < 20 and self.corp.day % 7 == 0:
+        elif self.corp.reputation < 20 and 'reputation_review' in self.corp.due_events:
             event_id = 'CRISIS_REPUTATION'
             dialogue = "An external disaster has completely shattered public trust. You must make a public statement."
             
-            def choice_apologize_donate(email_system):
-                cost = 2_000_000
-                if email_system.corp.cash < cost:
-                    email_system.corp.log.append("Action failed: Cannot afford the donation.")
-                    return "Action failed: Cannot afford the public action. Reputation suffers more."
-                email_system.corp.cash -= cost
-                email_system.corp.reputation = min(100, email_system.corp.reputation + 15)
-                email_system.corp.board_confidence = max(0, email_system.corp.board_confidence - 5)
-                email_system.corp.log.append("CRISIS ACTION: Apology and donation made. Reputation slowly recovers.")
-                return "Apology and donation made. Reputation slowly recovers."
-
-            def choice_deny_everything(email_system):
-                email_system.corp.reputation = max(0, email_system.corp.reputation - 25)
-                email_system.corp.board_confidence = max(0, email_system.corp.board_confidence - 10)
-                email_system.corp.log.append("CRISIS ACTION: Denied everything. Massive further reputation loss.")
-                return "Denial issued. Total collapse of public trust."
-
             self.POPUP_EVENTS[event_id] = {
                 'category': 'BAD_DECISION', # Type that triggers the decision popup
                 'dialogue': dialogue,
                 'choices': [
-                    (f"Public Apology & Donate $2M (High Cost, Rep. Gain)", choice_apologize_donate, "RISK_LOW"),
-                    ("Deny All Responsibility (No Cost, Huge Rep. Loss)", choice_deny_everything, "RISK_HIGH")
+                    (f"Public Apology & Donate $2M (High Cost, Rep. Gain)", self.action_crisis_apologize_donate, "RISK_LOW"),
+                    ("Deny All Responsibility (No Cost, Huge Rep. Loss)", self.action_crisis_deny_everything, "RISK_HIGH")
                 ],
                 'title': 'GLOBAL REPUTATION CRISIS'
             }
         
         return event_id
 
+    def action_crisis_apologize_donate(self, *args):
+        cost = 2_000_000
+        if self.corp.cash < cost:
+            self.corp.log.append("Action failed: Cannot afford the donation.")
+            return "Action failed: Cannot afford the public action. Reputation suffers more."
+        self.corp.cash -= cost
+        self.corp.reputation = min(100, self.corp.reputation + 15)
+        self.corp.board_confidence = max(0, self.corp.board_confidence - 5)
+        self.corp.log.append("CRISIS ACTION: Apology and donation made. Reputation slowly recovers.")
+        return "Apology and donation made. Reputation slowly recovers."
+
+    def action_crisis_deny_everything(self, *args):
+        self.corp.reputation = max(0, self.corp.reputation - 25)
+        self.corp.board_confidence = max(0, self.corp.board_confidence - 10)
+        self.corp.log.append("CRISIS ACTION: Denied everything. Massive further reputation loss.")
+        return "Denial issued. Total collapse of public trust."
+
     # --- NEW: Random Event Logic ---
     def _generate_random_event(self):
         """
-        Generates a random event based on the specified probabilities:
-        10% chance overall. If occurs: 10% Good, 10% Bad, 80% Neutral.
+        Generates a random event: 10% chance overall. Which event is drawn by
+        catalog weight (shipped: 10% Good, 10% Bad, 80% Neutral).
         
         Returns the event_id if an event is generated, otherwise None.
         """
         # 10% chance of an event happening
-        if random.random() > 0.10: 
+        if self.corp.rng.events.random() > 0.10: 
             return None 
         
-        event_roll = random.random()
-        event_id = f"RANDOM_DAY_{self.corp.day}_{random.randint(1000, 9999)}"
-
-        # --- 10% GOOD EVENT: The Viral Campaign (0.0 to 0.10) ---
-        if event_roll < 0.10: 
-            dialogue = (
-                "Overnight, a demo clip from our R&D showcase hit the front page of every major tech blog. "
-                "Analysts are speculating we’re the next platform leader, and inbound partnership emails are piling up. "
-                "We can either pour fuel on the fire or ride the wave more conservatively."
-            )
-            
-            def choice_invest_more(email_system):
-                cost = 400_000
-                if email_system.corp.cash < cost:
-                    email_system.corp.log.append("Action failed: Insufficient cash for follow-up investment.")
-                    return "Action failed: Insufficient cash. Missed opportunity."
-                
-                email_system.corp.cash -= cost
-                email_system.corp.technology_level = min(100, email_system.corp.technology_level + 5)
-                email_system.corp.reputation = min(100, email_system.corp.reputation + 5)
-                email_system.corp.log.append("**EVENT:** Viral R&D capitalized. Technology and Reputation boosted.")
-                return "SUCCESS: Invested to amplify the buzz. Massive Technology boost achieved."
-
-            def choice_stay_course(email_system):
-                email_system.corp.technology_level = min(100, email_system.corp.technology_level + 1)
-                email_system.corp.reputation = min(100, email_system.corp.reputation + 2)
-                email_system.corp.log.append("**EVENT:** Viral recognition noted, minimal action taken.")
-                return "NEUTRAL: The wave passes, but we gained a small tech advantage."
-            
-            choices = [
-                ("Invest $400K to Amplify (High Gain)", choice_invest_more, "GAIN_HIGH"),
-                ("Stay the Course (Low Gain)", choice_stay_course, "GAIN_LOW")
-            ]
-            
-            category = 'GOOD'
-
-        # --- 10% BAD EVENT: Executive Resignation (0.10 to 0.20) ---
-        elif event_roll < 0.20:
-            dialogue = (
-                "Late last night, our star CMO abruptly resigned and surfaced at a rival—taking two senior managers with them. "
-                "Campaigns are mid-flight, agency contracts are unsettled, and the marketing floor is rattled. "
-                "We need to decide whether to buy stability fast or lean on internal talent and accept turbulence."
-            )
-            
-            def choice_hire_pricy_replacement(email_system):
-                cost = 10_000_000
-                if email_system.corp.cash < cost:
-                    email_system.corp.log.append("Action failed: Insufficient cash for top-tier replacement.")
-                    return "Action failed: Insufficient cash. Marketing efficiency drops further."
-                    
-                email_system.corp.cash -= cost
-                email_system.corp.dept_efficiency['Marketing'] = max(20, email_system.corp.dept_efficiency['Marketing'] - 5) 
-                email_system.corp.log.append(f"**EVENT:** Hired expensive replacement. Marketing efficiency stabilized at a small cost.")
-                return "RISK MITIGATED: Replacement hired. Marketing efficiency stabilized but at a huge cost."
-
-            def choice_promote_from_within(email_system):
-                email_system.corp.employee_morale = min(100, email_system.corp.employee_morale + 10) 
-                email_system.corp.dept_efficiency['Marketing'] = max(0, email_system.corp.dept_efficiency['Marketing'] - 15) 
-                email_system.corp.log.append("**EVENT:** Promoted internally. Morale up, but Marketing efficiency tanks.")
-                return "RISK HIGH: Internal promotion done. Major drop in Marketing Efficiency, but Morale is high."
-
-            choices = [
-                (f"Hire Expensive Replacement (Cost: $10M, Minor Eff. Loss)", choice_hire_pricy_replacement, "RISK_LOW"),
-                ("Promote Internally (Morale Gain, Major Eff. Loss)", choice_promote_from_within, "RISK_HIGH")
-            ]
-            
-            category = 'BAD'
+        template = self.catalog.pick_event(self.corp.rng.events)
+        if template is None:
+            return None
+        event_id = f"RANDOM_DAY_{self.corp.day}_{self.corp.rng.events.randint(1000, 9999)}"
 
-        # --- 80% NEUTRAL EVENT: Software Licensing Conflict (0.20 to 1.00) ---
-        else:
-            dialogue = (
-                "Our core operations software vendor just invoked a surprise 30% price hike, effective next billing cycle. "
-                "Legal says the contract’s loophole makes it enforceable, but IT claims we could migrate in a quarter—with painful downtime. "
-                "Do we absorb the hit to keep systems stable, or rip the band-aid and migrate at the cost of efficiency?"
-            )
-            cost_increase = 2_000_000
-            
-            def choice_accept_fee(email_system):
-                if email_system.corp.cash < cost_increase:
-                    email_system.corp.log.append("Action failed: Cannot afford the new fee.")
-                    return "Action failed: Cannot afford. Operations Efficiency drops significantly."
-                
-                email_system.corp.cash -= cost_increase
-                email_system.corp.log.append(f"**EVENT:** Accepted the new licensing fee of ${cost_increase:,.0f}.")
-                return "NEUTRAL: Fee accepted. Operations are stable, but Cash is reduced."
-
-            def choice_migrate_systems(email_system):
-                # Temporary hit to efficiency for the migration process
-                email_system.corp.dept_efficiency['Operations'] = max(0, email_system.corp.dept_efficiency['Operations'] - 20)
-                email_system.corp.log.append("**EVENT:** Initiated system migration. Operations efficiency severely reduced for now.")
-                return "RISK: Initiated a system migration. Massive temporary Operations Efficiency hit, but no immediate cash cost."
-                
-            choices = [
-                (f"Accept New Fee (Cost: ${cost_increase:,.0f}, No Efficiency Change)", choice_accept_fee, "COST_HIGH"),
-                ("Initiate System Migration (No Immediate Cost, High Eff. Loss)", choice_migrate_systems, "EFFICIENCY_LOSS")
-            ]
-            
-            category = 'NEUTRAL'
-        
         self.POPUP_EVENTS[event_id] = {
-            'category': category,
-            'dialogue': dialogue,
-            'choices': choices,
-            'title': f'{category.upper()} RANDOM EVENT'
+            'category': template.category,
+            'dialogue': template.dialogue,
+            'choices': self._bound_choices(template),
+            'title': template.title
         }
         
         return event_id
@@ -777,14 +642,7 @@ class EmailSystem:
         if corp.cash < 200_000_000:
             title = "COACH: Cash Reserves Low"
             body = "Your cash reserves are low. Consider raising capital or cutting costs to avoid insolvency."
-            def apply_action(es):
-                # Try issuing debt / raise funds (game_core.manage_debt_equity handles details)
-                try:
-                    es.corp.manage_debt_equity('Issue_Debt', 200_000_000)
-                    es.corp.log.append("Coach Action: Issued debt to raise capital.")
-                    return "Issued debt to raise capital."
-                except Exception as e:
-                    return f"Coach action failed: {e}"
+            apply_action = self._coach_issue_debt
             explain = (
                 "Issuing debt provides liquidity now but increases interest expense; use cautiously.\n"
                 "Short-term: +Cash, higher interest costs.\n"
@@ -793,8 +651,7 @@ class EmailSystem:
         elif corp.reputation < 50:
             title = "COACH: Reputation Weakening"
             body = "Your public reputation is slipping. A PR campaign or settling minor issues can stabilize public trust."
-            def apply_action(es):
-                return es.action_defensive_pr()
+            apply_action = self.action_defensive_pr
             explain = (
                 "Reputation affects customer retention and stock performance.\n"
                 "Short-term: PR boosts public sentiment and customer base.\n"
@@ -803,8 +660,7 @@ class EmailSystem:
         elif corp.ceo_health < 60:
             title = "COACH: CEO Burnout Risk"
             body = "Your health is declining. Take a short break to recover — the board may be impatient but a healthy CEO performs better long-term."
-            def apply_action(es):
-                return es.action_take_a_break()
+            apply_action = self.action_take_a_break
             explain = (
                 "Rest improves cognitive function and long-term decision quality.\n"
                 "Short-term: health +, but board confidence dips slightly.\n"
@@ -813,12 +669,7 @@ class EmailSystem:
         elif corp.employee_morale < 55:
             title = "COACH: Employee Morale Low"
             body = "Employee morale is slipping. Consider increasing HR spending or non-financial benefits to avoid productivity loss."
-            def apply_action(es):
-                # Prefer benefits if cash constrained
-                if es.corp.cash > 5_000_000:
-                    return es.action_implement_benefits()
-                else:
-                    return es.action_increase_hr_budget()
+            apply_action = self._coach_lift_morale
             explain = (
                 "Employee morale impacts productivity, retention, and quality.\n"
                 "Short-term: morale + productivity lift.\n"
@@ -827,8 +678,7 @@ class EmailSystem:
         elif corp.technology_level < 45:
             title = "COACH: Technology Lagging"
             body = "Technology level is below industry expectations. Invest in upgrades or R&D to stay competitive."
-            def apply_action(es):
-                return es.action_partial_tech_upgrade()
+            apply_action = self.action_partial_tech_upgrade
             explain = (
                 "Technology investments raise efficiency and enable new products.\n"
                 "Short-term: cash spent, possible efficiency gains.\n"
@@ -837,13 +687,7 @@ class EmailSystem:
         elif corp.board_confidence < 55:
             title = "COACH: Board Confidence Low"
             body = "Board confidence is slipping. Consider a small PR move or targeted financial action to reassure stakeholders."
-            def apply_action(es):
-                try:
-                    es.corp.manage_debt_equity('Repurchase_Shares', 10_000_000)
-                    es.corp.log.append('Coach Action: Small share repurchase executed to support board confidence.')
-                    return 'Executed small share repurchase.'
-                except Exception as e:
-                    return f"Coach action failed: {e}"
+            apply_action = self._coach_repurchase_shares
             explain = (
                 "Board confidence impacts strategic freedom and investor perception.\n"
                 "Short-term: small repurchases or PR restore confidence.\n"
@@ -852,9 +696,8 @@ class EmailSystem:
         else:
             title = "COACH: Growth Suggestion"
             body = "Your company is in generally good shape. Consider investing in R&D or growth experiments to accelerate progress."
-            def apply_action(es):
-                # gentle nudge: partial tech upgrade as growth nudge
-                return es.action_partial_tech_upgrade()
+            # gentle nudge: partial tech upgrade as growth nudge
+            apply_action = self.action_partial_tech_upgrade
             explain = (
                 "Regular, modest investments compound into significant capability over time.\n"
                 "Short-term: small efficiency gains.\n"
@@ -866,11 +709,12 @@ class EmailSystem:
             'from': 'Advisor Bot',
             'subject': title,
             'body': body + "\n\n(Advisor Tip: choose 'Explain why' to learn more or 'Auto-apply' to enact.)",
+            # Bound methods and partials of them (not closures), so the email can be copied and pickled
             'options': [
-                {'text': 'Auto-apply recommended action', 'impact': lambda es, _apply=apply_action: _apply(es)},
-                {'text': 'Explain why', 'impact': lambda es, _msg=explain: (es.corp.log.append(f"Advisor Explanation: {_msg}"), _msg)[1]},
-                {'text': 'Detailed Rationale', 'impact': lambda es, _title=title, _body=body, _exp=explain: (es.corp.log.append(f"Advisor Detailed Rationale - {_title}: {_body}\n{_exp}"), f"Detailed rationale logged.")},
-                {'text': 'Ignore advice', 'impact': lambda es: "Ignored advisor guidance."}
+                {'text': 'Auto-apply recommended action', 'impact': apply_action},
+                {'text': 'Explain why', 'impact': partial(self._coach_note, f"Advisor Explanation: {explain}", explain)},
+                {'text': 'Detailed Rationale', 'impact': partial(self._coach_note, f"Advisor Detailed Rationale - {title}: {body}\n{explain}", "Detailed rationale logged.")},
+                {'text': 'Ignore advice', 'impact': partial(self._coach_note, None, "Ignored advisor guidance.")}
             ],
             'type': 'coaching'
         }
@@ -879,13 +723,45 @@ class EmailSystem:
         if not self.inbox or self.inbox[0].get('type') != 'coaching' or self.inbox[0].get('subject') != coaching_email['subject']:
             self.inbox.insert(0, coaching_email)
 
+    # Coaching actions (called with the email system as their argument, like every email option)
+    def _coach_issue_debt(self, *args):
+        # Try issuing debt / raise funds (game_core.manage_debt_equity handles details)
+        try:
+            self.corp.manage_debt_equity('Issue_Debt', 200_000_000)
+            self.corp.log.append("Coach Action: Issued debt to raise capital.")
+            return "Issued debt to raise capital."
+        except Exception as e:
+            return f"Coach action failed: {e}"
+
+    def _coach_lift_morale(self, *args):
+        # Prefer benefits if cash constrained
+        if self.corp.cash > 5_000_000:
+            return self.action_implement_benefits()
+        else:
+            return self.action_increase_hr_budget()
+
+    def _coach_repurchase_shares(self, *args):
+        try:
+            self.corp.manage_debt_equity('Repurchase_Shares', 10_000_000)
+            self.corp.log.append('Coach Action: Small share repurchase executed to support board confidence.')
+            return 'Executed small share repurchase.'
+        except Exception as e:
+            return f"Coach action failed: {e}"
+
+    def _coach_note(self, log_text, result, *args):
+        if log_text is not None:
+            self.corp.log.append(log_text)
+        return result
+
     # The check_for_events method is the public interface used by game_core.py
     def check_for_events(self):
         """Called daily to check for new emails, mandatory popups, and random events."""
+        self.inbox.expire(self.corp.day)
+        self.POPUP_EVENTS.expire(self.corp.day)
         self._generate_email()
         # Generate one coaching email per day (non-duplicating) if coaching is enabled
         try:
-            if getattr(self, 'coaching_enabled', True):
+            if getattr(self, 'coaching_enabled', True) and not getattr(self.corp, 'fast_forward', False):
                 self._generate_coaching_email()
         except Exception:
             # Never let coaching generation block the day advance
@@ -916,4 +792,26 @@ class EmailSystem:
         except IndexError:
             return "Error: Email or option index was invalid."
         except Exception as e:
-            return f"Action failed due to an error: {e}"
\ No newline at end of file
+            return f"Action failed due to an error: {e}"
+
+    def resolve_popup_choice(self, event_id, choice_index=None):
+        """
+        Carry out choice `choice_index` of a pending popup (None just dismisses it)
+        and resolve the popup. Returns (succeeded, message); succeeded is False
+        when a conditional choice's condition did not hold.
+        """
+        event_data = self.POPUP_EVENTS.get(event_id)
+        if event_data is None or choice_index is None:
+            self.POPUP_EVENTS.resolve(event_id)
+            return True, ""
+        try:
+            _text, action_func, _risk = event_data.get('choices', [])[choice_index]
+            # Conditional action: (Condition, Success_Action, Failure_Action)
+            if isinstance(action_func, tuple) and len(action_func) == 3:
+                condition, success_action, failure_action = action_func
+                if condition:
+                    return True, success_action(self)
+                return False, failure_action(self)
+            return True, action_func(self)
+        finally:
+            self.POPUP_EVENTS.resolve(event_id)
@@ -0,0 +1,191 @@
+# inbox.py - Bounded priority inbox for EmailSystem
+"""
+Emails are kept in one insertion-ordered bucket per priority level
+(config.EMAIL_PRIORITIES; 0 is the most important). Adding, removing by id
+and reading/popping the front are O(1); positional access walks the few
+buckets and then the one bucket it lands in.
+
+    * A repeat of an email type that is already waiting is folded into the
+      waiting email: its 'count' goes up and it moves to the back of its
+      bucket instead of a second copy being queued.
+    * Low-priority mail older than config.INBOX_EXPIRY_DAYS is expired.
+    * Past config.INBOX_CAPACITY, the oldest least important email is
+      evicted (or the new one is dropped if it matters even less).
+
+Iteration and indexing follow priority order, then arrival order, so the
+inbox still reads like the list it replaces: len(inbox), inbox[0],
+inbox.pop(i), for email in inbox.
+"""
+from collections import OrderedDict
+from itertools import chain, islice
+
+import config
+
+# Types that never coalesce: coaching has its own subject-based de-duplication
+NON_COALESCING_TYPES = {'coaching'}
+
+
+class Inbox:
+    """Priority-ordered, capacity-bounded list of email dicts."""
+
+    def __init__(self, owner=None, capacity: int = None, expiry_days: int = None):
+        self.owner = owner  # Object with a .day attribute (the Corporation); stamps each email
+        self.capacity = capacity or config.INBOX_CAPACITY
+        self.expiry_days = expiry_days or config.INBOX_EXPIRY_DAYS
+        levels = max(config.EMAIL_DEFAULT_PRIORITY, *config.EMAIL_PRIORITIES.values()) + 1
+        self._buckets = [OrderedDict() for _ in range(levels)]
+        self._by_type = {}  # coalescing type -> id of the waiting email of that type
+        self._size = 0
+        self._next_id = 0
+        # Lifetime counters (shown by the profiler / batch reports)
+        self.coalesced = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def _day(self):
+        return self.owner.day if self.owner is not None else 0
+
+    @staticmethod
+    def priority_of(email) -> int:
+        return config.EMAIL_PRIORITIES.get(email.get('type'), config.EMAIL_DEFAULT_PRIORITY)
+
+    # --- ADDING ---
+    def add(self, email: dict, front: bool = False):
+        """
+        Queue an email. Returns the email now holding it (the existing one if it
+        was coalesced) or None if the inbox is full of more important mail.
+        """
+        kind = email.get('type')
+        existing_id = self._by_type.get(kind)
+        if existing_id is not None:
+            bucket = self._buckets[self.priority_of(email)]
+            waiting = bucket[existing_id]
+            waiting['count'] = waiting.get('count', 1) + 1
+            waiting['day'] = self._day()
+            bucket.move_to_end(existing_id, last=not front)
+            self.coalesced += 1
+            return waiting
+
+        priority = self.priority_of(email)
+        if self._size >= self.capacity:
+            victim_priority = self._least_important_level()
+            if victim_priority < priority:
+                self.evicted += 1
+                return None  # Everything waiting matters more than this email
+            self._remove_front(victim_priority)
+            self.evicted += 1
+
+        email_id = self._next_id
+        self._next_id += 1
+        email['id'] = email_id
+        email['day'] = self._day()
+        email.setdefault('count', 1)
+        bucket = self._buckets[priority]
+        bucket[email_id] = email
+        if front:
+            bucket.move_to_end(email_id, last=False)
+        if kind is not None and kind not in NON_COALESCING_TYPES:
+            self._by_type[kind] = email_id
+        self._size += 1
+        return email
+
+    def append(self, email: dict):
+        self.add(email)
+
+    def insert(self, index: int, email: dict):
+        """list.insert() stand-in: index 0 puts the email first within its priority, anything else last."""
+        self.add(email, front=(index == 0))
+
+    # --- REMOVING ---
+    def _forget(self, email):
+        if self._by_type.get(email.get('type')) == email['id']:
+            del self._by_type[email['type']]
+        self._size -= 1
+
+    def _remove_front(self, priority):
+        _email_id, email = self._buckets[priority].popitem(last=False)
+        self._forget(email)
+        return email
+
+    def _least_important_level(self):
+        for priority in range(len(self._buckets) - 1, -1, -1):
+            if self._buckets[priority]:
+                return priority
+        return 0
+
+    def remove(self, email: dict):
+        """Remove a specific email (O(1), by its id)."""
+        del self._buckets[self.priority_of(email)][email['id']]
+        self._forget(email)
+
+    def pop(self, index: int = 0) -> dict:
+        if index == 0 or index == -self._size:
+            for priority, bucket in enumerate(self._buckets):
+                if bucket:
+                    return self._remove_front(priority)
+            raise IndexError("pop from empty inbox")
+        email = self[index]
+        self.remove(email)
+        return email
+
+    def __delitem__(self, key):
+        doomed = self[key] if isinstance(key, slice) else [self[key]]
+        for email in doomed:
+            self.remove(email)
+
+    def clear(self):
+        for bucket in self._buckets:
+            bucket.clear()
+        self._by_type.clear()
+        self._size = 0
+
+    def copy(self, owner=None, copy_email=dict) -> "Inbox":
+        """Independent inbox for owner holding copy_email(email) of every waiting email."""
+        twin = Inbox.__new__(Inbox)
+        twin.__dict__.update(self.__dict__)
+        twin.owner = owner
+        twin._buckets = [OrderedDict((email_id, copy_email(email)) for email_id, email in bucket.items())
+                         for bucket in self._buckets]
+        twin._by_type = self._by_type.copy()
+        return twin
+
+    def expire(self, day: int = None) -> int:
+        """Drop low-priority mail not touched for expiry_days. Returns how many were dropped."""
+        day = self._day() if day is None else day
+        cutoff = day - self.expiry_days
+        dropped = 0
+        for priority in range(config.INBOX_EXPIRE_PRIORITY, len(self._buckets)):
+            bucket = self._buckets[priority]
+            # Buckets are in last-touched order, so stale mail sits at the front
+            while bucket and next(iter(bucket.values()))['day'] <= cutoff:
+                self._remove_front(priority)
+                dropped += 1
+        self.expired += dropped
+        return dropped
+
+    # --- LIST-LIKE ACCESS ---
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __iter__(self):
+        return chain.from_iterable(bucket.values() for bucket in self._buckets)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return list(self)[key]
+        if key < 0:
+            key += self._size
+        if not 0 <= key < self._size:
+            raise IndexError("inbox index out of range")
+        for bucket in self._buckets:
+            if key < len(bucket):
+                if key == 0:
+                    return next(iter(bucket.values()))
+                return next(islice(bucket.values(), key, None))
+            key -= len(bucket)
+
+    def __repr__(self):
+        return f"Inbox({self._size} emails, capacity={self.capacity})"
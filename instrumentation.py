@@ -0,0 +1,237 @@
+# instrumentation.py - Opt-in per-phase tick profiler
+"""
+Times every phase of Corporation.update_day and samples the sizes that grow
+over a game (inbox, projects, employees, pending popups, scheduled events),
+plus lifetime counters such as how many popups were created and expired.
+
+    from instrumentation import TickProfiler
+    profiler = TickProfiler.attach(corp)
+    ... play ...
+    print(profiler.report())
+    profiler.write_trace("trace.json")   # open in chrome://tracing or ui.perfetto.dev
+
+When no profiler is attached, update_day only pays one `is None` check per tick
+section; nothing in this module is imported by the game loop.
+"""
+import json
+import time
+
+_now_ns = time.perf_counter_ns
+
+
+# --- SIZE GAUGES ---
+# Module-level functions (not lambdas) so a Corporation with a profiler attached still pickles.
+def _inbox_size(corp):
+    return len(corp.email_system.inbox) if corp.email_system else 0
+
+
+def _popup_events_size(corp):
+    return len(corp.email_system.POPUP_EVENTS) if corp.email_system else 0
+
+
+def _project_count(corp):
+    return len(corp.projects)
+
+
+def _employee_count(corp):
+    return len(corp.employees)
+
+
+def _log_size(corp):
+    return len(corp.log)
+
+
+def _scheduled_count(corp):
+    return len(corp.scheduler)
+
+
+GAUGES = {
+    "inbox": _inbox_size,
+    "popup_events": _popup_events_size,
+    "projects": _project_count,
+    "employees": _employee_count,
+    "log": _log_size,
+    "scheduled": _scheduled_count,
+}
+
+
+# --- LIFETIME COUNTERS ---
+# Copied into TickProfiler.counters after every tick. popups_peak staying at or under
+# config.POPUP_MAX_PENDING while popups_created keeps climbing shows the registry is bounded.
+def _popup_counters(corp):
+    if not corp.email_system:
+        return {}
+    registry = corp.email_system.POPUP_EVENTS
+    return {
+        "popups_created": registry.created,
+        "popups_resolved": registry.resolved,
+        "popups_expired": registry.expired,
+        "popups_evicted": registry.evicted,
+        "popups_peak": registry.peak,
+    }
+
+
+COUNTER_SOURCES = [_popup_counters]
+
+
+class PhaseStats:
+    """Call count, total/max time and a log2 histogram of durations (in ns) for one phase."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * 64  # buckets[i] counts durations in [2**(i-1), 2**i) ns
+
+    def add(self, duration_ns: int):
+        self.calls += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.buckets[min(63, duration_ns.bit_length())] += 1
+
+    def percentile_ns(self, q: float) -> int:
+        """Upper bound of the histogram bucket holding the q-th percentile (0 < q <= 1)."""
+        if not self.calls:
+            return 0
+        target = q * self.calls
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return min(1 << i, self.max_ns)
+        return self.max_ns
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+class GaugeStats:
+    """Last, max and mean of a sampled size."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.samples = 0
+        self.total = 0
+        self.last = 0
+        self.max = 0
+
+    def add(self, value: int):
+        self.samples += 1
+        self.total += value
+        self.last = value
+        if value > self.max:
+            self.max = value
+
+
+class TickProfiler:
+    """Per-phase timings, size gauges and free-form counters for one Corporation."""
+
+    def __init__(self, trace_limit: int = 200000):
+        self.phases = {}
+        self.gauges = {name: GaugeStats(name) for name in GAUGES}
+        self.counters = {}
+        self.ticks = 0
+        # Chrome trace events, capped so a very long game cannot eat all memory
+        self.trace_limit = trace_limit
+        self.trace_events = []
+        self._origin_ns = _now_ns()
+        self._tick_start_ns = 0
+        self._tick_day = 0
+
+    @classmethod
+    def attach(cls, corp, **kwargs) -> "TickProfiler":
+        """Create a profiler and start profiling corp's update_day."""
+        profiler = cls(**kwargs)
+        corp.profiler = profiler
+        return profiler
+
+    @staticmethod
+    def detach(corp):
+        corp.profiler = None
+
+    # --- RECORDING (called from Corporation.update_day) ---
+    def begin_tick(self, corp):
+        self._tick_day = corp.day
+        for name, gauge in GAUGES.items():
+            self.gauges[name].add(gauge(corp))
+        if len(self.trace_events) < self.trace_limit:
+            self.trace_events.append({
+                "name": "sizes", "ph": "C", "pid": 1, "tid": 1,
+                "ts": (_now_ns() - self._origin_ns) / 1000,
+                "args": {name: g.last for name, g in self.gauges.items()},
+            })
+        self._tick_start_ns = _now_ns()
+
+    def end_tick(self, corp, trigger):
+        end = _now_ns()
+        self.ticks += 1
+        for source in COUNTER_SOURCES:
+            self.counters.update(source(corp))
+        self._record("update_day", self._tick_start_ns, end, {"day": self._tick_day, "trigger": trigger})
+
+    def time_phase(self, name: str, func):
+        """Call func() and record how long it took under `name`. Returns func's result."""
+        start = _now_ns()
+        result = func()
+        self._record(name, start, _now_ns())
+        return result
+
+    def count(self, name: str, n: int = 1):
+        """Bump a free-form counter (e.g. events expired, cache hits)."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def _record(self, name, start_ns, end_ns, args=None):
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats(name)
+        stats.add(end_ns - start_ns)
+        if len(self.trace_events) < self.trace_limit:
+            event = {
+                "name": name, "ph": "X", "pid": 1, "tid": 1,
+                "ts": (start_ns - self._origin_ns) / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+            }
+            if args:
+                event["args"] = args
+            self.trace_events.append(event)
+
+    # --- EXPORT ---
+    def report(self) -> str:
+        """Plain-text summary table, slowest phases first."""
+        lines = [f"Tick profile: {self.ticks} ticks",
+                 f"{'phase':<34}{'calls':>8}{'total ms':>11}{'mean us':>10}{'p50 us':>9}{'p99 us':>9}{'max us':>10}"]
+        for stats in sorted(self.phases.values(), key=lambda s: s.total_ns, reverse=True):
+            lines.append(f"{stats.name:<34}{stats.calls:>8}{stats.total_ns / 1e6:>11.2f}{stats.mean_ns / 1e3:>10.1f}"
+                         f"{stats.percentile_ns(0.5) / 1e3:>9.1f}{stats.percentile_ns(0.99) / 1e3:>9.1f}"
+                         f"{stats.max_ns / 1e3:>10.1f}")
+        lines.append("")
+        lines.append(f"{'size':<34}{'last':>8}{'max':>11}{'mean':>10}")
+        for gauge in self.gauges.values():
+            mean = gauge.total / gauge.samples if gauge.samples else 0
+            lines.append(f"{gauge.name:<34}{gauge.last:>8}{gauge.max:>11}{mean:>10.1f}")
+        if self.counters:
+            lines.append("")
+            lines.append(f"{'counter':<34}{'value':>8}")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:<34}{value:>8}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """Machine-readable summary (used by the benchmark harness)."""
+        return {
+            "ticks": self.ticks,
+            "phases": {s.name: {"calls": s.calls, "total_ns": s.total_ns, "max_ns": s.max_ns,
+                                "p50_ns": s.percentile_ns(0.5), "p99_ns": s.percentile_ns(0.99)}
+                       for s in self.phases.values()},
+            "gauges": {g.name: {"last": g.last, "max": g.max} for g in self.gauges.values()},
+            "counters": dict(self.counters),
+        }
+
+    def write_trace(self, path: str):
+        """Write a Chrome/Perfetto trace-event JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace_events, "displayTimeUnit": "ms",
+                       "otherData": {"ticks": self.ticks}}, f)
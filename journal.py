@@ -0,0 +1,219 @@
+# journal.py - Append-only daily journal in memory-mapped column files
+"""
+A DayJournal keeps the complete daily history of a game on disk instead of
+in RAM: one fixed-width row per finished day, with every column in its own
+memory-mapped file. Reading a column hands back a view of that file, so
+charts, exports and post-run analysis never copy a decade of data.
+
+    from journal import DayJournal
+    journal = DayJournal.attach(corp, "runs/campaign")   # a directory
+    ... play ...
+    cash = journal.column("cash")                        # np.memmap view, oldest day first
+    rivals = journal.column("competitor_prices")         # days x rivals
+    DayJournal.detach(corp)
+
+    DayJournal.open("runs/campaign").column("stock_price")   # read-only, after the run
+
+Layout: meta.json (format version, column dtypes and widths, row count) plus
+one raw <column>.bin file per column. Files grow CHUNK_DAYS rows at a time.
+meta.json is rewritten when the files grow and on flush()/close(); rows
+written after that are recovered on open from the day column (game days
+start at 1, so a 0 marks an unwritten row).
+"""
+import json
+import operator
+import os
+
+import numpy as np
+
+from game_core import ANALYST_RATING_INDEX, CREDIT_RATING_INDEX
+
+FORMAT_VERSION = 1
+CHUNK_DAYS = 365
+META_FILE = "meta.json"
+
+
+def _analyst_code(corp):
+    return ANALYST_RATING_INDEX.get(corp.analyst_rating, -1)
+
+
+def _credit_code(corp):
+    return CREDIT_RATING_INDEX.get(corp.credit_rating, -1)
+
+
+def _head_count(corp):
+    return len(corp.employees)
+
+
+# Scalar column -> (dtype, reader). Ratings are stored as their index in
+# config.ANALYST_RATINGS / CREDIT_RATING_ORDER (-1 if unknown).
+SCALAR_COLUMNS = {
+    "day": ("i4", operator.attrgetter("day")),
+    "cash": ("f8", operator.attrgetter("cash")),
+    "debt": ("f8", operator.attrgetter("debt")),
+    "stock_price": ("f8", operator.attrgetter("stock_price")),
+    "market_cap": ("f8", operator.attrgetter("market_cap")),
+    "quarterly_revenue": ("f8", operator.attrgetter("quarterly_revenue")),  # Quarter to date
+    "quarterly_costs": ("f8", operator.attrgetter("quarterly_costs")),
+    "customer_base": ("f8", operator.attrgetter("customer_base")),
+    "technology_level": ("f8", operator.attrgetter("technology_level")),
+    "employee_morale": ("f8", operator.attrgetter("employee_morale")),
+    "reputation": ("f8", operator.attrgetter("reputation")),
+    "board_confidence": ("f8", operator.attrgetter("board_confidence")),
+    "ceo_health": ("f8", operator.attrgetter("ceo_health")),
+    "analyst_rating": ("i1", _analyst_code),
+    "credit_rating": ("i1", _credit_code),
+    "employees": ("i4", _head_count),
+}
+
+
+class DayJournal:
+    """Column files for one game's daily history (see module docstring)."""
+
+    def __init__(self, path: str, meta: dict, writable: bool):
+        self.path = path
+        self.writable = writable
+        self.rival_width = meta["rival_width"]
+        self.capacity = meta["capacity"]
+        self.n = meta["rows"]
+        self._cols = {}
+        self._map_all()
+        # Recover rows appended after meta.json was last written
+        day = self._cols["day"]
+        while self.n < self.capacity and day[self.n] != 0:
+            self.n += 1
+
+    # --- CREATE / OPEN ---
+    @classmethod
+    def create(cls, path: str, rival_width: int = 12) -> "DayJournal":
+        """A new, empty journal in directory `path` (created if missing; an old journal there is replaced)."""
+        os.makedirs(path, exist_ok=True)
+        meta = {"format": FORMAT_VERSION, "rival_width": max(1, rival_width), "capacity": 0, "rows": 0}
+        for name in cls._column_specs(meta["rival_width"]):
+            open(os.path.join(path, f"{name}.bin"), "wb").close()
+        journal = cls(path, meta, writable=True)
+        journal._grow()
+        return journal
+
+    @classmethod
+    def open(cls, path: str, writable: bool = False) -> "DayJournal":
+        with open(os.path.join(path, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported journal format {meta.get('format')}")
+        return cls(path, meta, writable)
+
+    @classmethod
+    def attach(cls, corp, path: str) -> "DayJournal":
+        """Start journaling corp: today is recorded now and every finished day after it."""
+        journal = cls.create(path, rival_width=len(corp.competitor_field))
+        corp.journal = journal
+        journal.record(corp)
+        return journal
+
+    @staticmethod
+    def detach(corp):
+        if corp.journal is not None:
+            corp.journal.close()
+        corp.journal = None
+
+    # --- FILES ---
+    @staticmethod
+    def _column_specs(rival_width):
+        """name -> (dtype, row shape) for every column file."""
+        specs = {name: (dtype, ()) for name, (dtype, _reader) in SCALAR_COLUMNS.items()}
+        specs["competitor_prices"] = ("f8", (rival_width,))
+        return specs
+
+    def _map_all(self):
+        mode = "r+" if self.writable else "r"
+        for name, (dtype, row_shape) in self._column_specs(self.rival_width).items():
+            file_path = os.path.join(self.path, f"{name}.bin")
+            if self.capacity:
+                self._cols[name] = np.memmap(file_path, dtype=dtype, mode=mode, shape=(self.capacity,) + row_shape)
+            else:
+                self._cols[name] = np.zeros((0,) + row_shape, dtype=dtype)
+
+    def _grow(self):
+        """Extend every column file by CHUNK_DAYS zeroed rows and remap."""
+        self.flush()
+        self._cols.clear()
+        self.capacity += CHUNK_DAYS
+        for name, (dtype, row_shape) in self._column_specs(self.rival_width).items():
+            row_bytes = np.dtype(dtype).itemsize * int(np.prod(row_shape, dtype=np.int64))
+            with open(os.path.join(self.path, f"{name}.bin"), "r+b") as f:
+                f.truncate(self.capacity * row_bytes)
+        self._map_all()
+        self._write_meta()
+
+    def _write_meta(self):
+        meta = {"format": FORMAT_VERSION, "rival_width": self.rival_width,
+                "capacity": self.capacity, "rows": self.n,
+                "columns": {name: [dtype, list(shape)] for name, (dtype, shape)
+                            in self._column_specs(self.rival_width).items()}}
+        tmp_path = os.path.join(self.path, META_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, os.path.join(self.path, META_FILE))
+
+    def flush(self):
+        """Push written rows to disk and record the row count."""
+        if not self.writable:
+            return
+        for col in self._cols.values():
+            if isinstance(col, np.memmap):
+                col.flush()
+        self._write_meta()
+
+    def close(self):
+        self.flush()
+        self._cols.clear()
+
+    # --- WRITING ---
+    def record(self, corp):
+        """Append one row with corp's end-of-day state."""
+        if not self.writable:
+            raise ValueError("Journal was opened read-only")
+        if self.n == self.capacity:
+            self._grow()
+        n = self.n
+        cols = self._cols
+        for name, (_dtype, reader) in SCALAR_COLUMNS.items():
+            if name != "day":
+                cols[name][n] = reader(corp)
+        field = corp.competitor_field
+        k = min(self.rival_width, field.n)
+        prices = cols["competitor_prices"][n]
+        prices[:k] = field.price[:k]
+        prices[k:] = np.nan  # Rivals beyond the journal's width (or missing) are not tracked
+        cols["day"][n] = corp.day  # Written last: a non-zero day marks the row complete
+        self.n = n + 1
+
+    # --- READING ---
+    def __len__(self):
+        return self.n
+
+    @property
+    def columns(self) -> list:
+        return list(self._cols)
+
+    def column(self, name: str) -> np.ndarray:
+        """All recorded values of one column, oldest first (a view into the mapped file, not a copy)."""
+        return self._cols[name][:self.n]
+
+    def row(self, i: int) -> dict:
+        """One day's values as a dict (ratings as their codes)."""
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("journal row out of range")
+        return {name: (col[i].tolist()) for name, col in self._cols.items()}
+
+    def export_csv(self, file_path: str, columns=None):
+        """Write the journal (or the given scalar columns) as CSV, one line per day."""
+        names = list(columns or SCALAR_COLUMNS)
+        data = np.column_stack([self.column(name).astype(np.float64) for name in names])
+        np.savetxt(file_path, data, delimiter=",", header=",".join(names), comments="", fmt="%.10g")
+
+    def __repr__(self):
+        return f"DayJournal({self.path!r}, {self.n} days)"
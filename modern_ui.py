@@ -2,12 +2,15 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox, simpledialog, Toplevel, Text, Scrollbar
+import multiprocessing
 import random
 import sys
 import os 
 import config 
 from game_core import Corporation
 from event_system import EmailSystem
+from replay import ActionLog
+from preview import Decision, PreviewService
 from collections import deque # Added import for MockCorporation
 
 TUTORIAL_STATE_FILE = "tutorial_shown.flag"
@@ -25,6 +28,9 @@ class CEOGameApp:
         # Cleanup tracking
         self.is_running = True
         self.scheduled_callbacks = []  # Track all after() callbacks for cleanup
+        # Decision previews; the worker pool starts on first use. Frozen builds preview on a
+        # thread until worker processes have been checked in the PyInstaller and py2app bundles.
+        self.preview_service = PreviewService(threaded=getattr(sys, 'frozen', False))
         
         # Load a reusable app icon (PNG/GIF). Place your file at assets/app_icon.png
         self.app_icon = None
@@ -309,20 +315,21 @@ class CEOGameApp:
         ctk.CTkLabel(leaderboard_window, text="🏆 Reach 1st place to WIN THE GAME!", 
                     font=config.FONT_HEADER, text_color=config.COLOR_GOLD).pack(pady=10)
         
-        # Create leaderboard list (all companies sorted by stock price)
-        companies = [(self.game.corp_name, self.game.stock_price, "YOU", config.COLOR_GOLD)]
-        for comp in self.game.competitors:
-            companies.append((comp.name, comp.stock_price, comp.strategy.upper(), config.COLOR_ACCENT_NEUTRAL))
-        
-        # Sort by stock price (highest first)
-        companies.sort(key=lambda x: x[1], reverse=True)
+        # Leaderboard rows (top places from the leaderboard index, player always included)
+        companies = []
+        for entry in self.game.leaderboard_standings():
+            if entry['is_player']:
+                companies.append((entry['rank'], entry['name'], entry['stock_price'], "YOU", config.COLOR_GOLD))
+            else:
+                companies.append((entry['rank'], entry['name'], entry['stock_price'], entry['strategy'].upper(),
+                                  config.COLOR_ACCENT_NEUTRAL))
         
         # Display rankings
         scroll_frame = ctk.CTkScrollableFrame(leaderboard_window, fg_color=config.COLOR_PANEL_BG)
         scroll_frame.pack(fill='both', expand=True, padx=20, pady=10)
         
         player_rank = 0
-        for i, (name, price, tag, color) in enumerate(companies, 1):
+        for i, name, price, tag, color in companies:
             rank_frame = ctk.CTkFrame(scroll_frame, fg_color=("#2E4053" if tag != "YOU" else "#1C5739"), corner_radius=8)
             rank_frame.pack(fill='x', pady=5, padx=10)
             
@@ -359,7 +366,7 @@ class CEOGameApp:
             status_msg = f"💪 You're in {player_rank}{'nd' if player_rank == 2 else 'rd'} place - Keep pushing to reach #1!"
             status_color = config.COLOR_GOLD
         else:
-            gap = companies[0][1] - self.game.stock_price
+            gap = self.game.competitor_field.leaderboard.leader_price() - self.game.stock_price
             status_msg = f"📈 You're in {player_rank}th place - ${gap:.2f} behind the leader"
             status_color = config.COLOR_ACCENT_DANGER
         
@@ -408,30 +415,8 @@ class CEOGameApp:
     
     def _enable_developer_mode(self):
         """Activate developer mode with unlimited resources."""
-        # Grant unlimited resources
-        self.game.cash = 999999999999  # Nearly unlimited cash
-        self.game.debt = 0
-        self.game.stock_price = 1000.0
-        self.game.reputation = 100
-        self.game.employee_morale = 100
-        self.game.ceo_health = 100
-        self.game.board_confidence = 100
-        self.game.technology_level = 100
-        self.game.customer_base = 100
-        
-        # Max out efficiencies
-        for dept in self.game.dept_efficiency.keys():
-            self.game.dept_efficiency[dept] = 100
-        
-        # Unlimited budgets
-        for dept in self.game.annual_budget.keys():
-            self.game.annual_budget[dept] = 999999999999
-        
-        self.game.corp_card_limit = 999999999999
-        self.game.action_points = 99
-        self.game.max_action_points = 99
-        
-        self.game.log.append("*** DEVELOPER MODE ENABLED: Unlimited resources activated ***")
+        self.game.record_action("enable_developer_mode")
+        self.game.enable_developer_mode()
         messagebox.showinfo("Developer Mode", "✓ Developer Mode activated! Unlimited resources granted.")
         self._update_status()
     
@@ -457,30 +442,42 @@ class CEOGameApp:
     def _load_game_dialog(self):
         """Open load game dialog."""
         from tkinter import filedialog
+        from savefile import read_header
+        
+        filepath = filedialog.askopenfilename(
+            title="Load Game",
+            filetypes=[("Save Files", "*.sav"), ("All Files", "*.*")]
+        )
+        if not filepath:
+            return
+        
+        # Describe the save from its header (the body is only decoded on load)
+        try:
+            header = read_header(filepath)
+        except Exception as e:
+            print(f"Error reading save header: {e}")
+            messagebox.showerror("Load Failed", "This file is not a readable save game.")
+            return
         
         # Confirm before loading (will replace current game)
         confirm = messagebox.askyesno(
             "Load Game",
+            f"{header.get('corp_name') or 'Unnamed Corp'} (CEO {header.get('ceo_name') or '?'})\n"
+            f"Day {header.get('day')} - Stock ${header.get('stock_price', 0):,.2f} - Cash ${header.get('cash', 0):,.0f}\n\n"
             "Loading a save will replace your current game.\n\nContinue?"
         )
         
         if not confirm:
             return
         
-        filepath = filedialog.askopenfilename(
-            title="Load Game",
-            filetypes=[("Save Files", "*.sav"), ("All Files", "*.*")]
-        )
-        
-        if filepath:
-            success = self.game.load_game(filepath)
-            if success:
-                # Reinitialize email system
-                self.game.email_system = EmailSystem(self.game)
-                self._update_status()
-                messagebox.showinfo("Game Loaded", f"Game successfully loaded from:\n{filepath}")
-            else:
-                messagebox.showerror("Load Failed", "Failed to load game. File may be corrupted or incompatible.")
+        success = self.game.load_game(filepath)
+        if success:
+            # load_game restores the saved inbox into a fresh email system
+            self.preview_service.clear()  # Cached previews belong to the game that was replaced
+            self._update_status()
+            messagebox.showinfo("Game Loaded", f"Game successfully loaded from:\n{filepath}")
+        else:
+            messagebox.showerror("Load Failed", "Failed to load game. File may be corrupted or incompatible.")
 
     def _show_priorities_dashboard(self):
         """Show startup dashboard with top priorities and alerts."""
@@ -688,6 +685,7 @@ class CEOGameApp:
                 self.game.set_identity("Global Dynamics", "Anonymous CEO", self.game.email_system, selected_difficulty)
             else:
                 self.game.set_identity(corp_name, ceo_name, self.game.email_system, selected_difficulty)
+            ActionLog.attach(self.game)  # Record every decision so the game can be replayed headlessly
             
             # Log difficulty
             self.game.log.append(f"Game started on {selected_difficulty} difficulty.")
@@ -698,6 +696,7 @@ class CEOGameApp:
             # Prompt for password
             if self._prompt_dev_password():
                 self.game.set_identity("DevCorp", "Debug CEO", self.game.email_system, "Easy")
+                ActionLog.attach(self.game)
                 self._enable_developer_mode()
                 dialog.destroy()
         
@@ -1157,6 +1156,10 @@ class CEOGameApp:
         self.employee_list_frame = ctk.CTkScrollableFrame(emp_panel, fg_color="#0F1724", height=140, scrollbar_button_color="#3A506B", scrollbar_button_hover_color="#5A7A9B")
         self.employee_list_frame.pack(fill='x', padx=10, pady=(6, 10))
         self.employee_list_frame._parent_canvas.configure(yscrollincrement=5)
+        # Rows are kept per employee and updated in place (see _render_employee_rows)
+        self._employee_rows = {}  # id(employee) -> row widgets
+        self._employee_layout = []
+        self.no_employees_label = ctk.CTkLabel(self.employee_list_frame, text="No hires yet.", font=config.FONT_BODY, text_color=config.COLOR_ACCENT_NEUTRAL)
 
         ctk.CTkLabel(emp_panel, text="Automation Log", font=config.FONT_BODY, text_color=config.COLOR_ACCENT_NEUTRAL).pack()
         self.automation_log_box = ctk.CTkTextbox(emp_panel, height=90, state=ctk.DISABLED, wrap='word',
@@ -1226,6 +1229,18 @@ class CEOGameApp:
         self.project_list_frame = ctk.CTkScrollableFrame(self.project_panel, fg_color='transparent', scrollbar_button_color="#3A506B", scrollbar_button_hover_color="#5A7A9B")
         self.project_list_frame.pack(fill='both', padx=8, pady=(0, 8), expand=True)
         self.project_list_frame._parent_canvas.configure(yscrollincrement=5)
+        # Cards are kept per project and section and updated in place (see _render_project_cards)
+        self._project_cards = {}  # (id(project), in market) -> card widgets
+        self._project_layout = []
+        self.no_projects_label = ctk.CTkLabel(self.project_list_frame, text="No Active Projects\n\nLaunch projects via Projects & Innovation", 
+                                              font=config.FONT_BODY, text_color=config.COLOR_ACCENT_NEUTRAL, justify='center', fg_color="transparent")
+        self.dev_projects_header = ctk.CTkFrame(self.project_list_frame, fg_color='transparent')
+        ctk.CTkLabel(self.dev_projects_header, text="● In Development", font=(config.FONT_FAMILY, 11, 'bold'), 
+                     text_color=config.COLOR_ACCENT_DANGER).pack(side='left')
+        self.projects_separator = ctk.CTkFrame(self.project_list_frame, height=1, fg_color=config.COLOR_ACCENT_NEUTRAL)
+        self.market_projects_header = ctk.CTkFrame(self.project_list_frame, fg_color='transparent')
+        ctk.CTkLabel(self.market_projects_header, text="● In Market", font=(config.FONT_FAMILY, 11, 'bold'), 
+                     text_color=config.COLOR_SUCCESS_GREEN).pack(side='left')
 
         # News Ticker (below event log and active projects)
         ticker_container = ctk.CTkFrame(self.action_frame, fg_color="transparent")
@@ -1434,36 +1449,10 @@ class CEOGameApp:
 
         # Update Employees Panel with color-coded labels and bonus info
         employees = corp.employees
-        total_skill = sum(getattr(e, 'skill_level', 1) for e in employees)
+        total_skill = employees.total_skill
         total_bonus = sum(corp._employee_dept_bonus(d) for d in ['R&D', 'Marketing', 'Operations', 'HR'])
         self.employee_summary_label.configure(text=f"{len(employees)} employees | Total skill {total_skill:.1f} | Bonus +{total_bonus:.1f}%")
-        for widget in self.employee_list_frame.winfo_children():
-            widget.destroy()
-        if not employees:
-            ctk.CTkLabel(self.employee_list_frame, text="No hires yet.", font=config.FONT_BODY, text_color=config.COLOR_ACCENT_NEUTRAL).pack(pady=4, padx=6)
-        else:
-            for e in employees:
-                row = ctk.CTkFrame(self.employee_list_frame, fg_color="transparent")
-                row.pack(fill='x', padx=4, pady=2)
-                
-                # Color-code by employee type
-                if e.employee_type == "Analyst":
-                    badge_color = config.COLOR_ACCENT_NEUTRAL
-                elif e.employee_type == "Manager":
-                    badge_color = config.COLOR_ACCENT_PRIMARY
-                elif e.employee_type == "Specialist":
-                    badge_color = ("#9B59B6")
-                else:  # Automation Expert
-                    badge_color = config.COLOR_GOLD
-                
-                badge = ctk.CTkLabel(row, text=e.employee_type[0], font=(config.FONT_FAMILY, 9, 'bold'), 
-                                   text_color=config.COLOR_PANEL_BG, fg_color=badge_color, 
-                                   corner_radius=4, width=20, height=20)
-                badge.pack(side=ctk.LEFT, padx=(2, 6))
-                
-                assigned = f" → {e.assigned_action}" if getattr(e, 'assigned_action', None) else ""
-                ctk.CTkLabel(row, text=f"{e.name}{assigned}", font=config.FONT_BODY, text_color=config.COLOR_TEXT, anchor='w').pack(side=ctk.LEFT, padx=2)
-                ctk.CTkLabel(row, text=f"Lvl{e.skill_level:.1f} T{e.tasks_completed}", font=config.FONT_BODY, text_color=config.COLOR_ACCENT_NEUTRAL, anchor='e').pack(side=ctk.RIGHT, padx=4)
+        self._render_employee_rows(employees)
 
         # Automation log
         self.automation_log_box.configure(state=ctk.NORMAL)
@@ -1480,9 +1469,6 @@ class CEOGameApp:
         self.log_text.configure(state=ctk.DISABLED)
         
         # Update Project List
-        for widget in self.project_list_frame.winfo_children():
-            widget.destroy()
-        
         # Calculate stats for header
         in_development = [p for p in corp.projects if p.lifecycle_stage == 'Development']
         in_market = [p for p in corp.projects if p.lifecycle_stage != 'Development']
@@ -1496,87 +1482,8 @@ class CEOGameApp:
             self.project_stats_label.configure(text=f"Dev: {len(in_development)} | Market: {len(in_market)} | Net: ${net_daily/1000:+.0f}K/day")
         else:
             self.project_stats_label.configure(text="No projects active")
-            
-        if not corp.projects:
-            ctk.CTkLabel(self.project_list_frame, text="No Active Projects\n\nLaunch projects via Projects & Innovation", 
-                        font=config.FONT_BODY, text_color=config.COLOR_ACCENT_NEUTRAL, justify='center', fg_color="transparent").pack(pady=40)
-        else:
-            # Separate development and market projects
-            if in_development:
-                dev_header = ctk.CTkFrame(self.project_list_frame, fg_color='transparent')
-                dev_header.pack(fill='x', pady=(4, 4))
-                ctk.CTkLabel(dev_header, text="● In Development", font=(config.FONT_FAMILY, 11, 'bold'), 
-                           text_color=config.COLOR_ACCENT_DANGER).pack(side='left')
-                
-                for p in in_development:
-                    p_frame = ctk.CTkFrame(self.project_list_frame, fg_color=('#34495E'), corner_radius=8, border_width=1, border_color=config.COLOR_ACCENT_DANGER)
-                    p_frame.pack(fill='x', pady=4, padx=2)
-
-                    header = ctk.CTkFrame(p_frame, fg_color="transparent")
-                    header.pack(fill='x', padx=8, pady=(6, 2))
-                    
-                    p_type = {1: 'R&D', 2: 'Marketing', 3: 'Operations'}.get(p.type, 'Misc')
-                    type_label = ctk.CTkLabel(header, text=p_type, font=(config.FONT_FAMILY, 9), text_color=config.COLOR_PANEL_BG, 
-                                             fg_color=config.COLOR_ACCENT_DANGER, corner_radius=4, width=55)
-                    type_label.pack(side='left', padx=(0, 6))
-                    ctk.CTkLabel(header, text=p.name, font=(config.FONT_FAMILY, 11, 'bold'), text_color=config.COLOR_TEXT).pack(side='left')
-
-                    body = ctk.CTkFrame(p_frame, fg_color="transparent")
-                    body.pack(fill='x', padx=8, pady=2)
-                    
-                    days_remaining = p.development_days - p.days_in_stage
-                    progress_pct = (p.days_in_stage / p.development_days) * 100
-                    daily_cost = p.initial_investment / p.development_days
-                    
-                    ctk.CTkLabel(body, text=f"{progress_pct:.0f}% ({days_remaining}d left) | Cost: ${daily_cost/1000:.0f}K/day | Risk: {p.risk:.0%}", 
-                               font=(config.FONT_FAMILY, 9), text_color=config.COLOR_ACCENT_NEUTRAL).pack(anchor='w')
-                    
-                    progress_bar = ctk.CTkProgressBar(body, height=8, progress_color=config.COLOR_ACCENT_DANGER)
-                    progress_bar.set(progress_pct / 100)
-                    progress_bar.pack(fill='x', pady=(3, 6))
-            
-            if in_market:
-                if in_development:
-                    ctk.CTkFrame(self.project_list_frame, height=1, fg_color=config.COLOR_ACCENT_NEUTRAL).pack(fill='x', pady=8)
-                
-                market_header = ctk.CTkFrame(self.project_list_frame, fg_color='transparent')
-                market_header.pack(fill='x', pady=(4, 4))
-                ctk.CTkLabel(market_header, text="● In Market", font=(config.FONT_FAMILY, 11, 'bold'), 
-                           text_color=config.COLOR_SUCCESS_GREEN).pack(side='left')
-                
-                for p in in_market:
-                    stage_colors = {'Launch': config.COLOR_ACCENT_PRIMARY, 'Growth': config.COLOR_SUCCESS_GREEN, 
-                                   'Maturity': config.COLOR_GOLD, 'Decline': config.COLOR_ACCENT_DANGER}
-                    border_color = stage_colors.get(p.lifecycle_stage, config.COLOR_ACCENT_PRIMARY)
-                    
-                    p_frame = ctk.CTkFrame(self.project_list_frame, fg_color=('#34495E'), corner_radius=8, border_width=1, border_color=border_color)
-                    p_frame.pack(fill='x', pady=4, padx=2)
-
-                    header = ctk.CTkFrame(p_frame, fg_color="transparent")
-                    header.pack(fill='x', padx=8, pady=(6, 2))
-                    
-                    stage_label = ctk.CTkLabel(header, text=p.lifecycle_stage, font=(config.FONT_FAMILY, 9), 
-                                              text_color=config.COLOR_PANEL_BG, fg_color=border_color, corner_radius=4, width=55)
-                    stage_label.pack(side='left', padx=(0, 6))
-                    ctk.CTkLabel(header, text=p.name, font=(config.FONT_FAMILY, 11, 'bold'), text_color=config.COLOR_TEXT).pack(side='left')
-
-                    body = ctk.CTkFrame(p_frame, fg_color="transparent")
-                    body.pack(fill='x', padx=8, pady=(2, 6))
-                    
-                    ctk.CTkLabel(body, text=f"Day {p.total_days_live} | ${p.daily_revenue/1000:.0f}K/day | Quality: {p.quality_score:.0f} | Share: {p.market_share:.1f}%",
-                               font=(config.FONT_FAMILY, 9), text_color=config.COLOR_SUCCESS_GREEN).pack(anchor='w')
-                    
-                    # Retire button for declining products
-                    if p.lifecycle_stage == 'Decline':
-                        def make_retire(prod):
-                            def _retire():
-                                corp.retire_product(prod)
-                                messagebox.showinfo('Retired', f'{prod.name} retired')
-                                self._update_status()
-                            return _retire
-                        ctk.CTkButton(body, text='Retire', command=make_retire(p), fg_color=config.COLOR_ACCENT_DANGER, 
-                                    width=60, height=22, font=(config.FONT_FAMILY, 9)).pack(anchor='e', pady=(2, 0))
 
+        self._render_project_cards(in_development, in_market)
 
         # Email Badge Update (on inbox button)
         email_count = len(self.game.email_system.inbox)
@@ -1597,6 +1504,178 @@ class CEOGameApp:
         else:
             self.earnings_banner.pack_forget()
 
+    # --- KEYED PANEL RENDERING ---
+    # The employee and project panels keep one row widget per employee/project. Each
+    # refresh only reconfigures what changed; rows are created or destroyed on hire,
+    # fire, launch or retire, and re-packed only when the order of rows changes.
+
+    @staticmethod
+    def _refresh(row, name, **options):
+        """Configure row[name] with the options that differ from what it shows (every CTk configure redraws)."""
+        shown = row['shown'].setdefault(name, {})
+        changed = {key: value for key, value in options.items() if shown.get(key) != value}
+        if changed:
+            row[name].configure(**changed)
+            shown.update(changed)
+
+    @staticmethod
+    def _repack(current, layout):
+        """Bring the packed widget sequence from current to layout's (widget, pack options); returns the new sequence."""
+        widgets = [widget for widget, _options in layout]
+        if widgets == current:
+            return widgets
+        wanted = set(widgets)
+        kept = [widget for widget in current if widget in wanted]
+        # Rows only removed and/or appended (hire, fire, launch, retire): the rest keep their place
+        start = len(kept) if kept == widgets[:len(kept)] else 0
+        for widget in current:
+            if widget.winfo_exists() and (start == 0 or widget not in wanted):
+                widget.pack_forget()
+        for widget, options in layout[start:]:
+            widget.pack(**options)
+        return widgets
+
+    def _render_employee_rows(self, employees):
+        rows = self._employee_rows
+        present = {id(e) for e in employees}
+        for key in [key for key in rows if key not in present]:
+            rows.pop(key)['frame'].destroy()
+
+        layout = []
+        for e in employees:
+            row = rows.get(id(e))
+            if row is None:
+                row = rows[id(e)] = self._make_employee_row(e)
+            assigned = f" → {e.assigned_action}" if getattr(e, 'assigned_action', None) else ""
+            self._refresh(row, 'name', text=f"{e.name}{assigned}")
+            self._refresh(row, 'stats', text=f"Lvl{e.skill_level:.1f} T{e.tasks_completed}")
+            layout.append((row['frame'], {'fill': 'x', 'padx': 4, 'pady': 2}))
+        if not layout:
+            layout.append((self.no_employees_label, {'pady': 4, 'padx': 6}))
+        self._employee_layout = self._repack(self._employee_layout, layout)
+
+    def _make_employee_row(self, e):
+        frame = ctk.CTkFrame(self.employee_list_frame, fg_color="transparent")
+        
+        # Color-code by employee type
+        if e.employee_type == "Analyst":
+            badge_color = config.COLOR_ACCENT_NEUTRAL
+        elif e.employee_type == "Manager":
+            badge_color = config.COLOR_ACCENT_PRIMARY
+        elif e.employee_type == "Specialist":
+            badge_color = ("#9B59B6")
+        else:  # Automation Expert
+            badge_color = config.COLOR_GOLD
+        
+        badge = ctk.CTkLabel(frame, text=e.employee_type[0], font=(config.FONT_FAMILY, 9, 'bold'), 
+                           text_color=config.COLOR_PANEL_BG, fg_color=badge_color, 
+                           corner_radius=4, width=20, height=20)
+        badge.pack(side=ctk.LEFT, padx=(2, 6))
+        
+        name_label = ctk.CTkLabel(frame, text="", font=config.FONT_BODY, text_color=config.COLOR_TEXT, anchor='w')
+        name_label.pack(side=ctk.LEFT, padx=2)
+        stats_label = ctk.CTkLabel(frame, text="", font=config.FONT_BODY, text_color=config.COLOR_ACCENT_NEUTRAL, anchor='e')
+        stats_label.pack(side=ctk.RIGHT, padx=4)
+        return {'employee': e, 'frame': frame, 'name': name_label, 'stats': stats_label, 'shown': {}}
+
+    def _render_project_cards(self, in_development, in_market):
+        cards = self._project_cards
+        present = {(id(p), False) for p in in_development} | {(id(p), True) for p in in_market}
+        for key in [key for key in cards if key not in present]:
+            cards.pop(key)['frame'].destroy()  # Retired, or moved from development to market
+
+        card_options = {'fill': 'x', 'pady': 4, 'padx': 2}
+        layout = []
+        if in_development:
+            layout.append((self.dev_projects_header, {'fill': 'x', 'pady': (4, 4)}))
+            for p in in_development:
+                card = cards.get((id(p), False))
+                if card is None:
+                    card = cards[(id(p), False)] = self._make_dev_project_card(p)
+                self._update_dev_project_card(card, p)
+                layout.append((card['frame'], card_options))
+        if in_market:
+            if in_development:
+                layout.append((self.projects_separator, {'fill': 'x', 'pady': 8}))
+            layout.append((self.market_projects_header, {'fill': 'x', 'pady': (4, 4)}))
+            for p in in_market:
+                card = cards.get((id(p), True))
+                if card is None:
+                    card = cards[(id(p), True)] = self._make_market_project_card(p)
+                self._update_market_project_card(card, p)
+                layout.append((card['frame'], card_options))
+        if not layout:
+            layout.append((self.no_projects_label, {'pady': 40}))
+        self._project_layout = self._repack(self._project_layout, layout)
+
+    def _make_dev_project_card(self, p):
+        frame = ctk.CTkFrame(self.project_list_frame, fg_color=('#34495E'), corner_radius=8, border_width=1, border_color=config.COLOR_ACCENT_DANGER)
+
+        header = ctk.CTkFrame(frame, fg_color="transparent")
+        header.pack(fill='x', padx=8, pady=(6, 2))
+        
+        p_type = {1: 'R&D', 2: 'Marketing', 3: 'Operations'}.get(p.type, 'Misc')
+        type_label = ctk.CTkLabel(header, text=p_type, font=(config.FONT_FAMILY, 9), text_color=config.COLOR_PANEL_BG, 
+                                 fg_color=config.COLOR_ACCENT_DANGER, corner_radius=4, width=55)
+        type_label.pack(side='left', padx=(0, 6))
+        ctk.CTkLabel(header, text=p.name, font=(config.FONT_FAMILY, 11, 'bold'), text_color=config.COLOR_TEXT).pack(side='left')
+
+        body = ctk.CTkFrame(frame, fg_color="transparent")
+        body.pack(fill='x', padx=8, pady=2)
+        info_label = ctk.CTkLabel(body, text="", font=(config.FONT_FAMILY, 9), text_color=config.COLOR_ACCENT_NEUTRAL)
+        info_label.pack(anchor='w')
+        progress_bar = ctk.CTkProgressBar(body, height=8, progress_color=config.COLOR_ACCENT_DANGER)
+        progress_bar.pack(fill='x', pady=(3, 6))
+        return {'project': p, 'frame': frame, 'info': info_label, 'progress': progress_bar, 'progress_value': None, 'shown': {}}
+
+    def _update_dev_project_card(self, card, p):
+        days_remaining = p.development_days - p.days_in_stage
+        progress_pct = (p.days_in_stage / p.development_days) * 100
+        daily_cost = p.initial_investment / p.development_days
+        self._refresh(card, 'info', text=f"{progress_pct:.0f}% ({days_remaining}d left) | Cost: ${daily_cost/1000:.0f}K/day | Risk: {p.risk:.0%}")
+        if card['progress_value'] != progress_pct:
+            card['progress'].set(progress_pct / 100)
+            card['progress_value'] = progress_pct
+
+    def _make_market_project_card(self, p):
+        frame = ctk.CTkFrame(self.project_list_frame, fg_color=('#34495E'), corner_radius=8, border_width=1)
+
+        header = ctk.CTkFrame(frame, fg_color="transparent")
+        header.pack(fill='x', padx=8, pady=(6, 2))
+        stage_label = ctk.CTkLabel(header, text="", font=(config.FONT_FAMILY, 9), 
+                                  text_color=config.COLOR_PANEL_BG, corner_radius=4, width=55)
+        stage_label.pack(side='left', padx=(0, 6))
+        ctk.CTkLabel(header, text=p.name, font=(config.FONT_FAMILY, 11, 'bold'), text_color=config.COLOR_TEXT).pack(side='left')
+
+        body = ctk.CTkFrame(frame, fg_color="transparent")
+        body.pack(fill='x', padx=8, pady=(2, 6))
+        info_label = ctk.CTkLabel(body, text="", font=(config.FONT_FAMILY, 9), text_color=config.COLOR_SUCCESS_GREEN)
+        info_label.pack(anchor='w')
+        return {'project': p, 'frame': frame, 'stage': stage_label, 'body': body, 'info': info_label,
+                'retire': None, 'shown': {}}
+
+    def _update_market_project_card(self, card, p):
+        stage_colors = {'Launch': config.COLOR_ACCENT_PRIMARY, 'Growth': config.COLOR_SUCCESS_GREEN, 
+                       'Maturity': config.COLOR_GOLD, 'Decline': config.COLOR_ACCENT_DANGER}
+        border_color = stage_colors.get(p.lifecycle_stage, config.COLOR_ACCENT_PRIMARY)
+        self._refresh(card, 'frame', border_color=border_color)
+        self._refresh(card, 'stage', text=p.lifecycle_stage, fg_color=border_color)
+        self._refresh(card, 'info', text=f"Day {p.total_days_live} | ${p.daily_revenue/1000:.0f}K/day | Quality: {p.quality_score:.0f} | Share: {p.market_share:.1f}%")
+        
+        # Retire button for declining products
+        if p.lifecycle_stage == 'Decline' and card['retire'] is None:
+            def _retire():
+                self.game.record_action("retire_product", self.game.projects.index(p))
+                self.game.retire_product(p)
+                messagebox.showinfo('Retired', f'{p.name} retired')
+                self._update_status()
+            card['retire'] = ctk.CTkButton(card['body'], text='Retire', command=_retire, fg_color=config.COLOR_ACCENT_DANGER, 
+                                           width=60, height=22, font=(config.FONT_FAMILY, 9))
+            card['retire'].pack(anchor='e', pady=(2, 0))
+        elif p.lifecycle_stage != 'Decline' and card['retire'] is not None:
+            card['retire'].destroy()
+            card['retire'] = None
+
     def _open_settings_dialog(self):
         settings_window = ctk.CTkToplevel(self.master)
         settings_window.title("Game Settings")
@@ -1641,6 +1720,7 @@ class CEOGameApp:
         ctk.CTkLabel(coaching_frame, text="Enable Coaching Emails:", font=config.FONT_BODY).pack(side=ctk.LEFT)
         def toggle_coaching(state):
             try:
+                self.game.record_action("set_coaching", state)
                 self.game.email_system.coaching_enabled = state
                 self.game.log.append(f"Settings: Coaching emails {'enabled' if state else 'disabled'}.")
             except Exception as e:
@@ -1734,6 +1814,9 @@ class CEOGameApp:
         def on_long_timer(val):
             try:
                 m = float(val)
+                if m == self.game.long_timer_multiplier:
+                    return
+                self.game.record_action("set_long_timer_multiplier", m)
                 self.game.long_timer_multiplier = m
                 self.game.log.append(f"Settings: Long-timer multiplier set to {m:.2f}x")
             except Exception:
@@ -1791,6 +1874,8 @@ class CEOGameApp:
                 # Log the problematic event for debugging
                 print(f"DEBUG: Event {event_id} has no choices. Event data: {event_data}")
                 corp.log.append(f"EVENT ERROR: {event_id} was skipped (no options available)")
+                corp.record_action("popup", event_id, None)
+                corp.email_system.resolve_popup_choice(event_id, None)
                 messagebox.showinfo("Event Skipped", "This event had no available options and has been skipped.")
                 if popup.winfo_exists():
                     popup.destroy()
@@ -1799,28 +1884,24 @@ class CEOGameApp:
 
             choice_buttons = []
 
-            def handle_choice(choice):
+            def handle_choice(choice_index):
                 try:
                     # Disable buttons immediately to avoid double-click glitches
                     for btn in choice_buttons:
                         btn.configure(state=ctk.DISABLED)
 
-                    text, action_func, risk = choice
+                    _text, action_func, _risk = choices[choice_index]
+                    conditional = isinstance(action_func, tuple) and len(action_func) == 3
 
-                    # Check for conditional action (Condition, Success_Action, Failure_Action)
-                    if isinstance(action_func, tuple) and len(action_func) == 3:
-                        condition, success_action, failure_action = action_func
-                        if condition:
-                            result_msg = success_action(self.game.email_system)
-                            messagebox.showinfo("Decision Result", f"Action executed successfully. {result_msg}")
-                        else:
-                            result_msg = failure_action(self.game.email_system)
-                            messagebox.showerror("Decision Failed", f"Action failed due to insufficient funds/condition. {result_msg}")
-
-                    # Check for simple action (Impact_Function)
-                    else:
-                        result_msg = action_func(self.game.email_system)
+                    # Runs the choice (or a conditional choice's success/failure branch) and resolves the event
+                    corp.record_action("popup", event_id, choice_index)
+                    succeeded, result_msg = corp.email_system.resolve_popup_choice(event_id, choice_index)
+                    if not conditional:
                         messagebox.showinfo("Decision Result", result_msg)
+                    elif succeeded:
+                        messagebox.showinfo("Decision Result", f"Action executed successfully. {result_msg}")
+                    else:
+                        messagebox.showerror("Decision Failed", f"Action failed due to insufficient funds/condition. {result_msg}")
 
                     # Clean up and continue
                     if popup.winfo_exists():
@@ -1829,6 +1910,7 @@ class CEOGameApp:
                     self._update_status()
                 except Exception as e:
                     print(f"Error handling choice: {e}")
+                    corp.email_system.POPUP_EVENTS.resolve(event_id)
                     if popup.winfo_exists():
                         popup.destroy()
                     self.advance_button.configure(state=ctk.NORMAL)
@@ -1855,14 +1937,20 @@ class CEOGameApp:
                     btn_color = config.COLOR_ACCENT_PRIMARY
                     btn_hover = ("#4A90E2")
 
-                btn = ctk.CTkButton(choice_frame, text=f"{i+1}. {text}", command=lambda c=choice: handle_choice(c),
+                btn = ctk.CTkButton(choice_frame, text=f"{i+1}. {text}", command=lambda ci=i: handle_choice(ci),
                                      width=500, height=40, fg_color=btn_color, hover_color=btn_hover,
                                      text_color="white", font=config.FONT_HEADER)
                 btn.pack(pady=8)
                 choice_buttons.append(btn)
 
+            if len(choices) > 1:
+                self._add_preview(choice_frame, lambda: Decision.popup(corp, event_id), wraplength=540)
+
             # Emergency close button (bottom of popup)
             def emergency_close():
+                if event_id in corp.email_system.POPUP_EVENTS:
+                    corp.record_action("popup", event_id, None)
+                    corp.email_system.resolve_popup_choice(event_id, None)
                 if popup.winfo_exists():
                     popup.destroy()
                 self.advance_button.configure(state=ctk.NORMAL)
@@ -1873,9 +1961,8 @@ class CEOGameApp:
             # Also handle window-manager close to re-enable controls
             popup.protocol("WM_DELETE_WINDOW", emergency_close)
 
-            # Remove event from POPUP_EVENTS so it doesn't trigger again
-            if event_id in corp.email_system.POPUP_EVENTS:
-                del corp.email_system.POPUP_EVENTS[event_id]
+            # On screen now: it stays registered (and cannot expire) until a choice or close resolves it
+            corp.email_system.POPUP_EVENTS.mark_shown(event_id)
 
         except Exception as e:
             print(f"Error creating crisis popup: {e}")
@@ -1912,9 +1999,10 @@ class CEOGameApp:
         qa_frame = ctk.CTkFrame(earnings_window, fg_color=config.COLOR_PANEL_BG)
         qa_frame.pack(pady=10, padx=20, fill='x', expand=True)
         
-        questions = random.sample(config.EARNINGS_QUESTIONS, 3) 
+        questions = corp.rng.events.sample(config.EARNINGS_QUESTIONS, 3) 
         current_q_index = 0
         answer_score = 0
+        answers = []  # Option index per question, for the action log
         
         question_label = ctk.CTkLabel(qa_frame, text="", font=config.FONT_HEADER, wraplength=700)
         question_label.pack(pady=10, padx=10)
@@ -1951,26 +2039,13 @@ class CEOGameApp:
         def handle_answer(option_index):
             nonlocal current_q_index, answer_score
             impact_type = questions[current_q_index]['options'][option_index][1]
-            
-            # Simple scoring logic based on impact type
-            if impact_type == "safest":
-                score_change = random.choice([0, 1])
-            elif impact_type == "tech_focused":
-                score_change = 2 if corp.technology_level > 60 else -1
-            elif impact_type == "profit_focused":
-                score_change = 2 if corp.quarterly_revenue > corp.quarterly_costs * 1.5 else -1
-            elif impact_type == "growth_focused":
-                score_change = 2 if corp.customer_base > 50 else -1
-            elif impact_type == "risky":
-                score_change = random.choice([3, -3])
-            else:
-                score_change = 0
-
-            answer_score += score_change
+            answer_score += corp.score_earnings_answer(impact_type)
+            answers.append(option_index)
             current_q_index += 1
             update_qa_display()
 
         def submit_call():
+            corp.record_action("earnings_call", answers)
             result_msg = corp.process_earnings_call(answer_score)
             messagebox.showinfo("Earnings Call Result", result_msg)
             earnings_window.destroy()
@@ -2096,19 +2171,15 @@ class CEOGameApp:
                     font=config.FONT_BODY, text_color=config.COLOR_ACCENT_NEUTRAL).pack(pady=(0, 8))
         
         def emergency_borrow():
-            if max_borrowable < amount_needed:
+            corp.record_action("emergency_borrow")
+            success, borrow_amount = corp.emergency_borrow()
+            if not success:
                 emergency_window.destroy()
-                messagebox.showerror("Credit Exhausted", 
+                messagebox.showerror("Credit Exhausted",
                     "You've exceeded your borrowing capacity.\nThe company is insolvent.\n\nGAME OVER")
                 self._check_game_over("GameOver_Debt")
                 return
-            
-            # Force borrow the minimum amount
-            borrow_amount = min(amount_needed, max_borrowable)
-            corp.cash += borrow_amount
-            corp.debt += borrow_amount
-            corp.log.append(f"EMERGENCY BORROWING: ${borrow_amount:,.0f}")
-            
+
             emergency_window.destroy()
             messagebox.showinfo("Emergency Loan Secured", 
                 f"Borrowed ${borrow_amount:,.0f} at 5% annual interest.\n\n" +
@@ -2218,6 +2289,7 @@ the ultimate business executive!"""
     def _check_game_over(self, reason):
         # ... (Game Over logic remains the same, using CTkinter dialogs)
         self.advance_button.configure(state=ctk.DISABLED)
+        self._save_action_log()
         
         # Check for victory conditions
         if reason == "Victory_Leaderboard":
@@ -2274,6 +2346,7 @@ the ultimate business executive!"""
 
         # Function to process the action
         def process_action(email_index, option_index):
+            corp.record_action("email", email_index, option_index)
             result_msg = corp.email_system.apply_action(email_index, option_index)
             messagebox.showinfo("Action Result", result_msg)
             self._update_status() # Refresh main UI metrics and email count
@@ -2322,8 +2395,9 @@ the ultimate business executive!"""
                 ctk.CTkLabel(header_row, text=f"From: {email['from']}", font=config.FONT_BODY, anchor='w', 
                            text_color=config.COLOR_ACCENT_NEUTRAL).pack(side=ctk.LEFT)
                 
-                # Subject
-                ctk.CTkLabel(e_frame, text=f"{email['subject']}", font=config.FONT_HEADER, anchor='w', 
+                # Subject (repeats of the same kind of email are folded into one)
+                repeats = f"  (x{email['count']})" if email.get('count', 1) > 1 else ""
+                ctk.CTkLabel(e_frame, text=f"{email['subject']}{repeats}", font=config.FONT_HEADER, anchor='w', 
                             text_color=config.COLOR_ACCENT_DANGER if is_urgent else config.COLOR_ACCENT_PRIMARY, 
                             justify=ctk.LEFT, wraplength=750).pack(fill='x', padx=10, pady=(4, 6))
                 
@@ -2350,6 +2424,9 @@ the ultimate business executive!"""
                     ctk.CTkButton(option_frame, text=option['text'], command=lambda ei=original_idx, oi=j: process_action(ei, oi), 
                                   fg_color=btn_color, font=config.FONT_BODY, width=600, height=36).pack(pady=4, anchor='w')
 
+                if len(email['options']) > 1:
+                    self._add_preview(option_frame, lambda ei=original_idx: Decision.email(corp, ei), wraplength=700)
+
         render_emails()
 
         ctk.CTkButton(email_window, text="Close Inbox", command=email_window.destroy, fg_color=config.COLOR_ACCENT_NEUTRAL, font=config.FONT_HEADER).pack(pady=10)
@@ -2365,6 +2442,7 @@ the ultimate business executive!"""
         
         # HR is a manual action; proceed without employee overlap check
         corp.action_points -= 1
+        corp.record_action("spend_action_point")
         self._update_status()
         
         hr_window = ctk.CTkToplevel(self.master)
@@ -2456,17 +2534,11 @@ the ultimate business executive!"""
                     if not corp.can_afford_action('HR', opt_data['signing_bonus']):
                         messagebox.showwarning("Budget Shortfall", f"HR department cannot afford this hire.")
                         return
-                    if corp.cash < opt_data['signing_bonus']:
-                        messagebox.showwarning("Insufficient Cash", "Not enough corporate cash for signing bonus.")
-                        return
                     
-                    corp.spend_from_budget('HR', opt_data['signing_bonus'])
-                    corp.cash -= opt_data['signing_bonus']
-                    emp = config.EMPLOYEE_FACTORY(opt_data['position'], opt_data['signing_bonus'], opt_data['daily_salary'], opt_data['skill'])
-                    emp.hired_day = corp.day
-                    corp.employees.append(emp)
-                    corp.log.append(f"Hired {emp.name} as {emp.position}. Signing bonus: ${opt_data['signing_bonus']/1000:.0f}K")
-                    messagebox.showinfo("Employee Hired", f"Welcome aboard {emp.name}!\n\nPosition: {emp.position}\nSkill Level: {emp.skill_level}")
+                    hire_args = (opt_data['position'], opt_data['signing_bonus'], opt_data['daily_salary'], opt_data['skill'])
+                    corp.record_action("hire_employee", *hire_args)
+                    _success, msg, emp = corp.hire_employee(*hire_args)
+                    messagebox.showinfo("Employee Hired", f"{msg}\n\nPosition: {emp.position}\nSkill Level: {emp.skill_level}")
                     self._update_status()
                     refresh_emp_list()
                 return _hire
@@ -2524,6 +2596,7 @@ the ultimate business executive!"""
                         def make_acquire(comp, idx):
                             def _acquire():
                                 # Request board approval first
+                                corp.record_action("board_approval", "acquisitions")
                                 approved, board_msg = corp.get_board_approval("acquisitions")
                                 
                                 if not approved:
@@ -2536,6 +2609,7 @@ the ultimate business executive!"""
                                 messagebox.showinfo("Board Approved", 
                                                   f"The Board has approved this acquisition!\n\n{board_msg}\n\nProceeding with acquisition attempt...")
                                 
+                                corp.record_action("attempt_acquire_company", comp.name, idx)
                                 success, msg, price = corp.attempt_acquire_company(comp.name, idx)
                                 if success:
                                     messagebox.showinfo("Success", msg)
@@ -2548,6 +2622,8 @@ the ultimate business executive!"""
                         colors = [config.COLOR_ACCENT_DANGER, config.COLOR_ACCENT_PRIMARY, config.COLOR_SUCCESS_GREEN]
                         ctk.CTkButton(card, text=offer_text, command=make_acquire(company, i), 
                                     fg_color=colors[i], font=config.FONT_BODY, height=28).pack(fill='x', padx=10, pady=2)
+
+                    self._add_preview(card, lambda name=company.name: Decision.acquisition(corp, name))
                     
                     ctk.CTkLabel(card, text="", font=config.FONT_BODY).pack(pady=(0, 4))
 
@@ -2629,14 +2705,16 @@ the ultimate business executive!"""
             try:
                 for e, var in selections.items():
                     chosen_label = var.get()
-                    if chosen_label == "No Assignment":
-                        e.set_assignment(None)
-                    else:
+                    chosen = None
+                    if chosen_label != "No Assignment":
                         # Reverse lookup
                         for key, label in action_labels.items():
                             if label == chosen_label:
-                                e.set_assignment(key)
+                                chosen = key
                                 break
+                    if chosen != e.assigned_action:
+                        corp.record_action("set_assignment", corp.employees.index(e), chosen)
+                        e.set_assignment(chosen)
                 corp.log.append("Employee assignments updated.")
                 self._update_status()
                 messagebox.showinfo("Saved", "Employee task assignments updated.")
@@ -2879,6 +2957,7 @@ the ultimate business executive!"""
         if not self._confirm_employee_overlap('launch_project'):
             return
         corp.action_points -= 1
+        corp.record_action("spend_action_point")
         self._update_status()
         
         hub_window = ctk.CTkToplevel(self.master)
@@ -2945,7 +3024,8 @@ the ultimate business executive!"""
                                 amount = int(var.get().replace(',', ''))
                                 if amount < 0: raise ValueError
                                 
-                                corp.daily_rnd_investment[track] = amount
+                                corp.record_action("set_rnd_investment", track, amount)
+                                corp.set_rnd_investment(track, amount)
                                 messagebox.showinfo("R&D Update", f"Daily investment for {track} set to ${amount:,.0f}.")
                                 update_rnd_status()
                                 self._update_status()
@@ -3058,12 +3138,10 @@ the ultimate business executive!"""
                         return
 
                     # Launch using unified system
-                    success, msg = corp.launch_project(name, investment, base_price, development_days, p_type)
+                    corp.record_action("launch_project", name, investment, base_price, development_days, p_type)
+                    success, msg = corp.launch_hub_project(name, investment, base_price, development_days, p_type)
                     
                     if success:
-                        corp.cash -= upfront_cost
-                        corp.debt += debt_amount
-                        
                         daily_cost = investment / development_days
                         messagebox.showinfo("Project Started!", 
                             f"'{name}' is now in Development!\n\n" +
@@ -3103,6 +3181,7 @@ the ultimate business executive!"""
         if not self._confirm_employee_overlap('budget'):
             return
         corp.action_points -= 1
+        corp.record_action("spend_action_point")
         self._update_status()
         
         budget_window = ctk.CTkToplevel(self.master)
@@ -3176,9 +3255,8 @@ the ultimate business executive!"""
                     return
 
                 # Apply cash movement (delta>0 consumes cash, delta<0 refunds cash)
-                corp.cash -= delta
-                corp.annual_budget.update(new_budgets)
-                corp.log.append(f"Department annual budgets reallocated. Cash {'used' if delta>0 else 'returned'}: ${abs(delta):,.0f}.")
+                corp.record_action("set_annual_budgets", new_budgets)
+                corp.set_annual_budgets(new_budgets)
                 messagebox.showinfo("Budget Update", "Annual department budgets updated and backed by cash.")
                 budget_window.destroy()
                 self._update_status()
@@ -3213,6 +3291,7 @@ the ultimate business executive!"""
         if not self._confirm_employee_overlap('budget'):
             return
         corp.action_points -= 1
+        corp.record_action("spend_action_point")
         self._update_status()
         
         debt_window = ctk.CTkToplevel(self.master)
@@ -3247,6 +3326,7 @@ the ultimate business executive!"""
             try:
                 amount = int(borrow_amount_var.get().replace(',', ''))
                 if amount <= 0: raise ValueError
+                corp.record_action("manage_debt_equity", 'Borrow', amount)
                 result = corp.manage_debt_equity('Borrow', amount)
                 messagebox.showinfo("Borrow Result", result)
                 self._update_status()
@@ -3269,6 +3349,7 @@ the ultimate business executive!"""
             try:
                 amount = int(repay_amount_var.get().replace(',', ''))
                 if amount <= 0: raise ValueError
+                corp.record_action("manage_debt_equity", 'Repay', amount)
                 result = corp.manage_debt_equity('Repay', amount)
                 messagebox.showinfo("Repay Result", result)
                 self._update_status()
@@ -3291,6 +3372,7 @@ the ultimate business executive!"""
         
         # Deduct action point
         corp.action_points -= 1
+        corp.record_action("spend_action_point")
         self._update_status()
         
         ma_window = ctk.CTkToplevel(self.master)
@@ -3316,6 +3398,7 @@ the ultimate business executive!"""
             try:
                 amount = int(acquire_amount_var.get().replace(',', ''))
                 if amount <= 0: raise ValueError
+                corp.record_action("manage_manda_actions", 'Acquire', amount, None)
                 result = corp.manage_manda_actions('Acquire', amount)
                 messagebox.showinfo("Acquisition Result", result)
                 self._update_status()
@@ -3338,6 +3421,7 @@ the ultimate business executive!"""
             try:
                 amount = int(divest_amount_var.get().replace(',', ''))
                 if amount <= 0: raise ValueError
+                corp.record_action("manage_manda_actions", 'Divest', amount, None)
                 result = corp.manage_manda_actions('Divest', amount)
                 messagebox.showinfo("Divestiture Result", result)
                 self._update_status()
@@ -3362,6 +3446,7 @@ the ultimate business executive!"""
         if not self._confirm_employee_overlap('marketing'):
             return
         corp.action_points -= 1
+        corp.record_action("spend_action_point")
         self._update_status()
         
         shift_window = ctk.CTkToplevel(self.master)
@@ -3399,6 +3484,7 @@ the ultimate business executive!"""
 
                 if cost <= 0: raise ValueError("Cost must be positive.")
 
+                corp.record_action("manage_manda_actions", 'Market_Shift', cost, segment)
                 result = corp.manage_manda_actions('Market_Shift', cost, target_segment=segment)
                 messagebox.showinfo("Market Shift Result", result)
                 self._update_status()
@@ -3424,6 +3510,7 @@ the ultimate business executive!"""
         if not self._confirm_employee_overlap('marketing'):
             return
         corp.action_points -= 1
+        corp.record_action("spend_action_point")
         self._update_status()
         
         expense_window = ctk.CTkToplevel(self.master)
@@ -3459,6 +3546,7 @@ the ultimate business executive!"""
                     messagebox.showerror("Limit Exceeded", f"This expense of ${expense_cost:,.0f} would exceed your Corporate Card limit of ${corp.corp_card_limit:,.0f}.")
                     return
                 
+                corp.record_action("use_corp_card", expense_type)
                 result = corp.use_corp_card(expense_type)
                 messagebox.showinfo("Expense Result", result)
                 expense_window.destroy()
@@ -3521,6 +3609,7 @@ the ultimate business executive!"""
                 btn_frame.pack(fill='x', padx=10, pady=8)
                 
                 def resolve(idx, act):
+                    corp.record_action("resolve_union_demand", idx, act)
                     result = corp.resolve_union_demand(idx, act)
                     messagebox.showinfo("Union Response", result)
                     union_window.destroy()
@@ -3696,33 +3785,10 @@ the ultimate business executive!"""
         ctk.CTkLabel(header_frame, text="📈 WALL STREET LEADERBOARD", 
                     font=config.FONT_TITLE, text_color=config.COLOR_TEXT).pack(pady=15)
         
-        # Get all companies and sort by stock price
-        all_companies = []
-        for comp in self.game.competitors:
-            all_companies.append({
-                'name': comp.name,
-                'stock_price': comp.stock_price,
-                'strategy': comp.strategy,
-                'is_player': False
-            })
-        
-        # Add player company
-        all_companies.append({
-            'name': self.game.corp_name or "Your Company",
-            'stock_price': self.game.stock_price,
-            'strategy': 'Player',
-            'is_player': True
-        })
-        
-        # Sort by stock price descending
-        all_companies.sort(key=lambda x: x['stock_price'], reverse=True)
-        
-        # Find player rank
-        player_rank = None
-        for i, comp in enumerate(all_companies):
-            if comp['is_player']:
-                player_rank = i + 1
-                break
+        # Top places from the leaderboard index, with the player's row always included
+        all_companies = self.game.leaderboard_standings()
+        player_rank = self.game.get_leaderboard_position()
+        listed_total = len(self.game.competitors) + 1
         
         # Stats panel
         stats_frame = ctk.CTkFrame(ws_window, fg_color=config.COLOR_PANEL_BG, corner_radius=10)
@@ -3735,7 +3801,7 @@ the ultimate business executive!"""
         ctk.CTkLabel(stats_grid, text="Your Rank:", font=config.FONT_STAT_VALUE, 
                     text_color=config.COLOR_ACCENT_PRIMARY).grid(row=0, column=0, padx=20, sticky='e')
         rank_color = config.COLOR_SUCCESS_GREEN if player_rank <= 3 else (config.COLOR_GOLD if player_rank <= 6 else config.COLOR_ACCENT_DANGER)
-        ctk.CTkLabel(stats_grid, text=f"#{player_rank} of 13", font=config.FONT_STAT_VALUE, 
+        ctk.CTkLabel(stats_grid, text=f"#{player_rank} of {listed_total}", font=config.FONT_STAT_VALUE, 
                     text_color=rank_color).grid(row=0, column=1, padx=20, sticky='w')
         
         ctk.CTkLabel(stats_grid, text="Your Stock Price:", font=config.FONT_STAT_VALUE, 
@@ -3771,8 +3837,8 @@ the ultimate business executive!"""
         scroll_frame.pack(fill='both', expand=True, padx=15, pady=(0, 10))
         
         # Display each company
-        for i, comp in enumerate(all_companies):
-            rank = i + 1
+        for comp in all_companies:
+            rank = comp['rank']
             
             # Determine card colors
             if comp['is_player']:
@@ -3828,6 +3894,8 @@ the ultimate business executive!"""
     def _on_closing(self):
         """Handle window close event - cleanup all scheduled callbacks."""
         self.is_running = False
+        self._save_action_log()
+        self.preview_service.close()
         
         # Cancel all scheduled callbacks
         for callback_id in self.scheduled_callbacks:
@@ -3845,6 +3913,50 @@ the ultimate business executive!"""
         except Exception:
             pass
 
+    def _save_action_log(self):
+        """Write this game's recorded decisions to config.REPLAY_DIR (replay with python -m replay)."""
+        log = getattr(self.game, 'action_log', None)
+        if log is None:
+            return
+        try:
+            log.save(log.default_path(), self.game)
+        except Exception as e:
+            print(f"Could not save action log: {e}")
+
+    def _add_preview(self, parent, make_decision, wraplength=600):
+        """'Preview outcomes' button for a pending decision; the simulated outcomes fill in below it as they arrive."""
+        result_label = ctk.CTkLabel(parent, text="", font=config.FONT_BODY, text_color=config.COLOR_ACCENT_NEUTRAL,
+                                    justify=ctk.LEFT, anchor='w', wraplength=wraplength)
+
+        def show(preview):
+            if not self.is_running or not result_label.winfo_exists():
+                return  # Dialog closed; the preview stays cached for today
+            lines = [] if preview.finished else [f"Simulating futures... {preview.done}/{preview.total}"]
+            for i, label in enumerate(preview.decision.labels):
+                lines.append(f"{label}:\n{preview.describe(i)}")
+            if preview.errors:
+                lines.append(f"{len(preview.errors)} simulation batch(es) failed")
+            result_label.configure(text="\n".join(lines))
+            if not preview.finished:
+                callback_id = self.master.after(300, lambda: show(preview))
+                self.scheduled_callbacks.append(callback_id)
+
+        def start():
+            try:
+                preview = self.preview_service.request(self.game, make_decision())
+            except Exception as e:
+                print(f"Preview error: {e}")
+                result_label.configure(text="Preview unavailable.")
+                result_label.pack(fill='x', pady=(2, 6))
+                return
+            preview_btn.configure(state=ctk.DISABLED)
+            result_label.pack(fill='x', pady=(2, 6))
+            show(preview)
+
+        preview_btn = ctk.CTkButton(parent, text="🔮 Preview outcomes", command=start, fg_color=config.COLOR_ACCENT_NEUTRAL,
+                                    font=config.FONT_BODY, width=180, height=28)
+        preview_btn.pack(anchor='w', pady=(4, 0))
+
     def _open_upgrades_dialog(self):
         """Open the Executive Upgrades skill tree dialog."""
         corp = self.game
@@ -3918,11 +4030,9 @@ the ultimate business executive!"""
             can_buy, _ = can_purchase(upgrade)
             if not can_buy:
                 return
-            
-            corp.executive_points -= upgrade['cost']
-            corp.purchased_upgrades.append(upgrade['id'])
-            corp.upgrade_bonuses[upgrade['bonus']] += upgrade['value']
-            corp.log.append(f"✨ UPGRADE PURCHASED: {upgrade['name']} - {upgrade['desc']}")
+            corp.record_action("purchase_upgrade", upgrade)
+            if not corp.purchase_upgrade(upgrade):
+                return
             
             messagebox.showinfo("Upgrade Purchased!", f"{upgrade['name']}\n\n{upgrade['desc']}\n\nThis bonus is PERMANENT!")
             upgrade_window.destroy()
@@ -4070,6 +4180,9 @@ class MockCorporation:
     def manage_debt_equity(self, action, amount): return f"{action} of ${amount:,.0f} executed."
     def manage_manda_actions(self, action, amount, **kwargs): return f"{action} of ${amount:,.0f} executed."
     def adjust_budget(self, new_budgets): return "Budgets adjusted."
+    action_log = None
+    def record_action(self, name, *args): pass
+    def set_rnd_investment(self, track, amount): self.daily_rnd_investment[track] = amount
     def use_corp_card(self, expense_type): 
         # Mock usage to allow the dialog to work
         self.corp_card_used += 100000 
@@ -4083,6 +4196,9 @@ class MockEmailSystem:
         self.ACTION_PROMPT = None
     def check_for_events(self): return None 
     def apply_action(self, email_index, option_index): return "Mock action executed." 
+    def resolve_popup_choice(self, event_id, choice_index=None):
+        self.POPUP_EVENTS.pop(event_id, None)
+        return True, "Mock choice executed."
 
 
 # If the code is running in a development/test environment, replace the real Corporation with the MockCorporation
@@ -4095,6 +4211,7 @@ if os.environ.get('MOCK_MODE') == 'True':
     EmailSystem = MockEmailSystem
     
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Lets a frozen build's preview workers start without reopening the app
     try:
         root = ctk.CTk()
         app = CEOGameApp(root)
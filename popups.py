@@ -0,0 +1,128 @@
+# popups.py - Registry of pending popup events for EmailSystem
+"""
+EmailSystem.POPUP_EVENTS maps an event id to its popup data (title,
+dialogue, choices). Each entry goes through a fixed lifecycle:
+
+    created   registered by the event generator, waiting to be shown
+    shown     the UI has put it on screen (mark_shown)
+    resolved  a choice was made or the popup was dismissed: removed
+    expired   never shown within config.POPUP_EXPIRY_DAYS: removed
+
+Resolving or expiring removes the entry, so nothing keeps a popup's choice
+callbacks alive after it is gone. No more than config.POPUP_MAX_PENDING
+entries are ever held; registering one more evicts the oldest.
+
+Reads like the dict it replaces: registry[event_id] = data, .get(),
+.pop(), `in`, del, len().
+"""
+from collections import OrderedDict
+
+import config
+
+CREATED, SHOWN = "created", "shown"
+
+
+class PopupRegistry:
+    """Bounded, lifecycle-tracked map of event id -> popup data."""
+
+    def __init__(self, owner=None, max_pending: int = None, expiry_days: int = None):
+        self.owner = owner  # Object with a .day attribute (the Corporation)
+        self.max_pending = max_pending or config.POPUP_MAX_PENDING
+        self.expiry_days = expiry_days or config.POPUP_EXPIRY_DAYS
+        self._entries = OrderedDict()  # event_id -> [data, state, day registered], oldest first
+        # Lifetime counters (read by the tick profiler)
+        self.created = 0
+        self.resolved = 0
+        self.expired = 0
+        self.evicted = 0
+        self.peak = 0
+
+    def _day(self):
+        return self.owner.day if self.owner is not None else 0
+
+    # --- LIFECYCLE ---
+    def __setitem__(self, event_id, data):
+        """Register (or re-register) an event as created today."""
+        if event_id in self._entries:
+            del self._entries[event_id]
+        elif len(self._entries) >= self.max_pending:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+        self._entries[event_id] = [data, CREATED, self._day()]
+        self.created += 1
+        self.peak = max(self.peak, len(self._entries))
+
+    def mark_shown(self, event_id):
+        """The UI is displaying this event; it no longer expires until resolved."""
+        entry = self._entries.get(event_id)
+        if entry is not None:
+            entry[1] = SHOWN
+
+    def state_of(self, event_id):
+        entry = self._entries.get(event_id)
+        return entry[1] if entry is not None else None
+
+    def resolve(self, event_id, default=None):
+        """Remove a handled event and return its data (default if it is not pending)."""
+        entry = self._entries.pop(event_id, None)
+        if entry is None:
+            return default
+        self.resolved += 1
+        return entry[0]
+
+    def copy(self, owner=None, copy_data=dict) -> "PopupRegistry":
+        """Independent registry for owner holding copy_data(data) of every pending popup."""
+        twin = PopupRegistry.__new__(PopupRegistry)
+        twin.__dict__.update(self.__dict__)
+        twin.owner = owner
+        twin._entries = OrderedDict((event_id, [copy_data(data), state, day])
+                                    for event_id, (data, state, day) in self._entries.items())
+        return twin
+
+    def expire(self, day: int = None) -> int:
+        """Drop events created expiry_days or more ago that were never shown. Returns how many."""
+        day = self._day() if day is None else day
+        cutoff = day - self.expiry_days
+        stale = [event_id for event_id, (_data, state, created) in self._entries.items()
+                 if state == CREATED and created <= cutoff]
+        for event_id in stale:
+            del self._entries[event_id]
+        self.expired += len(stale)
+        return len(stale)
+
+    # --- DICT-LIKE ACCESS ---
+    def pop(self, event_id, default=None):
+        return self.resolve(event_id, default)
+
+    def __delitem__(self, event_id):
+        if event_id not in self._entries:
+            raise KeyError(event_id)
+        self.resolve(event_id)
+
+    def get(self, event_id, default=None):
+        entry = self._entries.get(event_id)
+        return entry[0] if entry is not None else default
+
+    def __getitem__(self, event_id):
+        return self._entries[event_id][0]
+
+    def __contains__(self, event_id):
+        return event_id in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def keys(self):
+        return self._entries.keys()
+
+    def items(self):
+        return [(event_id, entry[0]) for event_id, entry in self._entries.items()]
+
+    def clear(self):
+        self._entries.clear()
+
+    def __repr__(self):
+        return f"PopupRegistry({len(self._entries)} pending, max_pending={self.max_pending})"
@@ -0,0 +1,362 @@
+# preview.py - Monte Carlo previews of a pending decision
+"""
+Before the player answers an email, a crisis popup or picks an acquisition
+bid, a PreviewService plays each option forward from a fork of the current
+game in a background process pool and reports, for every option, how many
+futures are still running PREVIEW_HORIZONS days ahead and the mean and
+10th/90th percentiles of key metrics across those.
+
+    service = PreviewService()
+    preview = service.request(corp, Decision.email(corp, email_index))
+    ...                                   # e.g. from a Tk after() poll
+    preview.done, preview.total           # rollouts finished so far
+    preview.survival(0, 30)               # share of futures still running at +30d
+    preview.stats(0, "cash", 30)          # (mean, p10, p90) over those, or None
+    service.close()
+
+    python -m preview --seed 7 --day 60
+
+Every option is played against the same PREVIEW_ROLLOUTS futures (rollout i
+reseeds the fork's RNG streams with the same seed whatever the option), so
+the differences between options come from the decision, not from luck.
+After the decision, rollouts answer everything with the careful batch
+policy. Results arrive a batch of rollouts at a time, and previews are
+cached per (game state, decision).
+"""
+import argparse
+import multiprocessing
+import multiprocessing.pool
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import Counter
+from functools import partial
+
+import numpy as np
+
+import config
+from batch_runner import careful_policy, new_game, play_day, safe_policy
+from replay import ACTIONS, advance_day, state_checksum
+from rng import derive_seed
+
+
+# --- DECISIONS ---
+def _acquire(corp, company_name, offer_index):
+    """An acquisition bid the way the UI makes it: board approval first, then the attempt."""
+    approved, _msg = corp.get_board_approval("acquisitions")
+    if approved:
+        corp.attempt_acquire_company(company_name, offer_index)
+
+
+# Step name -> function(corp, *args). The recorded replay actions plus the preview-only ones.
+STEPS = dict(ACTIONS, acquire=_acquire)
+
+
+class Decision:
+    """A pending choice: its cache key, option labels and the steps each option takes."""
+
+    def __init__(self, key, labels, steps):
+        self.key = key          # Hashable, stable while the choice is pending
+        self.labels = labels    # One per option
+        self.steps = steps      # Per option: [(step name, args), ...]
+
+    @classmethod
+    def email(cls, corp, email_index: int) -> "Decision":
+        email = corp.email_system.inbox[email_index]
+        options = email.get('options', [])
+        return cls(("email", email['id']), [option['text'] for option in options],
+                   [[("email", (email_index, i))] for i in range(len(options))])
+
+    @classmethod
+    def popup(cls, corp, event_id) -> "Decision":
+        choices = corp.email_system.POPUP_EVENTS[event_id].get('choices', [])
+        return cls(("popup", event_id), [text for text, _action, _risk in choices],
+                   [[("popup", (event_id, i))] for i in range(len(choices))])
+
+    @classmethod
+    def acquisition(cls, corp, company_name: str) -> "Decision":
+        """Each bid for company_name, plus not bidding at all."""
+        company = next(c for c in corp.available_companies if c.name == company_name)
+        offers = company.generate_offers()
+        labels = [f"{offer['label']} (${offer['price']:,.0f}M)" for offer in offers] + ["No bid"]
+        steps = [[("acquire", (company_name, i))] for i in range(len(offers))] + [[]]
+        return cls(("acquisition", company_name), labels, steps)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __repr__(self):
+        return f"Decision({self.key!r}, {len(self.labels)} options)"
+
+
+# --- ROLLOUTS ---
+def rollout(corp, steps, horizons, metrics) -> tuple:
+    """
+    Take one option's steps on corp and play on. Returns (values, running, outcome):
+    values[h][m] is metric m at horizons[h] days from now (frozen at the end
+    of the game if it ends first), running[h] whether the game was still going
+    then, outcome is "Running" or how the game ended.
+    """
+    for name, args in steps:
+        STEPS[name](corp, *args)
+    start = corp.day
+    outcome = "Running"
+    values = []
+    running = []
+    for horizon in horizons:
+        while outcome == "Running" and corp.day < start + horizon:
+            outcome = play_day(corp, careful_policy) or "Running"
+        values.append([float(getattr(corp, metric)) for metric in metrics])
+        running.append(outcome == "Running")
+    return values, running, outcome
+
+
+def _run_batch(blob, steps, seeds, horizons, metrics) -> tuple:
+    """Worker task: rollouts of one option, one per seed, from the pickled fork in blob."""
+    base = pickle.loads(blob)
+    values = np.empty((len(seeds), len(horizons), len(metrics)))
+    running = np.empty((len(seeds), len(horizons)), dtype=bool)
+    outcomes = []
+    for i, seed in enumerate(seeds):
+        corp = base.fork(seed)
+        values[i], running[i], outcome = rollout(corp, steps, horizons, metrics)
+        outcomes.append(outcome)
+    return values, running, outcomes
+
+
+class Preview:
+    """Rollout results for one decision, filled in as worker batches finish."""
+
+    def __init__(self, decision: Decision, corp, rollouts: int, horizons, metrics):
+        self.decision = decision
+        self.day = corp.day
+        self.rollouts = rollouts  # Per option
+        self.horizons = tuple(horizons)
+        self.metrics = tuple(metrics)
+        self.current = {metric: float(getattr(corp, metric)) for metric in self.metrics}
+        self.errors = []
+        self._lock = threading.Lock()  # Results land on the pool's result thread
+        self._values = [[] for _ in range(len(decision))]
+        self._running = [[] for _ in range(len(decision))]
+        self._outcomes = [Counter() for _ in range(len(decision))]
+        self._pending = 0
+
+    def _add(self, option_index, result):
+        values, running, outcomes = result
+        with self._lock:
+            self._values[option_index].append(values)
+            self._running[option_index].append(running)
+            self._outcomes[option_index].update(outcomes)
+            self._pending -= 1
+
+    def _fail(self, error):
+        with self._lock:
+            self.errors.append(f"{type(error).__name__}: {error}")
+            self._pending -= 1
+
+    # --- READING ---
+    @property
+    def total(self) -> int:
+        return self.rollouts * len(self.decision)
+
+    @property
+    def done(self) -> int:
+        with self._lock:
+            return sum(len(v) for batches in self._values for v in batches)
+
+    @property
+    def finished(self) -> bool:
+        with self._lock:
+            return self._pending == 0
+
+    def _results(self, option_index: int) -> tuple:
+        with self._lock:
+            values, running = list(self._values[option_index]), list(self._running[option_index])
+        if not values:
+            return np.empty((0, len(self.horizons), len(self.metrics))), np.empty((0, len(self.horizons)), dtype=bool)
+        return np.concatenate(values), np.concatenate(running)
+
+    def samples(self, option_index: int) -> np.ndarray:
+        """Finished rollouts of one option as a (rollouts, horizons, metrics) array."""
+        return self._results(option_index)[0]
+
+    def running(self, option_index: int) -> np.ndarray:
+        """(rollouts, horizons) array: whether each finished rollout of one option was still going at each horizon."""
+        return self._results(option_index)[1]
+
+    def survival(self, option_index: int, horizon: int):
+        """Share of the finished rollouts of one option still running `horizon` days out, or None before any result."""
+        running = self.running(option_index)
+        if not len(running):
+            return None
+        return float(running[:, self.horizons.index(horizon)].mean())
+
+    def stats(self, option_index: int, metric: str, horizon: int):
+        """
+        (mean, 10th percentile, 90th percentile) of metric `horizon` days out over
+        the rollouts still running then; None before any result or if none is.
+        """
+        h = self.horizons.index(horizon)
+        values, running = self._results(option_index)
+        column = values[running[:, h], h, self.metrics.index(metric)]
+        if not len(column):
+            return None
+        p10, p90 = np.percentile(column, (10, 90))
+        return float(column.mean()), float(p10), float(p90)
+
+    def outcomes(self, option_index: int) -> dict:
+        """How the finished rollouts of one option ended ("Running", "GameOver_...", ...) -> count."""
+        with self._lock:
+            return dict(self._outcomes[option_index])
+
+    def describe(self, option_index: int, metrics=("cash", "stock_price")) -> str:
+        """One line per horizon for the UI, e.g. '+30d  40/48 running | cash $1.2M ($0.9M to $1.6M) | stock ...'."""
+        running = self.running(option_index)
+        if not len(running):
+            return "Simulating..."
+        lines = []
+        for h, horizon in enumerate(self.horizons):
+            alive = int(running[:, h].sum())
+            parts = [f"{alive}/{len(running)} running"]
+            if alive:
+                for metric in metrics:
+                    mean, p10, p90 = self.stats(option_index, metric, horizon)
+                    parts.append(f"{metric.replace('_', ' ')} {_money(mean)} ({_money(p10)} to {_money(p90)})")
+            lines.append(f"+{horizon}d  " + " | ".join(parts))
+        ended = sorted((n, outcome) for outcome, n in self.outcomes(option_index).items() if outcome != "Running")
+        if ended:
+            lines.append("Ended: " + ", ".join(f"{outcome} x{n}" for n, outcome in reversed(ended)))
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"Preview({self.decision.key!r}, day {self.day}, {self.done}/{self.total} rollouts)"
+
+
+def _money(value: float) -> str:
+    if abs(value) >= 1e6:
+        return f"${value / 1e6:,.1f}M"
+    return f"${value:,.2f}"
+
+
+# --- SERVICE ---
+class PreviewService:
+    """
+    Runs previews in a pool of worker processes (created on first request).
+    With processes=0 the rollouts run inline and request() returns a
+    finished preview; with threaded=True they run on one background thread
+    of this process instead.
+    """
+
+    def __init__(self, processes=None, rollouts: int = config.PREVIEW_ROLLOUTS,
+                 horizons=config.PREVIEW_HORIZONS, metrics=config.PREVIEW_METRICS,
+                 batch: int = config.PREVIEW_BATCH, threaded: bool = False):
+        if threaded:
+            processes = 1  # Rollouts hold the GIL, so more threads would not finish sooner
+        self.processes = max(1, (os.cpu_count() or 2) - 1) if processes is None else processes
+        self.threaded = threaded
+        self.rollouts = rollouts
+        self.horizons = tuple(horizons)
+        self.metrics = tuple(metrics)
+        self.batch = batch
+        self._pool = None
+        self._cache = {}  # (state checksum, decision key) -> Preview
+
+    def _get_pool(self):
+        if self._pool is None:
+            pool_class = multiprocessing.pool.ThreadPool if self.threaded else multiprocessing.Pool
+            self._pool = pool_class(processes=self.processes)
+        return self._pool
+
+    def get(self, corp, decision: Decision):
+        """The cached preview of decision from corp's current state, or None."""
+        return self._cache.get((state_checksum(corp), decision.key))
+
+    def request(self, corp, decision: Decision) -> Preview:
+        """Preview of decision from corp's current state; started now unless one is cached for that state."""
+        checksum = state_checksum(corp)
+        key = (checksum, decision.key)
+        preview = self._cache.get(key)
+        if preview is not None:
+            return preview
+        for stale in [k for k in self._cache if k[0] != checksum]:
+            del self._cache[stale]  # Previews of any other state describe a game that is gone
+
+        preview = self._cache[key] = Preview(decision, corp, self.rollouts, self.horizons, self.metrics)
+        blob = pickle.dumps(corp.fork(), pickle.HIGHEST_PROTOCOL)
+        seeds = [derive_seed(corp.rng.seed, f"preview:{corp.day}:{i}") for i in range(self.rollouts)]
+        starts = range(0, self.rollouts, self.batch)
+        preview._pending = len(starts) * len(decision)
+        # Batches go out round-robin across options so every option's estimate sharpens together
+        for start in starts:
+            for option_index, steps in enumerate(decision.steps):
+                args = (blob, steps, seeds[start:start + self.batch], self.horizons, self.metrics)
+                if self.processes == 0:
+                    preview._add(option_index, _run_batch(*args))
+                else:
+                    self._get_pool().apply_async(_run_batch, args, callback=partial(preview._add, option_index),
+                                                 error_callback=preview._fail)
+        return preview
+
+    def clear(self):
+        """Forget every cached preview, e.g. after another game was loaded."""
+        self._cache.clear()
+
+    def close(self):
+        """Stop the workers (unfinished previews stay partial)."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+        self.clear()
+
+
+# --- CLI ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m preview",
+                                     description="Preview the options of a pending decision in a headless game.")
+    parser.add_argument("--seed", type=int, default=0, help="game seed")
+    parser.add_argument("--day", type=int, default=8, help="play (hands off) until this day first")
+    parser.add_argument("--rollouts", type=int, default=config.PREVIEW_ROLLOUTS, help="futures per option")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (0 runs inline)")
+    args = parser.parse_args(argv)
+
+    corp = new_game(seed=args.seed)
+    while corp.day < args.day - 1:
+        ended = play_day(corp, safe_policy)
+        if ended is not None:
+            print(f"The game ended on day {corp.day} ({ended}) before there was anything to preview")
+            return 1
+    advance_day(corp)  # The last day's inbox is left unanswered so there is something to preview
+    choices = [i for i, email in enumerate(corp.email_system.inbox) if len(email.get('options', [])) > 1]
+    # Coaching tips mostly just log advice, so a real decision makes the better example
+    choices.sort(key=lambda i: corp.email_system.inbox[i].get('type') == 'coaching')
+    decisions = [Decision.email(corp, i) for i in choices[:1]]
+    if corp.available_companies:
+        decisions.append(Decision.acquisition(corp, corp.available_companies[0].name))
+    if not decisions:
+        print(f"Nothing to decide on day {corp.day}")
+        return 1
+
+    service = PreviewService(processes=args.processes, rollouts=args.rollouts)
+    try:
+        for decision in decisions:
+            started = time.perf_counter()
+            preview = service.request(corp, decision)
+            while not preview.finished:
+                time.sleep(0.05)
+            print(f"\n{decision.key[0].upper()}: {decision.key[1]}  "
+                  f"({preview.done} rollouts in {time.perf_counter() - started:.2f}s)")
+            for i, label in enumerate(decision.labels):
+                print(f"  [{i}] {label}")
+                for line in preview.describe(i).splitlines():
+                    print(f"      {line}")
+            for error in preview.errors:
+                print(f"  error: {error}")
+    finally:
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+# price_history.py - Fixed-window price history with rolling statistics
+"""
+PriceHistory holds the last `window` prices in a circular array('d') and keeps
+running statistics up to date as each price arrives:
+
+    mean / variance / volatility  from a running sum and sum of squares
+    min / max                     from monotonic deques (amortized O(1))
+
+Appending costs the same whether the window is 90 days or five years.
+It reads like the list it replaces: len(), iteration oldest-first,
+history[-1], history[-30:].
+"""
+from array import array
+from collections import deque
+import math
+
+
+class PriceHistory:
+    """The last `window` values, oldest first, with O(1) min/max/mean/std."""
+
+    def __init__(self, window: int = 90, values=()):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.clear()
+        for value in values:
+            self.append(value)
+
+    def clear(self):
+        self._buf = array('d', bytes(8 * self.window))
+        self._count = 0
+        self._seq = 0  # Total values ever appended; value #seq lives at slot seq % window
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._min = deque()  # (seq, value), values increasing: front is the window minimum
+        self._max = deque()  # (seq, value), values decreasing: front is the window maximum
+
+    def append(self, value):
+        value = float(value)
+        window = self.window
+        slot = self._seq % window
+        if self._count == window:
+            old = self._buf[slot]
+            self._sum -= old
+            self._sumsq -= old * old
+        else:
+            self._count += 1
+        self._buf[slot] = value
+        self._sum += value
+        self._sumsq += value * value
+        seq = self._seq
+        self._seq += 1
+
+        low, high = self._min, self._max
+        while low and low[-1][1] >= value:
+            low.pop()
+        low.append((seq, value))
+        while high and high[-1][1] <= value:
+            high.pop()
+        high.append((seq, value))
+        oldest = self._seq - self._count
+        if low[0][0] < oldest:
+            low.popleft()
+        if high[0][0] < oldest:
+            high.popleft()
+
+        # Re-sum from the buffer once per window so add/subtract rounding never accumulates
+        if self._seq % window == 0:
+            values = self._values()
+            self._sum = math.fsum(values)
+            self._sumsq = math.fsum(v * v for v in values)
+
+    def copy(self) -> "PriceHistory":
+        twin = PriceHistory.__new__(PriceHistory)
+        twin.__dict__.update(self.__dict__)
+        twin._buf = array('d', self._buf)
+        twin._min = self._min.copy()
+        twin._max = self._max.copy()
+        return twin
+
+    def getstate(self) -> dict:
+        """Plain-data snapshot (used by save files); setstate() restores it exactly."""
+        return {'window': self.window, 'buf': self._buf.tobytes(), 'count': self._count, 'seq': self._seq,
+                'sum': self._sum, 'sumsq': self._sumsq, 'min': list(self._min), 'max': list(self._max)}
+
+    def setstate(self, state: dict):
+        self.window = state['window']
+        self._buf = array('d')
+        self._buf.frombytes(state['buf'])
+        self._count = state['count']
+        self._seq = state['seq']
+        self._sum = state['sum']
+        self._sumsq = state['sumsq']
+        self._min = deque(tuple(item) for item in state['min'])
+        self._max = deque(tuple(item) for item in state['max'])
+
+    # --- LIST-LIKE ACCESS ---
+    def _values(self):
+        start = (self._seq - self._count) % self.window
+        buf = self._buf
+        if start + self._count <= self.window:
+            return buf[start:start + self._count].tolist()
+        return buf[start:].tolist() + buf[:start + self._count - self.window].tolist()
+
+    def tolist(self) -> list:
+        return self._values()
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return iter(self._values())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._values()[key]
+        if key < 0:
+            key += self._count
+        if not 0 <= key < self._count:
+            raise IndexError("PriceHistory index out of range")
+        return self._buf[(self._seq - self._count + key) % self.window]
+
+    def __repr__(self):
+        return f"PriceHistory(window={self.window}, values={self._values()!r})"
+
+    # --- ROLLING STATISTICS ---
+    @property
+    def last(self):
+        return self[-1] if self._count else None
+
+    def min(self):
+        return self._min[0][1] if self._count else None
+
+    def max(self):
+        return self._max[0][1] if self._count else None
+
+    def mean(self):
+        return self._sum / self._count if self._count else 0.0
+
+    def variance(self):
+        """Population variance of the window."""
+        if self._count < 2:
+            return 0.0
+        mean = self._sum / self._count
+        return max(0.0, self._sumsq / self._count - mean * mean)
+
+    def std(self):
+        return math.sqrt(self.variance())
+
+    def volatility(self):
+        """Standard deviation as a fraction of the mean price (0 for an empty or flat window)."""
+        mean = self.mean()
+        return self.std() / mean if mean else 0.0
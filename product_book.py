@@ -0,0 +1,262 @@
+# product_book.py - Columnar store for large product portfolios
+"""
+Keeps the per-day numbers of every Product in NumPy columns so that
+Corporation._process_projects can tick a whole portfolio in a handful of
+vector operations instead of one Product.update_day call per product.
+
+Products stay real Product objects: binding one to a book switches it to
+BookedProduct, whose numeric attributes read and write the book's columns.
+Everything that already talks to products (the UI, launch(), retire(),
+advance()) keeps working unchanged, and small portfolios never pay for it.
+
+The vector day mirrors Product.update_day operation for operation, so the
+book and the scalar path produce the same numbers for the same game.
+"""
+from itertools import compress
+
+import numpy as np
+
+from game_core import Product
+
+# Stage codes, in lifecycle order (see Product.LIFECYCLE_STAGES)
+STAGES = ("Development", "Launch", "Growth", "Maturity", "Decline")
+STAGE_CODE = {name: code for code, name in enumerate(STAGES)}
+DEVELOPMENT, LAUNCH, GROWTH, MATURITY, DECLINE = range(len(STAGES))
+
+# Per-stage revenue multiplier and daily market-share growth, indexed by stage code
+_REVENUE_MULT = np.array([Product.LIFECYCLE_STAGES[name]["revenue_mult"] for name in STAGES], dtype=np.float64)
+_GROWTH_RATE = np.array([Product.LIFECYCLE_STAGES[name]["growth_rate"] for name in STAGES], dtype=np.float64)
+
+# Column name -> dtype. These are exactly the Product attributes update_day touches.
+COLUMNS = {
+    "lifecycle_stage": np.int8,
+    "days_in_stage": np.int64,
+    "total_days_live": np.int64,
+    "is_retired": np.bool_,
+    "development_days": np.int64,
+    "type": np.int64,
+    "base_price": np.float64,
+    "daily_cost": np.float64,
+    "quality_score": np.float64,
+    "market_share": np.float64,
+    "daily_revenue": np.float64,
+    "total_revenue": np.float64,
+    "total_costs_paid": np.float64,
+    "units_sold": np.int64,
+}
+
+
+class _Column:
+    """Data descriptor routing one Product attribute to its column in the owning book."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, product, owner=None):
+        if product is None:
+            return self
+        return product._book.cols[self.name].item(product._row)
+
+    def __set__(self, product, value):
+        product._book.cols[self.name][product._row] = value
+
+
+class _StageColumn(_Column):
+    """lifecycle_stage is stored as a stage code but still reads as the stage name."""
+
+    def __get__(self, product, owner=None):
+        if product is None:
+            return self
+        return STAGES[product._book.cols["lifecycle_stage"].item(product._row)]
+
+    def __set__(self, product, value):
+        product._book.cols["lifecycle_stage"][product._row] = STAGE_CODE[value]
+
+
+def _unbind(product):
+    """Turn a booked product back into a plain one holding its current values."""
+    state = product.materialize()
+    product.__class__ = product._plain_class
+    product.__dict__.clear()
+    product.__dict__.update(state)
+
+
+def _restore_product(cls, state):
+    product = cls.__new__(cls)
+    product.__dict__.update(state)
+    return product
+
+
+def booked_class(product_cls):
+    """BookedProduct subclass of product_cls (built once per class)."""
+    booked = product_cls.__dict__.get("_booked_class")
+    if booked is None:
+        attrs = {name: _Column(name) for name in COLUMNS}
+        attrs["lifecycle_stage"] = _StageColumn("lifecycle_stage")
+        attrs["_plain_class"] = product_cls
+
+        def materialize(self):
+            """Plain attribute dict: the product's own fields plus its current column values."""
+            state = {k: v for k, v in self.__dict__.items() if k not in ("_book", "_row")}
+            for name in COLUMNS:
+                state[name] = getattr(self, name)
+            return state
+
+        def __reduce__(self):
+            # Pickles (saves, forks) as an ordinary, unbound product
+            return _restore_product, (self._plain_class, self.materialize())
+
+        attrs["materialize"] = materialize
+        attrs["__reduce__"] = __reduce__
+        booked = type("Booked" + product_cls.__name__, (product_cls,), attrs)
+        product_cls._booked_class = booked
+    return booked
+
+
+class ProductBook:
+    """Column arrays for a portfolio, one row per product, in portfolio order."""
+
+    def __init__(self, capacity: int = 1024):
+        self.products = []
+        self.n = 0
+        self.cols = {name: np.zeros(capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+
+    def __len__(self):
+        return self.n
+
+    def __reduce__(self):
+        # Rows point back at live product objects; a copy starts empty and re-binds on its next sync
+        return ProductBook, ()
+
+    # --- BINDING ---
+    def _grow(self, needed):
+        capacity = len(self.cols["days_in_stage"])
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, col in self.cols.items():
+            grown = np.zeros(capacity, dtype=col.dtype)
+            grown[:self.n] = col[:self.n]
+            self.cols[name] = grown
+
+    def bind(self, product):
+        """Move product's numbers into a new row and route its attributes there."""
+        if "_book" in product.__dict__:
+            _unbind(product)
+        self._grow(self.n + 1)
+        row = self.n
+        state = product.__dict__
+        for name in COLUMNS:
+            value = state.pop(name)
+            self.cols[name][row] = STAGE_CODE[value] if name == "lifecycle_stage" else value
+        state["_book"] = self
+        state["_row"] = row
+        product.__class__ = booked_class(type(product))
+        self.products.append(product)
+        self.n += 1
+
+    def unbind_all(self):
+        """Give every product its numbers back as plain attributes and empty the book."""
+        for product in self.products:
+            if product.__dict__.get("_book") is self:
+                _unbind(product)
+        self.products = []
+        self.n = 0
+
+    def sync(self, projects: list):
+        """
+        Bring the book in line with the portfolio list. New products appended
+        since the last sync are bound; any other change rebuilds the book.
+        """
+        n = self.n
+        if len(projects) >= n and (n == 0 or projects[n - 1] is self.products[n - 1]):
+            for product in projects[n:]:
+                self.bind(product)
+            return
+        self.unbind_all()
+        for product in projects:
+            self.bind(product)
+
+    # --- DAILY TICK ---
+    def tick(self, customer_base, competitors_count, type_efficiency):
+        """
+        One day of Product.update_day for every row.
+        type_efficiency maps project type (1-3) to department efficiency; other types use 70.
+        Returns (total_costs, total_revenue, rows that just finished development).
+        """
+        n = self.n
+        if not n:
+            return 0, 0, []
+        c = self.cols
+        stage = c["lifecycle_stage"][:n]
+        days = c["days_in_stage"][:n]
+        active = ~c["is_retired"][:n]
+
+        c["total_days_live"][:n] += active
+        days += active
+
+        # Development: pay the daily cost
+        in_dev = active & (stage == DEVELOPMENT)
+        dev_cost = c["daily_cost"][:n] * in_dev
+        c["total_costs_paid"][:n] += dev_cost
+
+        # Market: advance the lifecycle. A product that moves resets days_in_stage to 0,
+        # so it cannot also match the next stage's test on the same day.
+        on_market = active ^ in_dev
+        for from_stage, length in ((LAUNCH, 30), (GROWTH, 90), (MATURITY, 180)):
+            moving = (stage == from_stage) & (days >= length) & on_market
+            if moving.any():
+                stage[moving] = from_stage + 1
+                days[moving] = 0
+
+        # Revenue is computed for every row and masked (multiplying by 0/1 is exact),
+        # which is cheaper than gathering the on-market rows.
+        # Efficiency bonus per type code; codes outside 1-3 clip onto the 70 entries at either end.
+        bonus_by_type = [1 + (type_efficiency.get(t, 70) - 50) / 200 for t in range(5)]
+        efficiency_bonus = np.take(bonus_by_type, c["type"][:n], mode="clip")
+
+        base_price = c["base_price"][:n]
+        share = c["market_share"][:n]
+        base_revenue = base_price * share * (customer_base / 100)
+        quality_bonus = 1 + (c["quality_score"][:n] - 50) / 100
+        competition_factor = 1 / (1 + competitors_count * 0.1)
+        revenue = base_revenue * quality_bonus * efficiency_bonus * _REVENUE_MULT.take(stage) * competition_factor
+        revenue *= on_market
+
+        np.copyto(c["daily_revenue"][:n], revenue, where=on_market)
+        c["total_revenue"][:n] += revenue
+        np.copyto(share, np.minimum(30, share * _GROWTH_RATE.take(stage)), where=on_market)
+        # int(daily_revenue / base_price), skipping unpriced products
+        per_unit = np.zeros(n)
+        np.divide(revenue, base_price, out=per_unit, where=base_price > 0)
+        c["units_sold"][:n] += per_unit.astype(np.int64)
+
+        # Running (left-to-right) sums match the scalar loop's accumulation exactly
+        cost_sum = float(np.cumsum(dev_cost)[-1])
+        revenue_sum = float(np.cumsum(revenue)[-1])
+        completed = np.flatnonzero(in_dev & (days >= c["development_days"][:n])).tolist()
+        return cost_sum, revenue_sum, completed
+
+    def launched_count(self) -> int:
+        """Rows past development (on the market or retired)."""
+        return int(np.count_nonzero(self.cols["lifecycle_stage"][:self.n] != DEVELOPMENT))
+
+    def remove_rows(self, rows):
+        """Drop the given rows (ascending) and compact the columns with a keep-mask."""
+        if not rows:
+            return
+        # Removed products take their values back before their rows are reused
+        for row in rows:
+            _unbind(self.products[row])
+        n = self.n
+        first = rows[0]  # Rows before the first removal keep their place
+        keep = np.ones(n - first, dtype=bool)
+        keep[np.asarray(rows) - first] = False
+        kept = first + int(keep.sum())
+        for col in self.cols.values():
+            col[first:kept] = col[first:n][keep]
+        self.products[first:] = compress(self.products[first:], keep.tolist())
+        for row in range(first, kept):
+            self.products[row].__dict__["_row"] = row
+        self.n = kept
@@ -0,0 +1,294 @@
+# replay.py - Record player decisions and replay a game headlessly
+"""
+An ActionLog holds everything needed to play a game again without the UI:
+the master seed, the identity the game was started with, and every player
+decision tagged with the day it was made on. Every CHECKSUM_EVERY days (and
+when the log is saved) it also notes a checksum of the company's state and
+RNG streams.
+
+    log = ActionLog.attach(corp)        # new game, before the first decision
+    ...                                 # the UI calls corp.record_action(name, *args)
+    log.save("replays/game.json", corp)
+
+    corp, _checked = replay(ActionLog.load("replays/game.json"))   # ValueError on divergence
+
+    python -m replay replays/game.json
+
+The replayer rebuilds the game from the seed, advances days the way the
+Advance Day button does and applies each decision on its day through
+ACTIONS. Every UI control that changes the game records itself; one
+that changes it without recording makes the replay fail verification at
+the first checkpoint after it.
+"""
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+
+import config
+from event_system import EmailSystem
+from game_core import Corporation
+
+FORMAT_VERSION = 1
+CHECKSUM_EVERY = 30  # Days between state checksums
+
+_CHECKSUM_FIELDS = (
+    "cash", "debt", "stock_price", "market_cap", "customer_base", "technology_level", "employee_morale",
+    "reputation", "board_confidence", "ceo_health", "quarterly_revenue", "quarterly_costs",
+)
+_FLOATS = struct.Struct(f"<{len(_CHECKSUM_FIELDS)}d")
+_COUNTS = struct.Struct("<5q")
+
+
+def state_checksum(corp) -> str:
+    """Short hex digest of the company's headline state, its head counts and every RNG stream."""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(_FLOATS.pack(*(float(getattr(corp, name)) for name in _CHECKSUM_FIELDS)))
+    inbox = corp.email_system.inbox if corp.email_system is not None else ()
+    digest.update(_COUNTS.pack(corp.day, len(corp.employees), len(corp.products), len(corp.projects), len(inbox)))
+    digest.update(repr(corp.rng.getstate()).encode("ascii"))
+    return digest.hexdigest()
+
+
+# --- RECORDING ---
+class ActionLog:
+    """Seed, identity and recorded decisions of one game, plus state checksums."""
+
+    def __init__(self, seed, difficulty="Easy", corp_name="", ceo_name="", checksum_every=CHECKSUM_EVERY):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.corp_name = corp_name
+        self.ceo_name = ceo_name
+        self.checksum_every = checksum_every
+        self.actions = []    # [day, action name, [args]] in the order they were taken
+        self.checksums = []  # [day, checksum]
+        self.final = None    # [day, checksum] when the log was saved
+
+    @classmethod
+    def attach(cls, corp, checksum_every: int = CHECKSUM_EVERY) -> "ActionLog":
+        """Start recording corp. Call on a new game, after set_identity and before any decision."""
+        log = cls(corp.rng.seed, corp.difficulty, corp.corp_name, corp.ceo_name, checksum_every)
+        log.checksums.append([corp.day, state_checksum(corp)])
+        corp.action_log = log
+        return log
+
+    def record(self, day: int, name: str, args):
+        if name not in ACTIONS:
+            raise ValueError(f"Unknown replay action '{name}'")
+        self.actions.append([day, name, list(args)])
+
+    def checkpoint(self, corp):
+        """Called by Corporation.update_day after each finished day."""
+        if corp.day % self.checksum_every == 0:
+            self.checksums.append([corp.day, state_checksum(corp)])
+
+    # --- FILES ---
+    def save(self, path: str, corp=None):
+        """Write the log as JSON; pass corp to also record its current state as the end of the game."""
+        if corp is not None:
+            self.final = [corp.day, state_checksum(corp)]
+        data = {
+            "format": FORMAT_VERSION,
+            "seed": self.seed,
+            "difficulty": self.difficulty,
+            "corp_name": self.corp_name,
+            "ceo_name": self.ceo_name,
+            "checksum_every": self.checksum_every,
+            "checksums": self.checksums,
+            "final": self.final,
+            "actions": self.actions,
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ActionLog":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported action log format {data.get('format')}")
+        log = cls(data["seed"], data["difficulty"], data["corp_name"], data["ceo_name"], data["checksum_every"])
+        log.checksums = data["checksums"]
+        log.final = data["final"]
+        log.actions = data["actions"]
+        return log
+
+    def default_path(self) -> str:
+        return os.path.join(config.REPLAY_DIR, f"game_{self.seed}.json")
+
+    def __repr__(self):
+        return f"ActionLog(seed={self.seed}, {len(self.actions)} actions)"
+
+
+# --- ACTIONS ---
+# Recorded name -> function(corp, *args) that carries the decision out the way the UI does.
+
+def _email(corp, email_index, option_index):
+    corp.email_system.apply_action(email_index, option_index)
+
+
+def _popup(corp, event_id, choice_index):
+    corp.email_system.resolve_popup_choice(event_id, choice_index)
+
+
+def _earnings_call(corp, answers):
+    """The call dialog draws its three questions when it opens, then scores the chosen answers."""
+    questions = corp.rng.events.sample(config.EARNINGS_QUESTIONS, 3)
+    score = 0
+    for question, option_index in zip(questions, answers):
+        score += corp.score_earnings_answer(question['options'][option_index][1])
+    corp.process_earnings_call(score)
+
+
+def _set_assignment(corp, employee_index, action_name):
+    corp.employees[employee_index].set_assignment(action_name)
+
+
+def _retire_product(corp, project_index):
+    corp.retire_product(corp.projects[project_index])
+
+
+def _manage_manda_actions(corp, action_type, amount, target_segment):
+    corp.manage_manda_actions(action_type, amount, target_segment=target_segment)
+
+
+def _set_coaching(corp, enabled):
+    corp.email_system.coaching_enabled = enabled
+
+
+def _set_long_timer_multiplier(corp, multiplier):
+    corp.long_timer_multiplier = multiplier
+
+
+def _spend_action_point(corp):
+    corp.action_points -= 1
+
+
+ACTIONS = {
+    "email": _email,
+    "popup": _popup,
+    "earnings_call": _earnings_call,
+    "emergency_borrow": Corporation.emergency_borrow,
+    "launch_project": Corporation.launch_hub_project,
+    "retire_product": _retire_product,
+    "hire_employee": Corporation.hire_employee,
+    "set_assignment": _set_assignment,
+    "resolve_union_demand": Corporation.resolve_union_demand,
+    "purchase_upgrade": Corporation.purchase_upgrade,
+    "set_rnd_investment": Corporation.set_rnd_investment,
+    "manage_manda_actions": _manage_manda_actions,
+    "manage_debt_equity": Corporation.manage_debt_equity,
+    "use_corp_card": Corporation.use_corp_card,
+    "board_approval": Corporation.get_board_approval,
+    "attempt_acquire_company": Corporation.attempt_acquire_company,
+    "adjust_budget": Corporation.adjust_budget,
+    "set_annual_budgets": Corporation.set_annual_budgets,
+    "spend_action_point": _spend_action_point,
+    "set_coaching": _set_coaching,
+    "set_long_timer_multiplier": _set_long_timer_multiplier,
+    "enable_developer_mode": Corporation.enable_developer_mode,
+}
+
+
+# --- REPLAYING ---
+class _Verifier:
+    """Stands in for the action log during a replay: compares checksums instead of recording them."""
+
+    def __init__(self, checksums):
+        self.expected = {day: checksum for day, checksum in checksums}
+        self.verified = 0
+
+    def verify(self, corp, expected):
+        actual = state_checksum(corp)
+        if actual != expected:
+            raise ValueError(f"Replay diverged on day {corp.day}: checksum {actual}, recorded {expected}")
+        self.verified += 1
+
+    def checkpoint(self, corp):
+        expected = self.expected.get(corp.day)
+        if expected is not None:
+            self.verify(corp, expected)
+
+    def record(self, day, name, args):
+        pass  # Replayed decisions are applied directly, never re-recorded
+
+
+def new_game(log: ActionLog) -> Corporation:
+    """The Corporation / EmailSystem pair the UI started this log's game with."""
+    corp = Corporation(seed=log.seed)
+    corp.email_system = EmailSystem(corp)
+    corp.set_identity(log.corp_name, log.ceo_name, corp.email_system, log.difficulty)
+    return corp
+
+
+def advance_day(corp) -> str:
+    """One press of Advance Day without the dialogs (mirrors modern_ui._advance_day)."""
+    trigger = corp.update_day()
+    try:
+        corp.check_unionization_threat()
+    except Exception as e:
+        print(f"Union check error (non-critical): {e}")
+    if trigger == "OK":
+        corp.check_victory_condition()
+    return trigger
+
+
+def replay(log: ActionLog, verify: bool = True) -> tuple:
+    """
+    Play log's game again. Returns (corp, checkpoints verified), corp being
+    the Corporation as it was when the log was saved. With verify, every
+    recorded checksum is compared on its day and a mismatch raises ValueError.
+    """
+    corp = new_game(log)
+    verifier = _Verifier(log.checksums if verify else ())
+    corp.action_log = verifier
+    verifier.checkpoint(corp)
+
+    for day, name, args in log.actions:
+        while corp.day < day:
+            advance_day(corp)
+        if corp.day != day:
+            raise ValueError(f"Action '{name}' is recorded for day {day} but the replay is on day {corp.day}")
+        ACTIONS[name](corp, *args)
+
+    if log.final is not None:
+        final_day, final_checksum = log.final
+        while corp.day < final_day:
+            advance_day(corp)
+        if verify:
+            verifier.verify(corp, final_checksum)
+    corp.action_log = None
+    return corp, verifier.verified
+
+
+# --- CLI ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m replay", description="Replay a recorded Apex Executive game headlessly.")
+    parser.add_argument("log", help="action log written by ActionLog.save")
+    parser.add_argument("--no-verify", action="store_true", help="skip the state checksum comparisons")
+    args = parser.parse_args(argv)
+
+    log = ActionLog.load(args.log)
+    started = time.perf_counter()
+    try:
+        corp, checkpoints = replay(log, verify=not args.no_verify)
+    except ValueError as e:
+        print(f"Replay failed: {e}")
+        return 1
+    elapsed = time.perf_counter() - started
+    print(f"Replayed {len(log.actions)} actions over {corp.day - 1} days in {elapsed:.2f}s "
+          f"({checkpoints} checkpoints verified)")
+    print(f"Day {corp.day}: cash ${corp.cash:,.0f}, stock ${corp.stock_price:,.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
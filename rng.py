@@ -0,0 +1,91 @@
+# rng.py - Per-game seeded random number generation
+"""
+Each Corporation owns one GameRNG. It is built from a single master seed and
+hands out an independent random.Random per subsystem, so an extra draw in one
+subsystem (say, a new uniform() in Product.launch) never shifts the draws seen
+by another. Two games built from the same seed replay bit-for-bit, no matter
+how many other games share the process or thread.
+"""
+import hashlib
+import random
+
+# Subsystem substreams. Add new names at the end; existing names keep their
+# streams because every stream seed depends only on (master seed, name).
+STREAMS = (
+    "market",        # revenue noise, scenarios, stock moves, analyst ratings
+    "projects",      # product launches and R&D project outcomes
+    "employees",     # hiring names, automated employee actions, union strikes
+    "events",        # emails, crises and random daily events
+    "acquisitions",  # acquisition offers and acquired-company profits
+    "competitors",   # rival stock prices and market share
+    "corporate",     # board votes and corp card boosts
+)
+
+
+def derive_seed(master_seed, name: str) -> int:
+    """Stable 64-bit seed for one substream (independent of PYTHONHASHSEED)."""
+    digest = hashlib.sha256(f"{master_seed}:{name}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+class GameRNG:
+    """A master seed plus one random.Random per subsystem (see STREAMS)."""
+
+    def __init__(self, seed=None):
+        # Without a seed, draw one from the global generator so that a caller
+        # who seeded `random` still gets a reproducible game.
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.streams = {}
+        for name in STREAMS:
+            self.streams[name] = random.Random(derive_seed(seed, name))
+
+    def __getattr__(self, name):
+        # Only reached for names that are not real attributes: rng.market, rng.events, ...
+        streams = self.__dict__.get('streams')
+        if streams is not None and name in streams:
+            return streams[name]
+        raise AttributeError(f"GameRNG has no stream '{name}'")
+
+    def stream(self, name: str) -> random.Random:
+        """Return (creating on first use) the substream called `name`."""
+        if name not in self.streams:
+            self.streams[name] = random.Random(derive_seed(self.seed, name))
+        return self.streams[name]
+
+    def spawn(self, key) -> "GameRNG":
+        """Child GameRNG for run `key` of an ensemble (e.g. the i-th game of a batch)."""
+        return GameRNG(derive_seed(self.seed, f"spawn:{key}"))
+
+    def copy(self) -> "GameRNG":
+        """Independent GameRNG whose streams continue exactly where these are."""
+        twin = GameRNG.__new__(GameRNG)
+        twin.seed = self.seed
+        twin.streams = {}
+        for name, stream in self.streams.items():
+            twin_stream = random.Random.__new__(random.Random)  # Skip the OS-entropy seeding setstate replaces anyway
+            twin_stream.setstate(stream.getstate())
+            twin.streams[name] = twin_stream
+        return twin
+
+    def reseeded(self, seed) -> "GameRNG":
+        """New GameRNG with the same streams, all started from `seed` (copy().reseed(seed) without the copying)."""
+        twin = GameRNG(seed)
+        for name in self.streams:
+            twin.stream(name)
+        return twin
+
+    def reseed(self, seed):
+        """Restart every stream (in place) as if this GameRNG had been built from `seed`."""
+        self.seed = seed
+        for name, stream in self.streams.items():
+            stream.seed(derive_seed(seed, name))
+
+    def getstate(self) -> dict:
+        return {'seed': self.seed, 'streams': {name: r.getstate() for name, r in self.streams.items()}}
+
+    def setstate(self, state: dict):
+        self.seed = state['seed']
+        for name, stream_state in state['streams'].items():
+            self.stream(name).setstate(stream_state)
@@ -0,0 +1,142 @@
+# roster.py - Employee list with running totals
+"""
+Corporation.employees is a Roster: an ordinary list of Employee objects that
+also keeps running totals (head count and skill by employee_type, total skill,
+total daily salary). The daily efficiency, morale and cost code reads those
+totals instead of walking the whole workforce several times a tick.
+
+Totals follow hires and fires through the list methods, and skill, salary and
+type changes through Employee.__setattr__, which reports to the roster
+they belong to.
+"""
+
+class Roster(list):
+    """List of employees plus totals kept up to date on every change."""
+
+    def __init__(self, employees=()):
+        super().__init__()
+        self._reset()
+        self.extend(employees)
+
+    def _reset(self):
+        self.type_counts = {}   # employee_type -> head count
+        self.type_skill = {}    # employee_type -> summed skill_level
+        self.total_skill = 0.0
+        self.total_salary = 0
+
+    def __reduce__(self):
+        # Rebuild the totals on load instead of trusting copied ones
+        return Roster, (list(self),)
+
+    # --- TOTALS ---
+    def _add(self, emp):
+        emp._roster = self
+        kind = emp.employee_type
+        self.type_counts[kind] = self.type_counts.get(kind, 0) + 1
+        self.type_skill[kind] = self.type_skill.get(kind, 0.0) + emp.skill_level
+        self.total_skill += emp.skill_level
+        self.total_salary += emp.daily_salary
+
+    def _drop(self, emp):
+        emp._roster = None
+        kind = emp.employee_type
+        self.type_counts[kind] -= 1
+        if self.type_counts[kind]:
+            self.type_skill[kind] -= emp.skill_level
+        else:
+            # Last of its kind: drop the entry so rounding leftovers can't linger
+            del self.type_counts[kind]
+            del self.type_skill[kind]
+        self.total_skill -= emp.skill_level
+        self.total_salary -= emp.daily_salary
+        if not len(self):
+            self._reset()
+
+    def changed(self, emp, name, old, new):
+        """Called by Employee when a tracked attribute changes from old to new."""
+        if name == "skill_level":
+            delta = new - old
+            self.type_skill[emp.employee_type] += delta
+            self.total_skill += delta
+        elif name == "daily_salary":
+            self.total_salary += new - old
+        else:  # employee_type (reassignment)
+            self.type_counts[old] -= 1
+            self.type_skill[old] -= emp.skill_level
+            if not self.type_counts[old]:
+                del self.type_counts[old]
+                del self.type_skill[old]
+            self.type_counts[new] = self.type_counts.get(new, 0) + 1
+            self.type_skill[new] = self.type_skill.get(new, 0.0) + emp.skill_level
+
+    def count_of(self, *types) -> int:
+        """Head count across the given employee types."""
+        return sum(self.type_counts.get(t, 0) for t in types)
+
+    def skill_of(self, employee_type) -> float:
+        """Summed skill_level of one employee type."""
+        return self.type_skill.get(employee_type, 0.0)
+
+    def rebuild(self):
+        """Recompute every total from scratch."""
+        employees = list(self)
+        list.clear(self)
+        self._reset()
+        self.extend(employees)
+
+    # --- LIST MUTATIONS ---
+    def append(self, emp):
+        super().append(emp)
+        self._add(emp)
+
+    def extend(self, employees):
+        for emp in employees:
+            self.append(emp)
+
+    def __iadd__(self, employees):
+        self.extend(employees)
+        return self
+
+    def insert(self, index, emp):
+        super().insert(index, emp)
+        self._add(emp)
+
+    def remove(self, emp):
+        super().remove(emp)
+        self._drop(emp)
+
+    def pop(self, index=-1):
+        emp = super().pop(index)
+        self._drop(emp)
+        return emp
+
+    def clear(self):
+        for emp in self:
+            emp._roster = None
+        super().clear()
+        self._reset()
+
+    def __setitem__(self, key, value):
+        old = self[key]
+        if isinstance(key, slice):
+            value = list(value)
+            super().__setitem__(key, value)
+            for emp in old:
+                self._drop(emp)
+            for emp in value:
+                self._add(emp)
+        else:
+            super().__setitem__(key, value)
+            self._drop(old)
+            self._add(value)
+
+    def __delitem__(self, key):
+        old = self[key]
+        super().__delitem__(key)
+        for emp in (old if isinstance(key, slice) else (old,)):
+            self._drop(emp)
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self.rebuild()
+        return self
@@ -0,0 +1,325 @@
+# savefile.py - Versioned save file format
+"""
+A save file is laid out as
+
+    MAGIC (8 bytes) | header length (4 bytes, big-endian) | header (JSON) | body
+
+The header is a small JSON object (format version, company, CEO, day, stock
+price, cash, ...). read_header() returns it without touching the body, so
+the load dialog can describe a save cheaply.
+
+The body is a stream of pickle frames, gzip-compressed unless the header
+says "compression": "none":
+
+    ("schema", {"version": FORMAT_VERSION, "tables": {table: [field, ...]}})
+    (section, payload)      one per entry in SECTIONS
+    ("end", None)
+
+Payloads hold plain data only (dict, list, tuple, set, str, bytes, numbers,
+None). The loader refuses anything else, so opening a save never runs code.
+Game objects (employees, products, board members, ...) are written as rows of
+attribute values, in the field order the schema frame records for their
+table. NumPy-backed state (competitors) is written as raw array bytes.
+"""
+import gzip
+import json
+import os
+import pickle
+import struct
+import time
+
+import numpy as np
+
+from companies import Company
+from event_log import EventLog, Record, format_event
+from event_system import EmailSystem
+from game_core import BoardMember, Employee, Executive, Product
+from roster import Roster
+
+MAGIC = b"APEXSAVE"
+FORMAT_VERSION = 1
+COMPRESSLEVEL = 1  # gzip level: saves are small, speed matters more than the last few percent
+_LENGTH = struct.Struct(">I")
+
+# Object tables: table name -> (class, attributes that are never written)
+TABLES = {
+    "board": (BoardMember, ()),
+    "executives": (Executive, ()),
+    "employees": (Employee, ("_roster",)),
+    "projects": (Product, ("_book", "_row")),
+    "products": (Product, ("_book", "_row")),
+    "acquired_companies": (Company, ()),
+    "available_companies": (Company, ()),
+}
+
+# Corporation attributes written by their own section (or rebuilt on load) rather than
+# as part of the plain "corp" section.
+SECTION_ATTRS = frozenset(TABLES) | {
+    "board_members", "cfo", "cto", "cmo", "rng", "log", "automation_log", "recent_changes",
+    "competitor_field", "competitors", "stock_history", "email_system",
+}
+TRANSIENT_ATTRS = frozenset((
+    "scheduler", "due_events", "fast_forward", "profiler", "journal", "action_log", "_modifiers", "_product_book",
+))
+
+SECTIONS = ("corp", "rng", "tables", "officers", "logs", "competitors", "stock_history", "inbox")
+
+
+# --- PLAIN DATA ---
+_SCALARS = (int, float, str, bool, bytes, type(None))
+
+
+def _plain(value):
+    """value as builtin-only data (NumPy scalars become Python numbers); TypeError otherwise."""
+    kind = type(value)
+    if kind in _SCALARS:
+        return value
+    if kind is list:
+        return [_plain(v) for v in value]
+    if kind is tuple:
+        return tuple(_plain(v) for v in value)
+    if kind is dict:
+        return {_plain(k): _plain(v) for k, v in value.items()}
+    if kind is set or kind is frozenset:
+        return kind(_plain(v) for v in value)
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{kind.__name__} is not plain save data")
+
+
+class _PlainUnpickler(pickle.Unpickler):
+    """Unpickler that only accepts plain data: no classes, no functions."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Save file references {module}.{name}; only plain data is allowed")
+
+
+# --- OBJECT TABLES ---
+def _object_state(obj):
+    return obj.materialize() if hasattr(obj, "materialize") else vars(obj)
+
+
+def _encode_table(objects, skip):
+    """(fields, rows, extra): attributes every object has become row columns, the rest go to extra."""
+    states = [_object_state(obj) for obj in objects]
+    fields = [k for k in states[0] if k not in skip] if states else []
+    for state in states[1:]:
+        fields = [k for k in fields if k in state]
+    rows = []
+    extra = {}
+    for i, state in enumerate(states):
+        rows.append(tuple(_plain(state[k]) for k in fields))
+        leftover = {k: _plain(v) for k, v in state.items() if k not in skip and k not in fields}
+        if leftover:
+            extra[i] = leftover
+    return fields, rows, extra
+
+
+def _decode_table(cls, fields, payload):
+    objects = []
+    extra = payload["extra"]
+    for i, row in enumerate(payload["rows"]):
+        obj = cls.__new__(cls)
+        obj.__dict__.update(zip(fields, row))
+        if i in extra:
+            obj.__dict__.update(extra[i])
+        objects.append(obj)
+    return objects
+
+
+# --- SECTIONS ---
+def _encode_logs(corp):
+    logs = {}
+    for name in ("log", "automation_log"):
+        log = getattr(corp, name)
+        records = []
+        for r in log.records:
+            try:
+                records.append((r.day, r.code, _plain(r.args)))
+            except TypeError:
+                records.append((r.day, "TEXT", (format_event(r.code, r.args, r.day),)))
+        logs[name] = {"maxlen": log.maxlen, "records": records}
+    logs["recent_changes"] = _plain(list(corp.recent_changes))
+    return logs
+
+
+def _encode_inbox(email_system):
+    if email_system is None:
+        return None
+    emails = []
+    for email in email_system.inbox:
+        options = []
+        for option in email.get("options", []):
+            impact = option.get("impact")
+            if getattr(impact, "__self__", None) is not email_system:
+                break  # Closure-backed (coaching) emails are regenerated, not saved
+            options.append((option["text"], impact.__name__))
+        else:
+            fields = {k: _plain(v) for k, v in email.items() if k != "options"}
+            emails.append((fields, options))
+    return {"coaching_enabled": email_system.coaching_enabled, "emails": emails}
+
+
+def _encode(corp):
+    """Schema frame plus section payloads for corp."""
+    plain = {}
+    for name, value in vars(corp).items():
+        if name in SECTION_ATTRS or name in TRANSIENT_ATTRS:
+            continue
+        try:
+            plain[name] = _plain(value)
+        except TypeError as e:
+            # A save must hold the whole game: new state is plain data, a section or listed in TRANSIENT_ATTRS
+            raise TypeError(f"Cannot save attribute '{name}' ({type(value).__name__}): {e}") from e
+
+    sources = {"board": corp.board_members}
+    schema_tables = {}
+    tables = {}
+    for table, (_cls, skip) in TABLES.items():
+        fields, rows, extra = _encode_table(sources.get(table, getattr(corp, table, [])), skip)
+        schema_tables[table] = fields
+        tables[table] = {"rows": rows, "extra": extra}
+
+    # C-suite roles point into the executives table
+    officers = {}
+    for role in ("cfo", "cto", "cmo"):
+        executive = getattr(corp, role)
+        if executive is not None and executive in corp.executives:
+            officers[role] = corp.executives.index(executive)
+    payloads = {
+        "corp": plain,
+        "rng": _plain(corp.rng.getstate()),
+        "tables": tables,
+        "officers": officers,
+        "logs": _encode_logs(corp),
+        "competitors": corp.competitor_field.getstate(),
+        "stock_history": corp.stock_history.getstate(),
+        "inbox": _encode_inbox(corp.email_system),
+    }
+    return {"version": FORMAT_VERSION, "tables": schema_tables}, payloads
+
+
+def _apply(corp, schema, sections):
+    """Restore corp from decoded sections."""
+    for name, value in sections.get("corp", {}).items():
+        setattr(corp, name, value)
+    if "rng" in sections:
+        corp.rng.setstate(sections["rng"])
+
+    tables = sections.get("tables", {})
+    loaded = {}
+    for table, (cls, _skip) in TABLES.items():
+        if table in tables:
+            loaded[table] = _decode_table(cls, schema["tables"][table], tables[table])
+    corp.board_members = loaded.get("board", corp.board_members)
+    corp.employees = Roster(loaded.get("employees", ()))
+    for table in ("executives", "projects", "products", "acquired_companies", "available_companies"):
+        setattr(corp, table, loaded.get(table, []))
+    corp.cfo = corp.cto = corp.cmo = None
+    for role, index in sections.get("officers", {}).items():
+        setattr(corp, role, corp.executives[index])
+
+    logs = sections.get("logs")
+    if logs:
+        for name in ("log", "automation_log"):
+            log = EventLog(maxlen=logs[name]["maxlen"], owner=corp)
+            log.records.extend(Record(*r) for r in logs[name]["records"])
+            setattr(corp, name, log)
+        corp.recent_changes.clear()
+        corp.recent_changes.extend(logs["recent_changes"])
+
+    if "competitors" in sections:
+        corp.competitor_field.setstate(sections["competitors"])
+        corp.set_competitor_field(corp.competitor_field)
+    if "stock_history" in sections:
+        corp.stock_history.setstate(sections["stock_history"])
+
+    # A loaded game gets a fresh email system holding the saved inbox
+    email_system = EmailSystem(corp)
+    email_system.inbox.clear()
+    inbox = sections.get("inbox")
+    if inbox:
+        email_system.coaching_enabled = inbox["coaching_enabled"]
+        for fields, options in inbox["emails"]:
+            email = dict(fields)
+            email["options"] = [{'text': text, 'impact': getattr(email_system, action)} for text, action in options]
+            added = email_system.inbox.add(email)
+            if added is not None:
+                added["day"] = fields.get("day", corp.day)
+    corp.email_system = email_system
+
+    corp._product_book = None
+    corp._modifiers = None
+    corp.action_log = None  # A recording of the replaced game does not replay this one
+    corp._init_schedule()
+
+
+# --- FILES ---
+def _header(corp, compress):
+    return {
+        "format": FORMAT_VERSION,
+        "compression": "gzip" if compress else "none",
+        "corp_name": corp.corp_name,
+        "ceo_name": corp.ceo_name,
+        "difficulty": corp.difficulty,
+        "day": corp.day,
+        "year": corp.year,
+        "quarter": corp.quarter,
+        "stock_price": round(float(corp.stock_price), 2),
+        "cash": float(corp.cash),
+        "saved_at": time.time(),
+    }
+
+
+def write_save(corp, path: str, compress: bool = True):
+    """Write corp to path (via a temporary file, so a failed save never clobbers an old one)."""
+    schema, payloads = _encode(corp)
+    header = json.dumps(_header(corp, compress)).encode("utf-8")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_LENGTH.pack(len(header)))
+        f.write(header)
+        stream = gzip.GzipFile(fileobj=f, mode="wb", compresslevel=COMPRESSLEVEL, mtime=0) if compress else f
+        pickler = pickle.Pickler(stream, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.dump(("schema", schema))
+        for name in SECTIONS:
+            pickler.dump((name, payloads[name]))
+        pickler.dump(("end", None))
+        if compress:
+            stream.close()
+    os.replace(tmp_path, path)
+
+
+def _read_header(f) -> dict:
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not an Apex Executive save file")
+    (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+    return json.loads(f.read(length).decode("utf-8"))
+
+
+def read_header(path: str) -> dict:
+    """The save's header (company, day, stock price, ...) without decoding the body."""
+    with open(path, "rb") as f:
+        return _read_header(f)
+
+
+def load_save(corp, path: str) -> dict:
+    """Restore a save into corp. Returns the save's header."""
+    with open(path, "rb") as f:
+        header = _read_header(f)
+        if header.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported save format {header.get('format')} (expected {FORMAT_VERSION})")
+        stream = gzip.GzipFile(fileobj=f, mode="rb") if header.get("compression") == "gzip" else f
+        unpickler = _PlainUnpickler(stream)
+        kind, schema = unpickler.load()
+        if kind != "schema":
+            raise ValueError("Save file body does not start with a schema")
+        sections = {}
+        while True:
+            name, payload = unpickler.load()
+            if name == "end":
+                break
+            sections[name] = payload  # Unknown sections are kept but ignored
+    _apply(corp, schema, sections)
+    return header
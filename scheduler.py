@@ -0,0 +1,87 @@
+# scheduler.py - Day-keyed event scheduler
+"""
+Subsystems register future work by game day instead of polling every tick
+(`day % 90 == 0`, countdowns, "has it been 30 days yet?").
+
+    scheduler.schedule(day, "union_check")             # one-shot
+    scheduler.schedule(90, "quarter_end", every=90)    # recurring
+    for kind, payload in scheduler.pop_due(corp.day): ...
+
+One-shot events fire on their day or, if that day was skipped (a loaded save
+jumping ahead), on the first pop after it. Recurring events mirror the
+`day % period` gates they replace: they only fire on their exact day, and a
+skipped occurrence is dropped rather than fired late.
+"""
+import heapq
+
+
+class Scheduler:
+    """Min-heap of (day, seq, kind, payload, every) entries."""
+
+    def __init__(self):
+        self._heap = []
+        self._seq = 0  # Tie-breaker: same-day events pop in the order they were scheduled
+        self._cancelled = {}  # kind -> seq; entries of that kind scheduled at or before it are dead
+
+    def __len__(self):
+        return len(self._heap)
+
+    def schedule(self, day: int, kind: str, payload=None, every: int = None):
+        """Register `kind` for `day` (and every `every` days after it, if given)."""
+        self._seq += 1
+        heapq.heappush(self._heap, (day, self._seq, kind, payload, every))
+
+    def cancel(self, kind: str):
+        """Drop every pending event of this kind (lazily, when it reaches the top of the heap)."""
+        self._cancelled[kind] = self._seq
+
+    def reschedule(self, day: int, kind: str, payload=None, every: int = None):
+        """Replace any pending `kind` events with a single new one."""
+        self.cancel(kind)
+        self.schedule(day, kind, payload, every)
+
+    def clear(self):
+        self._heap.clear()
+        self._cancelled.clear()
+
+    def copy(self) -> "Scheduler":
+        twin = Scheduler.__new__(Scheduler)
+        twin._heap = self._heap.copy()  # Entries are tuples; the heap order carries over as is
+        twin._seq = self._seq
+        twin._cancelled = self._cancelled.copy()
+        return twin
+
+    def _is_live(self, seq, kind):
+        return seq > self._cancelled.get(kind, 0)
+
+    def pop_due(self, day: int) -> list:
+        """Remove and return [(kind, payload), ...] for everything due on or before `day`."""
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= day:
+            event_day, seq, kind, payload, every = heapq.heappop(heap)
+            if not self._is_live(seq, kind):
+                continue
+            if every:
+                if event_day == day:
+                    due.append((kind, payload))
+                # Next occurrence strictly after today, keeping the original phase
+                next_day = event_day + every * ((day - event_day) // every + 1)
+                self.schedule(next_day, kind, payload, every)
+            else:
+                due.append((kind, payload))
+        return due
+
+    def next_day(self, *kinds):
+        """Earliest pending day for any of `kinds` (any kind if none given), or None."""
+        best = None
+        for event_day, seq, kind, _payload, _every in self._heap:
+            if (not kinds or kind in kinds) and self._is_live(seq, kind):
+                if best is None or event_day < best:
+                    best = event_day
+        return best
+
+    def pending(self):
+        """Live (day, kind) pairs in day order, for inspection and debugging."""
+        return [(event_day, kind) for event_day, seq, kind, _p, _e in sorted(self._heap)
+                if self._is_live(seq, kind)]
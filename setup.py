@@ -5,7 +5,7 @@ from setuptools import setup
 
 APP = ['modern_ui.py']
 DATA_FILES = [
-    ('', ['config.py', 'game_core.py', 'event_system.py', 'companies.py']),
+    ('', ['config.py', 'game_core.py', 'event_system.py', 'companies.py', 'event_catalog.json']),
     ('assets', ['assets/app_icon.png', 'assets/README.txt']),
 ]
 
@@ -14,6 +14,7 @@ a = Analysis(
         ('game_core.py', '.'),
         ('event_system.py', '.'),
         ('companies.py', '.'),
+        ('event_catalog.json', '.'),
         ('assets/app_icon.png', 'assets'),
         ('assets/README.txt', 'assets'),
     ],